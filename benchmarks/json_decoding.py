@@ -0,0 +1,102 @@
+"""Time decoding and parsing realistic API pages with each installed JSON backend.
+
+Payloads mimic an 80-photo `search_photos` page and an 80-item mixed
+`get_collection_media` page. With msgspec installed, decoding straight into models
+(`decode_models=True`) is timed too; mixed collection media is not decoded that way.
+
+    PYTHONPATH=. python benchmarks/json_decoding.py [repeat]
+"""
+
+import sys
+import json
+import timeit
+
+from pypexel.jsonlib import JSON_BACKENDS, json_decoder
+from pypexel.schema import msgspec, decode_to_models
+from pypexel.utils import parse_photo, parse_collection_media
+
+
+def photo(i: int) -> dict:
+    base = f"https://images.pexels.com/photos/{i}/pexels-photo-{i}.jpeg"
+    return {
+        "id": i,
+        "width": 4000,
+        "height": 6000,
+        "url": f"https://www.pexels.com/photo/a-long-descriptive-slug-for-photo-{i}/",
+        "photographer": "Photographer Name",
+        "photographer_url": "https://www.pexels.com/@photographer-name",
+        "photographer_id": 1000 + i % 50,
+        "avg_color": "#7E7E7E",
+        "src": {
+            "original": base,
+            "large2x": f"{base}?auto=compress&cs=tinysrgb&dpr=2&h=650&w=940",
+            "large": f"{base}?auto=compress&cs=tinysrgb&h=650&w=940",
+            "medium": f"{base}?auto=compress&cs=tinysrgb&h=350",
+            "small": f"{base}?auto=compress&cs=tinysrgb&h=130",
+            "portrait": f"{base}?auto=compress&cs=tinysrgb&fit=crop&h=1200&w=800",
+            "landscape": f"{base}?auto=compress&cs=tinysrgb&fit=crop&h=627&w=1200",
+            "tiny": f"{base}?auto=compress&cs=tinysrgb&dpr=1&fit=crop&h=200&w=280",
+        },
+        "liked": False,
+        "alt": "A photo of mountains reflected in a calm lake at sunrise",
+        "type": "Photo",
+    }
+
+
+def video(i: int) -> dict:
+    return {
+        "id": i,
+        "width": 3840,
+        "height": 2160,
+        "url": f"https://www.pexels.com/video/a-long-descriptive-slug-for-video-{i}/",
+        "image": f"https://images.pexels.com/videos/{i}/preview.jpeg",
+        "duration": 20,
+        "user": {"id": 2000 + i, "name": "Videographer", "url": "https://www.pexels.com/@videographer"},
+        "video_files": [
+            {"id": i * 10 + n, "quality": quality, "file_type": "video/mp4", "width": width, "height": height,
+             "fps": 25, "link": f"https://videos.pexels.com/video-files/{i}/{i}-{quality}_{width}_{height}_25fps.mp4"}
+            for n, (quality, width, height) in enumerate([("sd", 640, 360), ("hd", 1280, 720), ("hd", 1920, 1080), ("uhd", 3840, 2160)])
+        ],
+        "video_pictures": [{"id": i * 100 + n, "picture": f"https://images.pexels.com/videos/{i}/pictures/preview-{n}.jpg", "nr": n} for n in range(15)],
+        "type": "Video",
+    }
+
+
+PAYLOADS = {
+    "search_photos": (
+        "photos",
+        json.dumps({"page": 1, "per_page": 80, "total_results": 8000, "photos": [photo(i) for i in range(80)]}).encode(),
+        lambda data: [parse_photo(p) for p in data["photos"]],
+    ),
+    "get_collection_media": (
+        None,
+        json.dumps({"id": "abc", "page": 1, "per_page": 80, "total_results": 80, "media": [video(i) if i % 4 == 0 else photo(i) for i in range(80)]}).encode(),
+        parse_collection_media,
+    ),
+}
+
+
+def main(repeat: int = 200) -> None:
+    for payload_name, (shape, body, parse) in PAYLOADS.items():
+        timings = {}
+        for name in JSON_BACKENDS:
+            try:
+                _, loads = json_decoder(name)
+            except ImportError:
+                continue
+            decode = min(timeit.repeat(lambda: loads(body), number=repeat, repeat=3)) / repeat
+            total = min(timeit.repeat(lambda: parse(loads(body)), number=repeat, repeat=3)) / repeat
+            timings[name] = (decode, total)
+
+        if msgspec is not None and shape is not None:
+            direct = min(timeit.repeat(lambda: decode_to_models(body, shape, json.loads), number=repeat, repeat=3)) / repeat
+            timings["models"] = (direct, direct)
+
+        print(f"{payload_name} ({len(body) / 1024:.0f} KiB)")
+        stdlib = timings["json"][1]
+        for name, (decode, total) in timings.items():
+            print(f"  {name:>8}: decode {decode * 1e6:7.1f} us, decode + parse {total * 1e6:7.1f} us ({stdlib / total:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
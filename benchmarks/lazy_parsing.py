@@ -0,0 +1,59 @@
+"""Time parsing an 80-item video page eagerly and lazily.
+
+The lazy run reads `id` and one file link from each video, as a typical consumer does.
+
+    PYTHONPATH=. python benchmarks/lazy_parsing.py [pages]
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from pypexel.utils import parse_video
+
+
+def sample(i: int) -> dict:
+    return {
+        "id": i,
+        "width": 3840,
+        "height": 2160,
+        "url": f"https://www.pexels.com/video/{i}/",
+        "image": f"https://images.pexels.com/videos/{i}/preview.jpeg",
+        "duration": 20,
+        "user": {"id": 1000 + i, "name": "Videographer", "url": "https://www.pexels.com/@videographer"},
+        "video_files": [
+            {"id": i * 10 + n, "quality": quality, "file_type": "video/mp4", "width": width, "height": height,
+             "fps": 25, "link": f"https://videos.pexels.com/{i}/{n}.mp4", "size": width * height}
+            for n, (quality, width, height) in enumerate([
+                ("sd", 640, 360), ("sd", 960, 540), ("hd", 1280, 720),
+                ("hd", 1920, 1080), ("uhd", 2560, 1440), ("uhd", 3840, 2160),
+            ])
+        ],
+        "video_pictures": [{"id": i * 100 + n, "picture": f"https://images.pexels.com/videos/{i}/pictures/{n}.jpg", "nr": n} for n in range(15)],
+    }
+
+
+def consume(videos) -> None:
+    for video in videos:
+        video.id
+        video.video_files[0].link
+
+
+def main(pages: int = 500) -> None:
+    page = [sample(i) for i in range(80)]
+
+    for name, lazy in (("eager", False), ("lazy", True)):
+        run = lambda: consume([parse_video(item, lazy) for item in page])
+        seconds = min(timeit.repeat(run, number=pages, repeat=3)) / pages
+
+        tracemalloc.start()
+        videos = [parse_video(item, lazy) for item in page]
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del videos
+
+        print(f"{name:>5}: {seconds * 1e6:8.1f} us/page, {allocated / 1024:6.1f} KiB/page")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
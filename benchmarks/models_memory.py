@@ -0,0 +1,72 @@
+"""Measure the memory held by parsed `Photo` objects.
+
+Compares the slotted models in `pypexel.models` with equivalent plain dataclasses
+that keep a per-instance `__dict__`, and with a columnar `PhotoTable`.
+
+    PYTHONPATH=. python benchmarks/models_memory.py [count]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import make_dataclass, fields
+
+from pypexel.models import Photo, PhotoSRC
+from pypexel.table import PhotoTable
+from pypexel.utils import parse_photo
+
+
+PlainPhotoSRC = make_dataclass("PlainPhotoSRC", [(f.name, f.type) for f in fields(PhotoSRC)])
+PlainPhoto = make_dataclass("PlainPhoto", [(f.name, f.type) for f in fields(Photo)])
+
+
+def rebuild(photo: Photo, photo_cls, src_cls):
+    """Copy a photo into `photo_cls`, sharing its field values"""
+
+    values = {f.name: getattr(photo, f.name) for f in fields(Photo)}
+    values["src"] = src_cls(**{f.name: getattr(photo.src, f.name) for f in fields(PhotoSRC)})
+    return photo_cls(**values)
+
+
+def sample(i: int) -> dict:
+    base = f"https://images.pexels.com/photos/{i}/pexels-photo-{i}.jpeg"
+    return {
+        "id": i,
+        "width": 4000,
+        "height": 6000,
+        "url": f"https://www.pexels.com/photo/{i}/",
+        "photographer": "Photographer",
+        "photographer_url": "https://www.pexels.com/@photographer",
+        "photographer_id": 1000 + i % 50,
+        "avg_color": "#7E7E7E",
+        "src": {name: f"{base}?size={name}" for name in ("original", "large2x", "large", "medium", "small", "portrait", "landscape", "tiny")},
+        "alt": "",
+    }
+
+
+def measure(build, photos) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build(photos)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return used
+
+
+def main(count: int = 100_000) -> None:
+    # parse once up front so both variants share the same field values and only the
+    # object overhead is measured
+    photos = [parse_photo(sample(i)) for i in range(count)]
+
+    slotted = measure(lambda photos: [rebuild(p, Photo, PhotoSRC) for p in photos], photos)
+    plain = measure(lambda photos: [rebuild(p, PlainPhoto, PlainPhotoSRC) for p in photos], photos)
+    table = measure(PhotoTable, photos)
+
+    print(f"{count} photos")
+    print(f"  __dict__ dataclasses: {plain / count:7.1f} bytes/photo")
+    print(f"  slotted models:       {slotted / count:7.1f} bytes/photo ({1 - slotted / plain:.0%} smaller)")
+    print(f"  PhotoTable:           {table / count:7.1f} bytes/photo ({1 - table / plain:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -5,7 +5,17 @@ A comprehensive, easy-to-use library for accessing Pexels' vast collection
 of royalty-free photos and videos through their API.
 """
 
-from .pypexel import Pexels, PexelsAPIError
+from .pypexel import Pexels
+from .exceptions import PexelsAPIError, PexelsRateLimitError, PexelsConnectionError
+from .async_pypexel import AsyncPexels
+from .cache import MemoryCache, SQLiteCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .manager import DownloadManager
+from .store import DownloadStore
+from .utils import LazyPhoto, LazyVideo
+from .table import PhotoTable, VideoTable
+from .export import MetadataExporter
 
 
 __version__ = "0.1.0"
@@ -14,7 +24,24 @@ __email__ = "jamcamcode@gmail.com"
 __license__ = "MIT"
 
 # Make main classes available at package level
-__all__ = ["Pexels", "PexelsAPIError"]
+__all__ = [
+    "Pexels",
+    "AsyncPexels",
+    "PexelsAPIError",
+    "PexelsRateLimitError",
+    "PexelsConnectionError",
+    "MemoryCache",
+    "SQLiteCache",
+    "RateLimiter",
+    "RetryPolicy",
+    "DownloadManager",
+    "DownloadStore",
+    "LazyPhoto",
+    "LazyVideo",
+    "PhotoTable",
+    "VideoTable",
+    "MetadataExporter"
+]
 
 # Package metadata
 __title__ = "pypexel"
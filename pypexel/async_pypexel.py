@@ -0,0 +1,1144 @@
+import os
+import time
+import asyncio
+import weakref
+from collections import deque
+from functools import partial
+from urllib.parse import urljoin
+from typing import Optional, Dict, Any, Union, Callable, Awaitable, AsyncIterator, Iterable, Mapping, Tuple, TypeVar, BinaryIO
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the `async` extra
+    httpx = None
+
+from .cache import BaseCache, MemoryCache, CacheEntry, make_cache_key, response_validators
+from .download import DEFAULT_CHUNK_SIZE, PART_SUFFIX, CHECKPOINT_SUFFIX, Checkpoint, resume_request, open_part, write_chunk, rewinder
+from .models import Photo, Video, Collection, BatchResult
+from .exceptions import PexelsAPIError, PexelsConnectionError, http_error
+from .pypexel import Pexels, select_video_file
+from .ratelimit import RateLimiter, RateLimitState, parse_rate_limit_headers
+from .retry import RetryPolicy
+from .store import DownloadStore
+from .jsonlib import json_decoder, decode_response
+from .schema import msgspec, decode_to_models, parse_models
+from .table import PhotoTable, VideoTable, media_tables
+from .singleflight import AsyncSingleFlight
+from .renditions import photo_url, select_photo_size, select_video_rendition, url_extension
+from .utils import (
+    parse_photo,
+    parse_video,
+    parse_collection,
+    parse_collection_media,
+    validate_query,
+    validate_pagination,
+    validate_media_type
+)
+from .pagination import (
+    result_key,
+    page_items,
+    parse_item,
+    has_next_page,
+    last_page,
+    validate_max_items,
+    validate_prefetch
+)
+
+T = TypeVar("T")
+
+
+async def to_thread(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking call in the default executor, like `asyncio.to_thread` (Python 3.9+)"""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args))
+
+
+class AsyncPexels:
+    """An asyncio wrapper for the Pexels API, mirroring every method of `Pexels`.
+
+    Requires the optional `httpx` dependency (`pip install pypexel[async]`).
+    """
+
+    BASE_URL = Pexels.BASE_URL
+    VIDEO_BASE_URL = Pexels.VIDEO_BASE_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional["httpx.AsyncClient"] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float = 30,
+        cache: Optional[BaseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        store: Optional[DownloadStore] = None,
+        coalesce: bool = True,
+        lazy: bool = False,
+        json_backend: Optional[str] = None,
+        decode_models: bool = False
+    ):
+        """Create an async Pexels client.
+
+        Args:
+            api_key (str, optional): Pexels API key. Defaults to the `PEXELS_API_KEY` environment variable
+            client (httpx.AsyncClient, optional): Client to use instead of creating one. It is not closed by `aclose()`
+            max_connections (int, optional): Maximum concurrent connections (default: `100`)
+            max_keepalive_connections (int, optional): Maximum idle connections kept alive (default: `20`)
+            timeout (float, optional): Request timeout in seconds (default: `30`)
+            cache (BaseCache, optional): Response cache for API calls (default: no caching). Caches other than `MemoryCache` are
+                called in the default executor, keeping their disk I/O off the event loop
+            rate_limiter (RateLimiter, optional): Scheduler pacing API calls to the quota reported by the API (default: no pacing)
+            retry (RetryPolicy, optional): Retry policy for transient failures of API calls and downloads (default: no retries)
+            store (DownloadStore, optional): Content-addressed store reusing previously downloaded files (default: no store)
+            coalesce (bool, optional): Share one in-flight request between concurrent identical API calls (default: `True`).
+                Coalesced callers receive the same response object, so treat responses as read-only
+            lazy (bool, optional): Return `LazyPhoto`/`LazyVideo` objects for `as_objects=True`, parsing nested fields on first access (default: `False`)
+            json_backend (str, optional): JSON decoder for responses: `orjson`, `msgspec`, `ujson` or `json` (default: the fastest one installed)
+            decode_models (bool, optional): Decode `as_objects` results straight from the response bytes into models with msgspec,
+                skipping the intermediate dicts (default: `False`). Applies to calls made without a cache or `lazy`
+
+        Raises:
+            ImportError: If httpx, the requested `json_backend` or msgspec for `decode_models` is not installed
+            ValueError: If no API key is available or `json_backend` is unknown
+        """
+        if httpx is None:
+            raise ImportError("AsyncPexels requires httpx. Install it with `pip install pypexel[async]`.")
+
+        self.api_key = api_key or os.getenv("PEXELS_API_KEY")
+        if not self.api_key:
+            raise ValueError("API key is required. Provide it directly or set PEXELS_API_KEY environment variable.")
+
+        self.headers = {
+            "Authorization": self.api_key,
+            "User-Agent": "pypexel/0.1.1"
+        }
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.store = store
+        self.lazy = lazy
+        self.json_backend, self._loads = json_decoder(json_backend)
+        if decode_models and msgspec is None:
+            raise ImportError("decode_models requires msgspec. Install it with `pip install msgspec`.")
+        self.decode_models = decode_models
+        self._flights = AsyncSingleFlight() if coalesce else None
+        # background refreshes of stale cache entries, see `BaseCache.stale_while_revalidate`
+        self._refreshing: Dict[str, "asyncio.Future"] = {}
+        # per-key locks serializing downloads of the same rendition through the store
+        self._download_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        # latest `X-Ratelimit-*` values reported by the API
+        self.rate_limit: Optional[RateLimitState] = None
+
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            timeout=timeout
+        )
+
+
+    async def aclose(self) -> None:
+        """Close the underlying client, release pooled connections and cancel background cache refreshes.
+
+        Clients passed in by the caller are left open.
+        """
+        for task in list(self._refreshing.values()):
+            task.cancel()
+
+        if self._owns_client:
+            await self.client.aclose()
+
+
+    async def __aenter__(self) -> "AsyncPexels":
+        return self
+
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+
+    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None, base_url: Optional[str] = None) -> Dict[str, Any]:
+        """Make a request to the Pexels API.
+
+        Args:
+            endpoint (str): The API endpoint
+            params (Optional[Dict[str, Any]], optional): Query parameters
+            base_url (Optional[str], optional): Base URL to use. Defaults to BASE_URL
+
+        Returns:
+            Dict[str, Any]: JSON response from the API
+
+        Raises:
+            PexelsAPIError: If the API request fails
+        """
+        url = urljoin(base_url or self.BASE_URL, endpoint.lstrip('/'))
+
+        # remove `None` values from params
+        if params:
+            params = { k: v for k, v in params.items() if v is not None }
+
+        key = make_cache_key(url, params)
+        entry = None
+        if self.cache is not None:
+            entry = await self._cache_call(self.cache.get_entry, key)
+            if entry is not None and entry.fresh:
+                return entry.value
+
+            if entry is not None and self.cache.can_serve_stale(entry):
+                self.cache.stats.stale_hits += 1
+                self._refresh_in_background(key, partial(self._fetch, key, url, params, endpoint, entry))
+                return entry.value
+
+        try:
+            return await self._fetch(key, url, params, endpoint, entry)
+        except PexelsAPIError:
+            if entry is not None and self.cache.can_serve_on_error(entry):
+                self.cache.stats.stale_hits += 1
+                return entry.value
+            raise
+
+
+    async def _fetch(
+        self,
+        key: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        endpoint: str,
+        entry: Optional[CacheEntry]
+    ) -> Dict[str, Any]:
+        """Fetch a response, sharing the call with concurrent identical requests, and cache it"""
+
+        async def fetch() -> Dict[str, Any]:
+            # an expired entry with validators is revalidated with a conditional GET
+            conditional = entry.conditional_headers() if entry is not None else None
+            data, headers = await self._with_retries(lambda timeout: self._send(url, params, timeout, conditional))
+
+            if self.cache is None:
+                return data
+
+            ttl = self.cache.ttl_for(endpoint)
+            if data is None:
+                await self._cache_call(self.cache.refresh, key, ttl)
+                return entry.value
+
+            etag, last_modified = response_validators(headers)
+            await self._cache_call(self.cache.set, key, data, ttl, etag, last_modified)
+            return data
+
+        if self._flights is None:
+            return await fetch()
+        return await self._flights.do(key, fetch)
+
+
+    async def _cache_call(self, func: Callable[..., T], *args: Any) -> T:
+        """Call a cache method, in the default executor unless the cache lives in memory"""
+
+        if isinstance(self.cache, MemoryCache):
+            return func(*args)
+        return await to_thread(func, *args)
+
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """Schedule `fetch` as a task unless a refresh of `key` is already pending"""
+
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await fetch()
+            except PexelsAPIError:
+                # the stale entry stays in place and is retried on the next request
+                pass
+
+        task = asyncio.ensure_future(refresh())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+
+    def _decodes_models(self) -> bool:
+        """Whether `as_objects` calls decode straight into models, see `decode_models`"""
+        return self.decode_models and self.cache is None and not self.lazy
+
+
+    async def _request_models(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        base_url: Optional[str] = None,
+        shape: str = "photos"
+    ) -> Any:
+        """Make a request to the Pexels API and decode the response straight into models.
+
+        Args:
+            endpoint (str): The API endpoint
+            params (Optional[Dict[str, Any]], optional): Query parameters
+            base_url (Optional[str], optional): Base URL to use. Defaults to BASE_URL
+            shape (str, optional): Response shape, a key of `pypexel.schema.SCHEMAS` (default: `photos`)
+
+        Returns:
+            A list of models for list endpoints, else a single model
+
+        Raises:
+            PexelsAPIError: If the API request fails
+        """
+        url = urljoin(base_url or self.BASE_URL, endpoint.lstrip('/'))
+
+        if params:
+            params = { k: v for k, v in params.items() if v is not None }
+
+        loads = partial(decode_to_models, shape=shape, loads=self._loads)
+
+        async def fetch() -> Any:
+            data, _ = await self._with_retries(lambda timeout: self._send(url, params, timeout, loads=loads))
+            # responses without a bytes body come back as dicts, see `decode_response`
+            return parse_models(data, shape) if isinstance(data, dict) else data
+
+        if self._flights is None:
+            return await fetch()
+        return await self._flights.do(f"{shape}:{make_cache_key(url, params)}", fetch)
+
+
+    async def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+        conditional: Optional[Dict[str, str]] = None,
+        loads: Optional[Callable[[bytes], Any]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Mapping[str, str]]:
+        """Send a single API request and decode its JSON body. See `Pexels._send`."""
+
+        if self.rate_limiter is not None:
+            await asyncio.sleep(self.rate_limiter.reserve())
+
+        headers = {**self.headers, **conditional} if conditional else self.headers
+
+        try:
+            response = await self.client.get(url, headers=headers, params=params, timeout=timeout)
+        except httpx.HTTPError as e:
+            raise PexelsConnectionError(f"Request failed: {str(e)}")
+
+        self._update_rate_limit(response.headers)
+
+        if response.is_error:
+            raise http_error(response.status_code, response.text, response.headers)
+
+        if conditional and response.status_code == 304:
+            return None, response.headers
+
+        try:
+            return decode_response(response, loads or self._loads), response.headers
+        except ValueError as e:
+            raise PexelsAPIError(f"Invalid JSON response: {str(e)}")
+
+
+    async def _with_retries(self, send: Callable[[float], Awaitable[T]]) -> T:
+        """Await `send(timeout)`, retrying transient failures according to the retry policy"""
+
+        if self.retry is None:
+            return await send(self.timeout)
+
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await send(self.retry.attempt_timeout(self.timeout, started))
+            except PexelsAPIError as e:
+                delay = self.retry.next_delay(attempt, e, started)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+
+    def _update_rate_limit(self, headers: Dict[str, str]) -> None:
+        """Record the rate limit reported in response headers"""
+
+        state = parse_rate_limit_headers(headers)
+        if state is None:
+            return
+
+        self.rate_limit = state
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(state)
+
+
+    async def search_photos(
+        self,
+        query: str,
+        orientation: Optional[str] = None,
+        size: Optional[str] = None,
+        color: Optional[str] = None,
+        locale: Optional[str] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        as_objects: Optional[bool] = False,
+        as_table: bool = False
+    ) -> Dict[str, Any]:
+        """Search for photos on Pexels. See `Pexels.search_photos`."""
+
+        validate_query(query)
+        validate_pagination(page, per_page)
+
+        params = {
+            "query": query,
+            "orientation": orientation,
+            "size": size,
+            "color": color,
+            "locale": locale,
+            "page": page,
+            "per_page": per_page,
+        }
+
+        if as_objects and self._decodes_models():
+            return await self._request_models("search", params, shape="photos")
+
+        response = await self._make_request("search", params)
+
+        if as_table:
+            return PhotoTable(response.get('photos', []))
+
+        if as_objects:
+            return [parse_photo(photo, self.lazy) for photo in response.get('photos', [])]
+
+        return response
+
+
+    async def search_videos(
+        self,
+        query: str,
+        orientation: Optional[str] = None,
+        size: Optional[str] = None,
+        locale: Optional[str] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        as_objects: Optional[bool] = False,
+        as_table: bool = False
+    ) -> Dict[str, Any]:
+        """Search for videos on Pexels. See `Pexels.search_videos`."""
+
+        validate_query(query)
+        validate_pagination(page, per_page)
+
+        params = {
+            "query": query,
+            "orientation": orientation,
+            "size": size,
+            "locale": locale,
+            "page": page,
+            "per_page": per_page,
+        }
+
+        if as_objects and self._decodes_models():
+            return await self._request_models("search", params, base_url=self.VIDEO_BASE_URL, shape="videos")
+
+        response = await self._make_request("search", params, self.VIDEO_BASE_URL)
+
+        if as_table:
+            return VideoTable(response.get('videos', []))
+
+        if as_objects:
+            return [parse_video(video, self.lazy) for video in response.get('videos', [])]
+
+        return response
+
+
+    async def get_photo(self, photo_id: Union[int, str], as_object: Optional[bool] = False) -> Dict[str, Any]:
+        """Get a specific photo by ID. See `Pexels.get_photo`."""
+
+        if as_object and self._decodes_models():
+            return await self._request_models(f"photos/{photo_id}", shape="photo")
+
+        response = await self._make_request(f"photos/{photo_id}")
+
+        if as_object:
+            return parse_photo(response, self.lazy)
+
+        return response
+
+
+    async def get_video(self, video_id: Union[int, str], as_object: Optional[bool] = False) -> Dict[str, Any]:
+        """Get a specific video by ID. See `Pexels.get_video`."""
+
+        if as_object and self._decodes_models():
+            return await self._request_models(f"videos/{video_id}", base_url=self.VIDEO_BASE_URL, shape="video")
+
+        response = await self._make_request(f"videos/{video_id}", base_url=self.VIDEO_BASE_URL)
+
+        if as_object:
+            return parse_video(response, self.lazy)
+
+        return response
+
+
+    async def _get_many(
+        self,
+        get_one: Callable[..., Awaitable[Any]],
+        ids: Iterable[Union[int, str]],
+        max_workers: int,
+        as_objects: bool
+    ) -> BatchResult:
+        """Fetch many items by ID with bounded concurrency, collecting per-ID errors"""
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        batch = BatchResult()
+        queue = iter(dict.fromkeys(ids))
+
+        async def worker():
+            for item_id in queue:
+                try:
+                    batch.results[item_id] = await get_one(item_id, as_object=as_objects)
+                except PexelsAPIError as e:
+                    batch.errors[item_id] = e
+
+        await asyncio.gather(*(worker() for _ in range(max_workers)))
+        return batch
+
+
+    async def get_photos(
+        self,
+        photo_ids: Iterable[Union[int, str]],
+        max_workers: int = 32,
+        as_objects: Optional[bool] = False
+    ) -> BatchResult:
+        """Get many photos by ID concurrently. See `Pexels.get_photos`."""
+
+        return await self._get_many(self.get_photo, photo_ids, max_workers, as_objects)
+
+
+    async def get_videos(
+        self,
+        video_ids: Iterable[Union[int, str]],
+        max_workers: int = 32,
+        as_objects: Optional[bool] = False
+    ) -> BatchResult:
+        """Get many videos by ID concurrently. See `Pexels.get_videos`."""
+
+        return await self._get_many(self.get_video, video_ids, max_workers, as_objects)
+
+
+    async def get_curated_photos(
+        self,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        as_objects: Optional[bool] = False,
+        as_table: bool = False
+    ) -> Dict[str, Any]:
+        """Get photos curated by the Pexels team. See `Pexels.get_curated_photos`."""
+
+        validate_pagination(page, per_page)
+
+        params = {
+            "page": page,
+            "per_page": per_page,
+        }
+
+        if as_objects and self._decodes_models():
+            return await self._request_models("curated", params, shape="photos")
+
+        response = await self._make_request("curated", params)
+
+        if as_table:
+            return PhotoTable(response.get('photos', []))
+
+        if as_objects:
+            return [parse_photo(photo, self.lazy) for photo in response.get('photos', [])]
+
+        return response
+
+
+    async def get_popular_videos(
+        self,
+        min_width: Optional[int] = None,
+        min_height: Optional[int] = None,
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        as_objects: Optional[bool] = False,
+        as_table: bool = False
+    ) -> Dict[str, Any]:
+        """Get the current popular Pexels videos. See `Pexels.get_popular_videos`."""
+
+        validate_pagination(page, per_page)
+
+        params = {
+            "min_width": min_width,
+            "min_height": min_height,
+            "min_duration": min_duration,
+            "max_duration": max_duration,
+            "page": page,
+            "per_page": per_page,
+        }
+
+        if as_objects and self._decodes_models():
+            return await self._request_models("popular", params, base_url=self.VIDEO_BASE_URL, shape="videos")
+
+        response = await self._make_request("popular", params, base_url=self.VIDEO_BASE_URL)
+
+        if as_table:
+            return VideoTable(response.get('videos', []))
+
+        if as_objects:
+            return [parse_video(video, self.lazy) for video in response.get('videos', [])]
+
+        return response
+
+
+    async def get_featured_collections(
+        self,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        as_objects: Optional[bool] = False
+    ) -> Dict[str, Any]:
+        """Get all featured collections on Pexels. See `Pexels.get_featured_collections`."""
+
+        validate_pagination(page, per_page)
+
+        params = {
+            "page": page,
+            "per_page": per_page,
+        }
+
+        if as_objects and self._decodes_models():
+            return await self._request_models("collections/featured", params, shape="collections")
+
+        response = await self._make_request("collections/featured", params)
+
+        if as_objects:
+            return [parse_collection(collection) for collection in response.get('collections', [])]
+
+        return response
+
+
+    async def get_my_collections(
+        self,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        as_objects: Optional[bool] = False
+    ) -> Dict[str, Any]:
+        """Get all of your collections. See `Pexels.get_my_collections`."""
+
+        validate_pagination(page, per_page)
+
+        params = {
+            "page": page,
+            "per_page": per_page,
+        }
+
+        if as_objects and self._decodes_models():
+            return await self._request_models("collections", params, shape="collections")
+
+        response = await self._make_request("collections", params)
+
+        if as_objects:
+            return [parse_collection(collection) for collection in response.get('collections', [])]
+
+        return response
+
+
+    async def get_collection_media(
+        self,
+        collection_id: Union[int, str],
+        media_type: Optional[str] = None,
+        sort: Optional[str] = "asc",
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        as_objects: Optional[bool] = False,
+        as_table: bool = False
+    ) -> Dict[str, Any]:
+        """Get all media within a collection. See `Pexels.get_collection_media`."""
+
+        validate_pagination(page, per_page)
+        validate_media_type(media_type)
+
+        params = {
+            "type": media_type,
+            "sort": sort,
+            "page": page,
+            "per_page": per_page,
+        }
+
+        response = await self._make_request(f"collections/{collection_id}", params)
+
+        if as_table:
+            return media_tables(response.get('media', []))
+
+        if as_objects:
+            return parse_collection_media(response, self.lazy)
+
+        return response
+
+
+    async def _iter_pages(
+        self,
+        fetch: Callable[..., Awaitable[Dict[str, Any]]],
+        page: int,
+        per_page: int,
+        max_items: Optional[int] = None,
+        prefetch: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield raw responses page by page, prefetching up to `prefetch` pages as tasks. See `Pexels._iter_pages`."""
+
+        response = await fetch(page=page, per_page=per_page)
+        yield response
+
+        final = last_page(response, page, per_page, max_items)
+        if not prefetch or final is None:
+            while has_next_page(response, page, per_page):
+                page += 1
+                response = await fetch(page=page, per_page=per_page)
+                yield response
+            return
+
+        if not page_items(response):
+            return
+
+        pending = deque()
+        next_page = page + 1
+        try:
+            while pending or next_page <= final:
+                while next_page <= final and len(pending) < prefetch:
+                    pending.append(asyncio.ensure_future(fetch(page=next_page, per_page=per_page)))
+                    next_page += 1
+
+                response = await pending.popleft()
+                yield response
+
+                if not page_items(response):
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+    async def _paginate(
+        self,
+        fetch: Callable[..., Awaitable[Dict[str, Any]]],
+        page: int,
+        per_page: int,
+        max_items: Optional[int],
+        prefetch: int,
+        as_objects: bool
+    ) -> AsyncIterator[Any]:
+        """Yield result items page by page from a paginated method. See `Pexels._paginate`."""
+
+        if max_items == 0:
+            return
+        if max_items is not None and page == 1:
+            # later pages are offsets in units of per_page, so only the first may shrink
+            per_page = min(per_page, max_items)
+
+        yielded = 0
+        pages = self._iter_pages(fetch, page, per_page, max_items, prefetch)
+        try:
+            async for response in pages:
+                key = result_key(response)
+
+                for item in page_items(response):
+                    yield parse_item(item, key, self.lazy) if as_objects else item
+                    yielded += 1
+
+                    if max_items is not None and yielded >= max_items:
+                        return
+        finally:
+            await pages.aclose()
+
+
+    def iter_search_photos(
+        self,
+        query: str,
+        orientation: Optional[str] = None,
+        size: Optional[str] = None,
+        color: Optional[str] = None,
+        locale: Optional[str] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> AsyncIterator[Union[Dict[str, Any], Photo]]:
+        """Asynchronously iterate over photo search results. See `Pexels.iter_search_photos`."""
+
+        validate_query(query)
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        fetch = partial(self.search_photos, query, orientation=orientation, size=size, color=color, locale=locale)
+        return self._paginate(fetch, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_search_videos(
+        self,
+        query: str,
+        orientation: Optional[str] = None,
+        size: Optional[str] = None,
+        locale: Optional[str] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> AsyncIterator[Union[Dict[str, Any], Video]]:
+        """Asynchronously iterate over video search results. See `Pexels.iter_search_videos`."""
+
+        validate_query(query)
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        fetch = partial(self.search_videos, query, orientation=orientation, size=size, locale=locale)
+        return self._paginate(fetch, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_curated_photos(
+        self,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> AsyncIterator[Union[Dict[str, Any], Photo]]:
+        """Asynchronously iterate over curated photos. See `Pexels.iter_curated_photos`."""
+
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        return self._paginate(self.get_curated_photos, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_popular_videos(
+        self,
+        min_width: Optional[int] = None,
+        min_height: Optional[int] = None,
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> AsyncIterator[Union[Dict[str, Any], Video]]:
+        """Asynchronously iterate over popular videos. See `Pexels.iter_popular_videos`."""
+
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        fetch = partial(
+            self.get_popular_videos,
+            min_width=min_width,
+            min_height=min_height,
+            min_duration=min_duration,
+            max_duration=max_duration
+        )
+        return self._paginate(fetch, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_featured_collections(
+        self,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> AsyncIterator[Union[Dict[str, Any], Collection]]:
+        """Asynchronously iterate over featured collections. See `Pexels.iter_featured_collections`."""
+
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        return self._paginate(self.get_featured_collections, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_my_collections(
+        self,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> AsyncIterator[Union[Dict[str, Any], Collection]]:
+        """Asynchronously iterate over your collections. See `Pexels.iter_my_collections`."""
+
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        return self._paginate(self.get_my_collections, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_collection_media(
+        self,
+        collection_id: Union[int, str],
+        media_type: Optional[str] = None,
+        sort: Optional[str] = "asc",
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> AsyncIterator[Union[Dict[str, Any], Photo, Video]]:
+        """Asynchronously iterate over the media of a collection. See `Pexels.iter_collection_media`."""
+
+        validate_pagination(page, per_page)
+        validate_media_type(media_type)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        fetch = partial(self.get_collection_media, collection_id, media_type=media_type, sort=sort)
+        return self._paginate(fetch, page, per_page, max_items, prefetch, as_objects)
+
+
+    async def _stream_to(self, url: str, target: Union[bytearray, memoryview, BinaryIO], timeout: float, chunk_size: int) -> int:
+        """Stream a file into a buffer or writable binary file object, returning the number of bytes written"""
+
+        view = None
+        if not isinstance(target, bytearray) and not hasattr(target, "write"):
+            view = memoryview(target).cast("B")
+            if view.readonly:
+                raise ValueError("Buffer is read-only")
+
+        written = 0
+        try:
+            async with self.client.stream("GET", url, timeout=timeout) as response:
+                if response.is_error:
+                    raise http_error(response.status_code, response.reason_phrase, response.headers)
+
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    if view is not None:
+                        if written + len(chunk) > len(view):
+                            raise ValueError(f"Buffer of {len(view)} bytes is too small for the file")
+                        view[written:written + len(chunk)] = chunk
+                    elif isinstance(target, bytearray):
+                        target.extend(chunk)
+                    else:
+                        target.write(chunk)
+                    written += len(chunk)
+
+        except httpx.HTTPError as e:
+            raise PexelsConnectionError(f"Download failed: {str(e)}")
+
+        return written
+
+
+    async def _download_into(self, url: str, target: Union[bytearray, memoryview, BinaryIO], chunk_size: int) -> int:
+        """Download `url` into a buffer or file object, rewinding `target` before each retry"""
+
+        rewind = rewinder(target)
+        if rewind is None:
+            return await self._stream_to(url, target, self.timeout, chunk_size)
+
+        async def download(timeout: float) -> int:
+            rewind()
+            return await self._stream_to(url, target, timeout, chunk_size)
+
+        return await self._with_retries(download)
+
+
+    async def iter_download(self, url: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Stream a media file, yielding its body in chunks. See `Pexels.iter_download`.
+
+        Args:
+            url (str): Media file URL, e.g. `photo.src.medium` or a `VideoFile.link`
+            chunk_size (int, optional): Maximum chunk size in bytes (default: 1 MiB)
+
+        Yields:
+            bytes: Consecutive chunks of the file
+        """
+
+        try:
+            async with self.client.stream("GET", url, timeout=self.timeout) as response:
+                if response.is_error:
+                    raise http_error(response.status_code, response.reason_phrase, response.headers)
+
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    yield chunk
+
+        except httpx.HTTPError as e:
+            raise PexelsConnectionError(f"Download failed: {str(e)}")
+
+
+    async def download_photo(
+        self,
+        photo: Photo,
+        size: str = "original",
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        path: Optional[str] = None,
+        file: Optional[Union[bytearray, memoryview, BinaryIO]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Union[str, int]:
+        """Download a photo rendition to disk or into a buffer or file object. See `Pexels.download_photo`.
+
+        Args:
+            photo (Photo): Photo object to download
+            size (str, optional): Rendition: `original`, `large2x`, `large`, `medium`, `small`, `portrait`, `landscape`, `tiny` (default: `original`)
+            width (int, optional): Minimum width in pixels, overrides `size`
+            height (int, optional): Minimum height in pixels, overrides `size`
+            path (str, optional): Destination file path (default: `{photo_id}_{size}.{ext}`)
+            file (bytearray, memoryview or BinaryIO, optional): Buffer or file object to download into instead of `path`
+            chunk_size (int, optional): Read size in bytes (default: 1 MiB)
+
+        Returns:
+            str or int: The filepath of the downloaded photo, or the number of bytes written to `file`
+
+        Raises:
+            ValueError: If the rendition is not available or a fixed-size buffer is too small
+            PexelsAPIError: If the download fails
+        """
+
+        if width is not None or height is not None:
+            size = select_photo_size(photo, width, height)
+
+        url = photo_url(photo, size)
+
+        if file is not None:
+            return await self._download_into(url, file, chunk_size)
+
+        path = path or f"{photo.id}_{size}{url_extension(url)}"
+        await self._download_to_path(url, path, photo.id, chunk_size)
+        return path
+
+
+    async def _download_to_path(self, url: str, path: str, media_id: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Download `url` to `path` with retries, going through the download store when one is set.
+
+        Concurrent downloads of the same rendition, in this or another process, wait for
+        the first one, then share its stored object. Store locking, lookups, hashing and
+        linking run in the default executor.
+        """
+
+        async def download(target: str) -> int:
+            return await self._with_retries(lambda timeout: self._download_file(url, target, timeout, chunk_size))
+
+        if self.store is None:
+            return await download(path)
+
+        key = self.store.key_for(media_id, url)
+        lock = self._download_locks.get(key)
+        if lock is None:
+            lock = self._download_locks[key] = asyncio.Lock()
+
+        async with lock:
+            lock_file = await to_thread(self.store.lock_file, key)
+            try:
+                stored = await to_thread(self.store.get, media_id, url)
+                if stored is None:
+                    staging_path = self.store.staging_path(key)
+                    await download(staging_path)
+                    stored = await to_thread(self.store.add, media_id, url, staging_path)
+                await to_thread(self.store.materialize, stored, path)
+            finally:
+                if lock_file is not None:
+                    lock_file.close()
+
+        return os.path.getsize(path)
+
+
+    async def _download_file(self, url: str, path: str, timeout: float, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Download `url` over a single connection, see `pypexel.download.download_file`.
+
+        Data is written to `{path}.part` and moved to `path` once complete. Progress is
+        checkpointed to `{path}.part.json`, so an interrupted download resumes with a
+        `Range` request guarded by `If-Range`; if the server sends the whole file instead,
+        it starts over. File and checkpoint I/O runs in the default executor.
+
+        Returns:
+            int: Size of the file
+        """
+
+        part_path = f"{path}{PART_SUFFIX}"
+        checkpoint_path = f"{path}{CHECKPOINT_SUFFIX}"
+
+        checkpoint = await to_thread(Checkpoint.load, checkpoint_path, url)
+        if checkpoint is None or not os.path.exists(part_path):
+            checkpoint = Checkpoint(checkpoint_path, url)
+
+        offset, headers = resume_request(checkpoint)
+        written = offset
+        if headers is not None:
+            try:
+                async with self.client.stream("GET", url, headers=headers, timeout=timeout) as response:
+                    if response.is_error:
+                        raise http_error(response.status_code, response.reason_phrase, response.headers)
+
+                    if response.status_code != 206:
+                        offset = 0
+                        await to_thread(checkpoint.restart, response.headers)
+
+                    f = await to_thread(open_part, part_path, offset)
+                    try:
+                        written = offset
+                        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                            written += await to_thread(write_chunk, f, chunk, checkpoint)
+                    finally:
+                        await to_thread(f.close)
+
+            except httpx.HTTPError as e:
+                raise PexelsConnectionError(f"Download failed: {str(e)}")
+
+        await to_thread(os.replace, part_path, path)
+        await to_thread(checkpoint.remove)
+        return written
+
+
+    async def download_video(
+        self,
+        video: Video,
+        quality: Optional[str] = None,
+        connections: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        max_fps: Optional[float] = None,
+        file_type: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        file: Optional[Union[bytearray, memoryview, BinaryIO]] = None
+    ) -> Union[str, int]:
+        """Download a video. See `Pexels.download_video`.
+
+        Args:
+            video (Video): Video object to download
+            quality (str, optional): Requested quality: `sd`, `hd`, `uhd`
+            connections (int, optional): Accepted for parity with `Pexels.download_video` and ignored; the file is fetched over a single stream
+            chunk_size (int, optional): Read size in bytes (default: 1 MiB)
+            width (int, optional): Minimum width in pixels when `quality` is not given
+            height (int, optional): Minimum height in pixels when `quality` is not given
+            max_fps (float, optional): Highest acceptable frame rate when `quality` is not given
+            file_type (str, optional): Required MIME type, e.g. `video/mp4`, when `quality` is not given
+            max_bytes (int, optional): Largest acceptable file size when `quality` is not given
+            file (bytearray, memoryview or BinaryIO, optional): Buffer or file object to download into
+
+        Returns:
+            str or int: The filepath of the downloaded video, or the number of bytes written to `file`
+
+        Raises:
+            ValueError: If no video file matches the requested quality or constraints, or a fixed-size buffer is too small
+            PexelsAPIError: If the download fails
+        """
+
+        if quality is not None:
+            selected_video = select_video_file(video, quality)
+            filename = f"{video.id}_{quality}.mp4"
+        else:
+            selected_video = select_video_rendition(video, width, height, max_fps, file_type, max_bytes)
+            filename = f"{video.id}_{selected_video.width}x{selected_video.height}.mp4"
+
+        if file is not None:
+            return await self._download_into(selected_video.link, file, chunk_size)
+
+        await self._download_to_path(selected_video.link, filename, video.id, chunk_size)
+
+        return filename
@@ -0,0 +1,582 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import urlencode
+from typing import Optional, Dict, Any, Mapping, Tuple
+
+
+def make_cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build a cache key from a request URL and its query parameters.
+
+    `None` values are dropped and the remaining parameters are sorted, so equivalent
+    requests map to the same key regardless of argument order.
+    """
+
+    if not params:
+        return url
+
+    normalized = sorted((k, str(v)) for k, v in params.items() if v is not None)
+    return f"{url}?{urlencode(normalized)}" if normalized else url
+
+
+def response_validators(headers: Mapping[str, str]) -> Tuple[Optional[str], Optional[str]]:
+    """Return the `ETag` and `Last-Modified` values of a response, if present"""
+
+    try:
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+    except (AttributeError, TypeError):
+        return None, None
+
+    return (
+        etag if isinstance(etag, str) else None,
+        last_modified if isinstance(last_modified, str) else None
+    )
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    revalidations: int = 0
+    stale_hits: int = 0
+
+
+@dataclass
+class CacheEntry:
+    """A cached response with its validators.
+
+    `expires_in` is the number of seconds the entry stays fresh; it is negative for
+    expired entries kept around so they can be revalidated.
+    """
+
+    value: Any
+    expires_in: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_in > 0
+
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers turning a request for this entry into a conditional GET"""
+
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class BaseCache:
+    """Base class for response caches used by `Pexels._make_request`.
+
+    Responses are stored with their `ETag` and `Last-Modified` validators. Expired entries
+    that have a validator are kept for `stale_ttl` more seconds so the client can revalidate
+    them with a conditional GET instead of downloading the full response again.
+
+    Expired entries can also be served directly: within `stale_while_revalidate` seconds
+    of expiry the client returns them at once and refreshes them in the background, and
+    within `stale_if_error` seconds it falls back to them when the API fails or is rate
+    limited.
+
+    Args:
+        ttl (float, optional): Default time-to-live in seconds (default: `300`)
+        endpoint_ttls (Dict[str, float], optional): TTL overrides keyed by endpoint prefix
+            (e.g. `{"curated": 3600, "photos/": 86400}`). The longest matching prefix wins
+            and a TTL of `0` disables caching for that endpoint.
+        stale_ttl (float, optional): Seconds expired entries with validators are kept for revalidation (default: `86400`)
+        stale_while_revalidate (float, optional): Maximum staleness, in seconds, of entries served while refreshed in the background (default: `0`, disabled)
+        stale_if_error (float, optional): Maximum staleness, in seconds, of entries served when the API errors (default: `0`, disabled)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        stale_ttl: float = 86400,
+        stale_while_revalidate: float = 0,
+        stale_if_error: float = 0
+    ):
+        self.ttl = ttl
+        self.endpoint_ttls = endpoint_ttls or {}
+        self.stale_ttl = stale_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.stats = CacheStats()
+
+
+    def retention(self, has_validators: bool) -> float:
+        """Seconds an expired entry is kept before it is dropped"""
+
+        return max(self.stale_while_revalidate, self.stale_if_error, self.stale_ttl if has_validators else 0)
+
+
+    def can_serve_stale(self, entry: CacheEntry) -> bool:
+        """Whether an expired entry may be returned while it is refreshed in the background"""
+        return -entry.expires_in <= self.stale_while_revalidate
+
+
+    def can_serve_on_error(self, entry: CacheEntry) -> bool:
+        """Whether an expired entry may be returned because refreshing it failed"""
+        return -entry.expires_in <= self.stale_if_error
+
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the time-to-live for responses from an endpoint"""
+
+        endpoint = endpoint.lstrip('/')
+        matches = [prefix for prefix in self.endpoint_ttls if endpoint.startswith(prefix.lstrip('/'))]
+        if not matches:
+            return self.ttl
+        return self.endpoint_ttls[max(matches, key=len)]
+
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for `key`, or None if missing or expired"""
+
+        entry = self.get_entry(key)
+        return entry.value if entry is not None and entry.fresh else None
+
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for `key`, including an expired one kept for revalidation, or None"""
+        raise NotImplementedError
+
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store a response under `key` for `ttl` seconds (default: `self.ttl`) with its validators"""
+        raise NotImplementedError
+
+
+    def refresh(self, key: str, ttl: Optional[float] = None) -> None:
+        """Mark an entry fresh for another `ttl` seconds after the server confirmed it is unchanged"""
+        raise NotImplementedError
+
+
+    def delete(self, key: str) -> None:
+        """Remove a cached response"""
+        raise NotImplementedError
+
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """Thread-safe in-memory response cache with TTL expiry and LRU eviction.
+
+    Cached responses are returned as the same objects on every hit, so treat them as read-only.
+
+    Args:
+        ttl (float, optional): Default time-to-live in seconds (default: `300`)
+        endpoint_ttls (Dict[str, float], optional): TTL overrides keyed by endpoint prefix
+        max_entries (int, optional): Maximum number of cached responses (default: `1024`)
+        max_bytes (int, optional): Maximum total size of cached responses, measured as encoded JSON; `current_bytes` is only tracked when set (default: unbounded)
+        stale_ttl (float, optional): Seconds expired entries with validators are kept for revalidation (default: `86400`)
+        stale_while_revalidate (float, optional): Maximum staleness of entries served while refreshed in the background (default: `0`)
+        stale_if_error (float, optional): Maximum staleness of entries served when the API errors (default: `0`)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        stale_ttl: float = 86400,
+        stale_while_revalidate: float = 0,
+        stale_if_error: float = 0
+    ):
+        super().__init__(ttl, endpoint_ttls, stale_ttl, stale_while_revalidate, stale_if_error)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+
+        # key -> (expires_at, size, value, etag, last_modified), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            expires_at, size, value, etag, last_modified = entry
+            expires_in = expires_at - time.monotonic()
+            if expires_in <= 0:
+                self.stats.misses += 1
+                if -expires_in >= self.retention(bool(etag or last_modified)):
+                    self._remove(key)
+                    return None
+            else:
+                self.stats.hits += 1
+
+            self._entries.move_to_end(key)
+            return CacheEntry(value, expires_in, etag, last_modified)
+
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        # sizing re-encodes the value, so it is skipped (and counted as 0) without a byte limit
+        size = 0
+        if self.max_bytes is not None:
+            size = len(json.dumps(value, separators=(',', ':')))
+            if size > self.max_bytes:
+                return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + ttl, size, value, etag, last_modified)
+            self.current_bytes += size
+            self._evict()
+
+
+    def refresh(self, key: str, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+
+            self._entries[key] = (time.monotonic() + ttl,) + entry[1:]
+            self._entries.move_to_end(key)
+            self.stats.revalidations += 1
+
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+    def _remove(self, key: str) -> None:
+        size = self._entries.pop(key)[1]
+        self.current_bytes -= size
+
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until both limits are met"""
+
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats.evictions += 1
+
+
+class SQLiteCache(BaseCache):
+    """Persistent response cache stored in a SQLite file.
+
+    Responses are stored as zlib-compressed JSON. The database runs in WAL mode so
+    several threads and processes can share one cache file, and survives restarts.
+    Expired rows are skipped on read, or kept for revalidation when they have validators;
+    call `prune()` to delete them and `vacuum()` to give the freed pages back to the filesystem.
+
+    Args:
+        path (str): Path of the SQLite database file
+        ttl (float, optional): Default time-to-live in seconds (default: `300`)
+        endpoint_ttls (Dict[str, float], optional): TTL overrides keyed by endpoint prefix
+        max_entries (int, optional): Maximum number of cached responses (default: unbounded)
+        max_bytes (int, optional): Maximum total size of compressed responses (default: unbounded)
+        compression_level (int, optional): zlib compression level, `0`-`9` (default: `6`)
+        timeout (float, optional): Seconds to wait for a lock held by another connection (default: `30`)
+        stale_ttl (float, optional): Seconds expired entries with validators are kept for revalidation (default: `86400`)
+        stale_while_revalidate (float, optional): Maximum staleness of entries served while refreshed in the background (default: `0`)
+        stale_if_error (float, optional): Maximum staleness of entries served when the API errors (default: `0`)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 300,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        compression_level: int = 6,
+        timeout: float = 30,
+        stale_ttl: float = 86400,
+        stale_while_revalidate: float = 0,
+        stale_if_error: float = 0
+    ):
+        super().__init__(ttl, endpoint_ttls, stale_ttl, stale_while_revalidate, stale_if_error)
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.timeout = timeout
+
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "etag TEXT, "
+                "last_modified TEXT)"
+            )
+
+            # caches created before validators were stored
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:
+                    try:
+                        conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+                    except sqlite3.OperationalError:
+                        # added concurrently by another process
+                        pass
+
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+            # running entry count and size, kept by triggers so limits are checked without a table scan
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS totals ("
+                    "id INTEGER PRIMARY KEY CHECK (id = 0), "
+                    "entries INTEGER NOT NULL, "
+                    "bytes INTEGER NOT NULL)"
+                )
+                conn.execute("INSERT OR IGNORE INTO totals SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN "
+                    "UPDATE totals SET entries = entries + 1, bytes = bytes + new.size; END"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN "
+                    "UPDATE totals SET entries = entries - 1, bytes = bytes - old.size; END"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS responses_resize AFTER UPDATE OF size ON responses BEGIN "
+                    "UPDATE totals SET bytes = bytes - old.size + new.size; END"
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+
+    def _count(self, stat: str, n: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + n)
+
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT entries FROM totals").fetchone()[0]
+
+
+    @property
+    def current_bytes(self) -> int:
+        """Total size of the stored compressed responses"""
+        return self._connection().execute("SELECT bytes FROM totals").fetchone()[0]
+
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, expires_at, etag, last_modified FROM responses WHERE key = ? AND (expires_at > ? "
+            "OR ((etag IS NOT NULL OR last_modified IS NOT NULL) AND expires_at > ?))",
+            (key, now - self.retention(False), now - self.retention(True))
+        ).fetchone()
+
+        if row is None:
+            self._count("misses")
+            return None
+
+        value, expires_at, etag, last_modified = row
+        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self._count("hits" if expires_at > now else "misses")
+        return CacheEntry(json.loads(zlib.decompress(value)), expires_at - now, etag, last_modified)
+
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        blob = zlib.compress(json.dumps(value, separators=(',', ':')).encode("utf-8"), self.compression_level)
+        if self.max_bytes is not None and len(blob) > self.max_bytes:
+            return
+
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO responses (key, value, size, expires_at, accessed_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at, "
+                "etag = excluded.etag, last_modified = excluded.last_modified",
+                (key, sqlite3.Binary(blob), len(blob), now + ttl, now, etag, last_modified)
+            )
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+    def refresh(self, key: str, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        cursor = self._connection().execute(
+            "UPDATE responses SET expires_at = ?, accessed_at = ? WHERE key = ?",
+            (now + ttl, now, key)
+        )
+        if cursor.rowcount:
+            self._count("revalidations")
+
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+
+
+    def prune(self) -> int:
+        """Delete expired responses that are past their stale retention period.
+
+        Returns:
+            int: Number of responses removed
+        """
+        now = time.time()
+        cursor = self._connection().execute(
+            "DELETE FROM responses WHERE expires_at <= ? "
+            "AND ((etag IS NULL AND last_modified IS NULL) OR expires_at <= ?)",
+            (now - self.retention(False), now - self.retention(True))
+        )
+        return cursor.rowcount
+
+
+    def vacuum(self) -> None:
+        """Prune expired responses and compact the database file"""
+
+        self.prune()
+        conn = self._connection()
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+    def close(self) -> None:
+        """Close this thread's database connection"""
+
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired (earliest first), then least recently used, responses until both limits are met.
+
+        Both passes walk an index and stop at the first row that is not needed, so an
+        eviction reads only the rows it removes.
+        """
+
+        if self.max_entries is None and self.max_bytes is None:
+            return
+
+        count, total = conn.execute("SELECT entries, bytes FROM totals").fetchone()
+        if not self._over_limit(count, total):
+            return
+
+        victims: Dict[str, int] = {}
+        for query, params in (
+            ("SELECT key, size FROM responses WHERE expires_at <= ? ORDER BY expires_at", (time.time(),)),
+            ("SELECT key, size FROM responses ORDER BY accessed_at", ()),
+        ):
+            cursor = conn.execute(query, params)
+            try:
+                for key, size in cursor:
+                    if not self._over_limit(count, total):
+                        break
+                    if key not in victims:
+                        victims[key] = size
+                        count -= 1
+                        total -= size
+            finally:
+                cursor.close()
+
+        conn.executemany("DELETE FROM responses WHERE key = ?", ((key,) for key in victims))
+        self._count("evictions", len(victims))
+
+
+    def _over_limit(self, count: int, total: int) -> bool:
+        return (
+            (self.max_entries is not None and count > self.max_entries)
+            or (self.max_bytes is not None and total > self.max_bytes)
+        )
@@ -0,0 +1,617 @@
+import os
+import json
+import math
+import threading
+import requests
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Any, Callable, Iterator, List, Tuple, Union, BinaryIO, Dict, Mapping
+
+from .exceptions import PexelsConnectionError, http_error
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MIN_PART_SIZE = 4 * 1024 * 1024
+
+PART_SUFFIX = ".part"
+CHECKPOINT_SUFFIX = ".part.json"
+
+
+@dataclass
+class RemoteFile:
+    size: Optional[int]
+    accepts_ranges: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class RangeNotSupported(Exception):
+    """Raised when the server ignores a Range header"""
+    pass
+
+
+class Checkpoint:
+    """Sidecar file recording the verified progress of a partial download.
+
+    Progress is tracked per byte range as `[start, end, done]`, where `end` is inclusive
+    (or None when the size is unknown) and `done` counts bytes flushed to the part file.
+    The source's ETag and Last-Modified are kept so a resumed download can check, through
+    `If-Range`, that the remote file has not changed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        url: str,
+        size: Optional[int] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        ranges: Optional[List[List[Optional[int]]]] = None
+    ):
+        self.path = path
+        self.url = url
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.ranges = ranges if ranges is not None else [[0, None if size is None else size - 1, 0]]
+        self._lock = threading.Lock()
+
+
+    @classmethod
+    def load(cls, path: str, url: str) -> Optional["Checkpoint"]:
+        """Load a checkpoint for `url`, or return None if it is missing, unreadable or for another URL"""
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get('url') != url:
+            return None
+
+        return cls(path, url, data.get('size'), data.get('etag'), data.get('last_modified'), data.get('ranges'))
+
+
+    @property
+    def validator(self) -> Optional[str]:
+        """Value for an `If-Range` header, preferring a strong ETag over Last-Modified"""
+
+        if self.etag and not self.etag.startswith("W/"):
+            return self.etag
+        return self.last_modified
+
+
+    def matches(self, remote: RemoteFile) -> bool:
+        """Whether the remote file is the one this checkpoint was recorded for"""
+
+        if self.size is not None and remote.size is not None and self.size != remote.size:
+            return False
+        if self.etag and remote.etag:
+            return self.etag == remote.etag
+        if self.last_modified and remote.last_modified:
+            return self.last_modified == remote.last_modified
+        return False
+
+
+    def prefix(self) -> int:
+        """Number of contiguous bytes completed from the start of the file"""
+
+        covered = 0
+        for start, end, done in sorted(self.ranges):
+            if start != covered:
+                break
+            covered = start + done
+            if end is None or done < end - start + 1:
+                break
+        return covered
+
+
+    def advance(self, start: int, n: int) -> None:
+        """Record `n` more flushed bytes for the range beginning at `start`"""
+
+        with self._lock:
+            for byte_range in self.ranges:
+                if byte_range[0] == start:
+                    byte_range[2] += n
+                    break
+            self._save()
+
+
+    def restart(self, headers: Mapping[str, str]) -> None:
+        """Start over as a single range, taking size and validators from a full response's headers"""
+
+        length = headers.get("Content-Length")
+        self.size = int(length) if length and length.isdigit() else None
+        self.etag = headers.get("ETag")
+        self.last_modified = headers.get("Last-Modified")
+        self.ranges = [[0, None if self.size is None else self.size - 1, 0]]
+        self.save()
+
+
+    def save(self) -> None:
+        with self._lock:
+            self._save()
+
+
+    def _save(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'url': self.url,
+                'size': self.size,
+                'etag': self.etag,
+                'last_modified': self.last_modified,
+                'ranges': self.ranges,
+            }, f)
+        os.replace(tmp_path, self.path)
+
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def probe(session: requests.Session, url: str, timeout: float) -> RemoteFile:
+    """Issue a HEAD request to learn the size of a file and whether it can be fetched in ranges"""
+
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        raise PexelsConnectionError(f"Download failed: {str(e)}")
+
+    if response.status_code >= 400:
+        raise http_error(response.status_code, response.reason, response.headers)
+
+    length = response.headers.get("Content-Length")
+    return RemoteFile(
+        size=int(length) if length and length.isdigit() else None,
+        accepts_ranges=response.headers.get("Accept-Ranges", "").lower() == "bytes",
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified")
+    )
+
+
+def split_ranges(size: int, parts: int, min_part_size: int = DEFAULT_MIN_PART_SIZE) -> List[Tuple[int, int]]:
+    """Split `size` bytes into at most `parts` inclusive byte ranges of at least `min_part_size` bytes"""
+
+    parts = max(1, min(parts, size // max(min_part_size, 1)))
+    part_size = math.ceil(size / parts)
+    return [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+
+def resume_request(checkpoint: Optional[Checkpoint]) -> Tuple[int, Optional[Dict[str, str]]]:
+    """Return the offset a single-stream download resumes from and the headers requesting the rest.
+
+    The headers are None when `checkpoint` records the whole file as done.
+    """
+
+    offset = checkpoint.prefix() if checkpoint is not None and checkpoint.validator else 0
+    if not offset:
+        return 0, {}
+    if checkpoint.size is not None and offset >= checkpoint.size:
+        return offset, None
+    return offset, {"Range": f"bytes={offset}-", "If-Range": checkpoint.validator}
+
+
+def open_part(path: str, offset: int) -> BinaryIO:
+    """Open a part file for writing from `offset`, dropping anything after it"""
+
+    f = open(path, 'r+b' if offset and os.path.exists(path) else 'wb')
+    f.seek(offset)
+    f.truncate()
+    return f
+
+
+def write_chunk(f: BinaryIO, chunk: bytes, checkpoint: Optional[Checkpoint] = None, start: int = 0) -> int:
+    """Write `chunk` to `f`, recording it in `checkpoint` under the range beginning at `start`.
+
+    The data is synced to disk before it is recorded, so after a crash the checkpoint never
+    claims bytes that the part file lost.
+
+    Returns:
+        int: Number of bytes written
+    """
+
+    f.write(chunk)
+    if checkpoint is not None:
+        f.flush()
+        os.fsync(f.fileno())
+        checkpoint.advance(start, len(chunk))
+    return len(chunk)
+
+
+def stream_to_file(
+    session: requests.Session,
+    url: str,
+    path: str,
+    timeout: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint: Optional[Checkpoint] = None,
+    on_chunk: Optional[Callable[[int], None]] = None
+) -> int:
+    """Download a file over a single connection.
+
+    When `checkpoint` records a completed prefix, the transfer resumes after it with a
+    `Range` request guarded by `If-Range`. If the server sends the whole file instead,
+    the download starts over.
+
+    Returns:
+        int: Size of the file on disk
+    """
+
+    offset, headers = resume_request(checkpoint)
+    if headers is None:
+        return offset
+
+    try:
+        with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+            if response.status_code >= 400:
+                raise http_error(response.status_code, response.reason, response.headers)
+
+            if response.status_code != 206:
+                offset = 0
+                if checkpoint is not None:
+                    checkpoint.restart(response.headers)
+
+            with open_part(path, offset) as f:
+                written = offset
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    written += write_chunk(f, chunk, checkpoint)
+                    if on_chunk is not None:
+                        on_chunk(len(chunk))
+
+    except requests.exceptions.RequestException as e:
+        raise PexelsConnectionError(f"Download failed: {str(e)}")
+
+    return written
+
+
+def download_into(
+    session: requests.Session,
+    url: str,
+    target: Union[bytearray, memoryview, BinaryIO],
+    timeout: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_chunk: Optional[Callable[[int], None]] = None
+) -> int:
+    """Download a file over a single connection into memory or a writable file object.
+
+    The body is read with `readinto` instead of iterating over chunks, so no list of
+    `bytes` objects is built up:
+
+    - a `bytearray` is grown to `Content-Length` and filled in place, or extended as
+      data arrives when the length is unknown or the decoded body turns out longer
+    - any other writable buffer (`memoryview`, `mmap`, numpy array) is filled from the start
+    - an object with a `write` method is fed slices of one reusable buffer
+
+    Returns:
+        int: Number of bytes written
+
+    Raises:
+        ValueError: If a fixed-size buffer is too small for the file
+    """
+
+    try:
+        with session.get(url, stream=True, timeout=timeout) as response:
+            if response.status_code >= 400:
+                raise http_error(response.status_code, response.reason, response.headers)
+
+            raw = response.raw
+            raw.decode_content = True
+            length = response.headers.get("Content-Length")
+            length = int(length) if length and length.isdigit() else None
+
+            if isinstance(target, bytearray):
+                def append(chunk: memoryview) -> None:
+                    target[len(target):] = chunk
+
+                if length is None:
+                    return _pump(raw, append, chunk_size, on_chunk)
+
+                start = len(target)
+                _grow(target, length, chunk_size)
+                written = 0
+                try:
+                    with memoryview(target) as view, view[start:] as tail:
+                        written = _fill(raw, tail, chunk_size, on_chunk)
+                finally:
+                    if written < length:
+                        del target[start + written:]
+                if written < length:
+                    raise PexelsConnectionError(f"Download failed: expected {length} bytes, got {written}")
+
+                # a decoded (e.g. gzip) body can be longer than its Content-Length
+                extra = raw.read(1)
+                if extra:
+                    target += extra
+                    if on_chunk is not None:
+                        on_chunk(len(extra))
+                    written += len(extra) + _pump(raw, append, chunk_size, on_chunk)
+                return written
+
+            if hasattr(target, "write"):
+                return _pump(raw, target.write, chunk_size, on_chunk)
+
+            with memoryview(target) as base, base.cast("B") as view:
+                if view.readonly:
+                    raise ValueError("Buffer is read-only")
+                if length is not None and length > len(view):
+                    raise ValueError(f"Buffer of {len(view)} bytes is too small for {length} bytes")
+
+                written = _fill(raw, view, chunk_size, on_chunk)
+                if written == len(view) and raw.read(1):
+                    raise ValueError(f"Buffer of {len(view)} bytes is too small for the file")
+                return written
+
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+        raise PexelsConnectionError(f"Download failed: {str(e)}")
+
+
+def rewinder(target: Union[bytearray, memoryview, BinaryIO]) -> Optional[Callable[[], None]]:
+    """Return a function restoring `target` to its current state before a retried download.
+
+    Returns None for streams that cannot be rewound.
+    """
+
+    if isinstance(target, bytearray):
+        start = len(target)
+
+        def rewind() -> None:
+            del target[start:]
+
+        return rewind
+
+    if hasattr(target, "write"):
+        if not (hasattr(target, "seekable") and target.seekable()):
+            return None
+
+        start = target.tell()
+
+        def rewind() -> None:
+            target.seek(start)
+            target.truncate()
+
+        return rewind
+
+    # fixed-size buffers are refilled from the start
+    return lambda: None
+
+
+def iter_chunks(
+    session: requests.Session,
+    url: str,
+    timeout: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Stream a file over a single connection, yielding its body in chunks of up to `chunk_size` bytes"""
+
+    try:
+        with session.get(url, stream=True, timeout=timeout) as response:
+            if response.status_code >= 400:
+                raise http_error(response.status_code, response.reason, response.headers)
+
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    except requests.exceptions.RequestException as e:
+        raise PexelsConnectionError(f"Download failed: {str(e)}")
+
+
+def _grow(target: bytearray, n: int, chunk_size: int) -> None:
+    """Extend `target` by `n` zero bytes in place, without a temporary buffer of `n` bytes"""
+
+    zeros = bytes(min(n, chunk_size))
+    with memoryview(zeros) as view:
+        while n > 0:
+            step = min(n, len(zeros))
+            with view[:step] as part:
+                target += part
+            n -= step
+
+
+def _fill(raw: Any, view: memoryview, chunk_size: int, on_chunk: Optional[Callable[[int], None]]) -> int:
+    """Read from `raw` straight into `view` until it is full or the body ends"""
+
+    filled = 0
+    while filled < len(view):
+        with view[filled:filled + chunk_size] as part:
+            n = raw.readinto(part)
+        if not n:
+            break
+        filled += n
+        if on_chunk is not None:
+            on_chunk(n)
+    return filled
+
+
+def _pump(raw: Any, write: Callable[[memoryview], Any], chunk_size: int, on_chunk: Optional[Callable[[int], None]]) -> int:
+    """Copy `raw` to `write` through one reusable buffer"""
+
+    buffer = bytearray(chunk_size)
+    written = 0
+    with memoryview(buffer) as view:
+        while True:
+            n = raw.readinto(buffer)
+            if not n:
+                break
+            with view[:n] as part:
+                write(part)
+            written += n
+            if on_chunk is not None:
+                on_chunk(n)
+    return written
+
+
+def fetch_range(
+    session: requests.Session,
+    url: str,
+    path: str,
+    start: int,
+    end: int,
+    timeout: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint: Optional[Checkpoint] = None,
+    on_chunk: Optional[Callable[[int], None]] = None
+) -> int:
+    """Download the inclusive byte range `start`-`end` into an existing file at the same offset.
+
+    With a `checkpoint`, bytes of the range already recorded as done are skipped and new
+    progress is recorded after each chunk.
+
+    Returns:
+        int: Number of bytes of the range on disk
+
+    Raises:
+        RangeNotSupported: If the server answered with the whole file instead of the range
+    """
+
+    done = 0
+    if checkpoint is not None:
+        done = next((d for s, _, d in checkpoint.ranges if s == start), 0)
+        if done >= end - start + 1:
+            return done
+
+    headers = {"Range": f"bytes={start + done}-{end}"}
+    if checkpoint is not None and checkpoint.validator:
+        headers["If-Range"] = checkpoint.validator
+
+    written = done
+    try:
+        with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+            if response.status_code == 200:
+                raise RangeNotSupported(url)
+            if response.status_code >= 400:
+                raise http_error(response.status_code, response.reason, response.headers)
+
+            with open(path, 'r+b') as f:
+                f.seek(start + done)
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    written += write_chunk(f, chunk, checkpoint, start)
+                    if on_chunk is not None:
+                        on_chunk(len(chunk))
+
+    except requests.exceptions.RequestException as e:
+        raise PexelsConnectionError(f"Download failed: {str(e)}")
+
+    if written != end - start + 1:
+        raise PexelsConnectionError(f"Download failed: expected {end - start + 1} bytes for range {start}-{end}, got {written}")
+
+    return written
+
+
+def download_file(
+    session: requests.Session,
+    url: str,
+    path: str,
+    timeout: float,
+    connections: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    min_part_size: int = DEFAULT_MIN_PART_SIZE,
+    resume: bool = True,
+    on_chunk: Optional[Callable[[int], None]] = None
+) -> int:
+    """Download a file, fetching byte ranges over several pooled connections when the server allows it.
+
+    A HEAD request reveals `Content-Length` and `Accept-Ranges`. The target file is
+    preallocated and each range is written at its offset. Falls back to a single stream
+    when ranges are unsupported, the size is unknown or the file is too small to split.
+
+    Data is written to `{path}.part` and moved to `path` only once complete, so readers
+    never see a half-written file. With `resume`, progress is checkpointed to
+    `{path}.part.json` and an interrupted download continues where it stopped.
+
+    Args:
+        session (requests.Session): Session whose connection pool is used
+        url (str): File URL
+        path (str): Destination file path
+        timeout (float): Per-request timeout in seconds
+        connections (int, optional): Maximum concurrent range requests (default: `4`)
+        chunk_size (int, optional): Read size in bytes (default: 1 MiB)
+        min_part_size (int, optional): Smallest range worth its own connection (default: 4 MiB)
+        resume (bool, optional): Resume from, and record, a partial download (default: `True`)
+        on_chunk (Callable[[int], None], optional): Called with the size of every chunk received, possibly from several threads
+
+    Returns:
+        int: Number of bytes written
+    """
+
+    part_path = f"{path}{PART_SUFFIX}"
+    checkpoint_path = f"{path}{CHECKPOINT_SUFFIX}"
+
+    checkpoint = Checkpoint.load(checkpoint_path, url) if resume else None
+    if checkpoint is not None and not os.path.exists(part_path):
+        checkpoint = None
+
+    written = None
+    if connections > 1:
+        remote = probe(session, url, timeout)
+        if checkpoint is not None and not checkpoint.matches(remote):
+            checkpoint = None
+
+        if remote.accepts_ranges and remote.size:
+            ranges = split_ranges(remote.size, connections, min_part_size)
+            if len(ranges) > 1:
+                written = _download_ranges(session, url, part_path, checkpoint_path, remote, ranges, timeout, chunk_size, checkpoint, resume, on_chunk)
+                if written is None:
+                    checkpoint = None
+
+    if written is None:
+        if checkpoint is None and resume:
+            checkpoint = Checkpoint(checkpoint_path, url)
+        written = stream_to_file(session, url, part_path, timeout, chunk_size, checkpoint, on_chunk)
+
+    os.replace(part_path, path)
+    if checkpoint is not None:
+        checkpoint.remove()
+
+    return written
+
+
+def _download_ranges(
+    session: requests.Session,
+    url: str,
+    part_path: str,
+    checkpoint_path: str,
+    remote: RemoteFile,
+    ranges: List[Tuple[int, int]],
+    timeout: float,
+    chunk_size: int,
+    checkpoint: Optional[Checkpoint],
+    resume: bool,
+    on_chunk: Optional[Callable[[int], None]]
+) -> Optional[int]:
+    """Fetch `ranges` concurrently into the part file, or return None if the server ignores ranges"""
+
+    layout = [[start, end] for start, end in ranges]
+    if checkpoint is not None and [r[:2] for r in checkpoint.ranges] != layout:
+        checkpoint = None
+
+    if checkpoint is None:
+        with open(part_path, 'wb') as f:
+            f.truncate(remote.size)
+
+        if resume:
+            checkpoint = Checkpoint(
+                checkpoint_path,
+                url,
+                remote.size,
+                remote.etag,
+                remote.last_modified,
+                [[start, end, 0] for start, end in ranges]
+            )
+            checkpoint.save()
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(fetch_range, session, url, part_path, start, end, timeout, chunk_size, checkpoint, on_chunk)
+                for start, end in ranges
+            ]
+            return sum(future.result() for future in futures)
+    except RangeNotSupported:
+        if checkpoint is not None:
+            checkpoint.remove()
+        return None
@@ -0,0 +1,31 @@
+from typing import Optional, Mapping
+
+
+class PexelsAPIError(Exception):
+    """Custom exception for Pexels API errors"""
+
+    def __init__(self, message: str = "", status_code: Optional[int] = None, headers: Optional[Mapping[str, str]] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+
+
+class PexelsRateLimitError(PexelsAPIError):
+    """Raised when the API rate limit is exceeded, or would be by the next call"""
+    pass
+
+
+class PexelsConnectionError(PexelsAPIError):
+    """Raised when a request fails before an HTTP response is received"""
+    pass
+
+
+def http_error(status_code: int, text: str, headers: Optional[Mapping[str, str]] = None) -> PexelsAPIError:
+    """Build the PexelsAPIError for an unsuccessful HTTP status"""
+
+    if status_code == 429:
+        return PexelsRateLimitError("API rate limit exceeded. Please wait before making more requests.", status_code, headers)
+    elif status_code == 403:
+        return PexelsAPIError("Invalid API key or insufficient permissions.", status_code, headers)
+    else:
+        return PexelsAPIError(f"HTTP error {status_code}: {text}", status_code, headers)
@@ -0,0 +1,355 @@
+import os
+import re
+import json
+import gzip
+from functools import partial
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+try:
+    import pyarrow.parquet as parquet
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    parquet = None
+
+from .pagination import page_items, result_key, validate_max_items
+from .table import PhotoTable, VideoTable
+from .utils import validate_pagination
+
+
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+
+# result keys exportable to Parquet, by the table holding their rows
+PARQUET_TABLES = {"photos": PhotoTable, "videos": VideoTable}
+
+PART_PATTERN = re.compile(r"^part-(\d+)\.parquet$")
+
+
+@dataclass
+class ExportResult:
+    path: str
+    # rows in the output, including those written before a resume
+    rows: int
+    # pages fetched by this call
+    pages: int
+    # page the export resumed from, or None if it started fresh
+    resumed_from: Optional[int] = None
+
+
+@dataclass
+class ExportCheckpoint:
+    """Sidecar file recording how far an export got.
+
+    Everything before `next_page` is durably written: `offset` bytes of a JSONL file, or
+    the first `parts[kind]` part files of a Parquet directory. `source` identifies the
+    export so a checkpoint is only resumed by the same call.
+    """
+
+    path: str
+    source: str
+    next_page: int
+    rows: int = 0
+    offset: int = 0
+    parts: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str, source: str) -> Optional["ExportCheckpoint"]:
+        """Load the checkpoint of `source`, or return None if it is missing, unreadable or for another export"""
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get('source') != source:
+            return None
+
+        return cls(path, source, data['next_page'], data.get('rows', 0), data.get('offset', 0), data.get('parts', {}))
+
+
+    def save(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "source": self.source,
+                "next_page": self.next_page,
+                "rows": self.rows,
+                "offset": self.offset,
+                "parts": self.parts,
+            }, f)
+        os.replace(tmp_path, self.path)
+
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _JsonlWriter:
+    """Write one JSON object per line, each page as its own gzip member or zstd frame"""
+
+    def __init__(self, path: str, compression: Optional[str], checkpoint: Optional[ExportCheckpoint]):
+        if compression == "gzip":
+            self._compress = gzip.compress
+        elif compression == "zstd":
+            if zstandard is None:
+                raise ImportError("zstd compression requires zstandard. Install it with `pip install zstandard`.")
+            self._compress = zstandard.ZstdCompressor().compress
+        else:
+            self._compress = None
+
+        if checkpoint is not None:
+            self._file = open(path, 'r+b')
+            # drop whatever was written after the last checkpoint
+            self._file.truncate(checkpoint.offset)
+            self._file.seek(checkpoint.offset)
+        else:
+            self._file = open(path, 'wb')
+
+
+    def write_page(self, items: List[Dict[str, Any]], key: Optional[str]) -> bool:
+        """Write a page's items, returning True as they are always durable afterwards"""
+
+        data = "".join(json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n" for item in items).encode("utf-8")
+        if self._compress is not None:
+            data = self._compress(data)
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return True
+
+
+    def commit(self, checkpoint: ExportCheckpoint) -> None:
+        checkpoint.offset = self._file.tell()
+
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """Buffer rows into tables and write each full row group as its own part file.
+
+    Parts are written to `photos/part-00000.parquet`, `videos/part-00000.parquet`, ...
+    inside the output directory; collection media is split between the two by item type.
+    """
+
+    def __init__(self, path: str, compression: Optional[str], row_group_size: int, checkpoint: Optional[ExportCheckpoint]):
+        if parquet is None:
+            raise ImportError("Parquet export requires pyarrow. Install it with `pip install pyarrow`.")
+
+        self.path = path
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.parts: Dict[str, int] = dict(checkpoint.parts) if checkpoint is not None else {}
+        self._tables = {kind: table() for kind, table in PARQUET_TABLES.items()}
+
+        # remove parts from a previous export, or written after the last checkpoint
+        for kind in PARQUET_TABLES:
+            directory = os.path.join(path, kind)
+            os.makedirs(directory, exist_ok=True)
+            for name in os.listdir(directory):
+                match = PART_PATTERN.match(name)
+                if name.endswith(".tmp") or (match and int(match.group(1)) >= self.parts.get(kind, 0)):
+                    os.remove(os.path.join(directory, name))
+
+
+    def write_page(self, items: List[Dict[str, Any]], key: Optional[str]) -> bool:
+        """Buffer a page's items, returning True if every buffered row has been written"""
+
+        if key not in PARQUET_TABLES and key != "media":
+            raise ValueError(f"Parquet export supports photo and video results, not `{key}`")
+
+        for item in items:
+            kind = key if key != "media" else ("videos" if item.get('type', '') == 'Video' else "photos")
+            self._tables[kind].append(item)
+
+        if sum(len(table) for table in self._tables.values()) < self.row_group_size:
+            return False
+        self._flush()
+        return True
+
+
+    def commit(self, checkpoint: ExportCheckpoint) -> None:
+        checkpoint.parts = dict(self.parts)
+
+
+    def close(self) -> None:
+        self._flush()
+
+
+    def _flush(self) -> None:
+        for kind, table in self._tables.items():
+            if not len(table):
+                continue
+
+            index = self.parts.get(kind, 0)
+            part_path = os.path.join(self.path, kind, f"part-{index:05d}.parquet")
+            tmp_path = f"{part_path}.tmp"
+            parquet.write_table(table.to_arrow(), tmp_path, compression=self.compression or "snappy")
+            os.replace(tmp_path, part_path)
+
+            self.parts[kind] = index + 1
+            self._tables[kind] = PARQUET_TABLES[kind]()
+
+
+class MetadataExporter:
+    """Stream paginated API results to JSONL or Parquet with bounded memory.
+
+    Pages are fetched one at a time (or `prefetch` ahead) and written as they arrive,
+    so only one page, or one Parquet row group, is held in memory. Progress is recorded
+    in a `<path>.checkpoint.json` sidecar after each durable write; if an export is
+    interrupted, running the same export again resumes from the first page that was not
+    fully written instead of starting over. The sidecar is removed once it completes.
+
+    JSONL files may be gzip or zstd compressed, with each page in its own member/frame,
+    which standard tools read as one stream. Parquet output is a directory with `photos/`
+    and `videos/` subdirectories of part files, one row group each, holding the columns of
+    `PhotoTable`/`VideoTable`; read them with `pyarrow.parquet.read_table(f"{path}/photos")`.
+
+    Args:
+        client (Pexels): Client whose page methods are exported
+        path (str): Output file, or directory for Parquet
+        format (str, optional): `jsonl` or `parquet` (default: `parquet` if `path` ends with `.parquet`, else `jsonl`)
+        compression (str, optional): `gzip` or `zstd` for JSONL, a Parquet codec for Parquet (default: from a `.gz`/`.zst` suffix, else none for JSONL and `snappy` for Parquet)
+        row_group_size (int, optional): Rows per Parquet row group (default: `10000`)
+        resume (bool, optional): Resume an interrupted export of the same call (default: `True`)
+
+    Raises:
+        ValueError: If the format or compression is unknown
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        row_group_size: int = 10_000,
+        resume: bool = True
+    ):
+        path = os.fspath(path)
+        if format is None:
+            format = "parquet" if path.endswith(".parquet") else "jsonl"
+        if format not in ("jsonl", "parquet"):
+            raise ValueError("format must be either `jsonl` or `parquet`")
+
+        if compression is None and format == "jsonl":
+            if path.endswith(".gz"):
+                compression = "gzip"
+            elif path.endswith((".zst", ".zstd")):
+                compression = "zstd"
+        if format == "jsonl" and compression not in (None, "gzip", "zstd"):
+            raise ValueError("JSONL compression must be `gzip` or `zstd`")
+
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be >= 1")
+
+        self.client = client
+        self.path = path
+        self.format = format
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.resume = resume
+        self.checkpoint_path = path.rstrip("/\\") + CHECKPOINT_SUFFIX
+
+
+    def export(
+        self,
+        method: Callable[..., Dict[str, Any]],
+        *args: Any,
+        page: int = 1,
+        per_page: int = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        **kwargs: Any
+    ) -> ExportResult:
+        """Export every result of a paginated client method.
+
+        Args:
+            method (Callable): Page method of the client, e.g. `pexels.search_photos` or `pexels.get_collection_media`
+            *args: Positional arguments of `method`, e.g. the query
+            page (int, optional): First page to export (default: `1`)
+            per_page (int, optional): Results per page, max `80` (default: `80`)
+            max_items (int, optional): Stop after this many rows (default: all results)
+            prefetch (int, optional): Pages to fetch concurrently ahead of the writer (default: `0`, sequential)
+            **kwargs: Keyword arguments of `method`, e.g. `orientation` or `media_type`
+
+        Returns:
+            ExportResult: Rows and pages written by this call
+
+        Raises:
+            PexelsAPIError: If an API request fails; the export can then be resumed
+            ValueError: If parameters are invalid
+        """
+
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+
+        source = json.dumps(
+            [getattr(method, "__name__", repr(method)), args, sorted(kwargs.items()), page, per_page, max_items, self.format, self.compression],
+            default=str
+        )
+        checkpoint = ExportCheckpoint.load(self.checkpoint_path, source) if self.resume else None
+        if checkpoint is not None and self.format == "jsonl" and not self._has_bytes(checkpoint.offset):
+            checkpoint = None
+        resumed_from = checkpoint.next_page if checkpoint is not None else None
+
+        if self.format == "jsonl":
+            writer = _JsonlWriter(self.path, self.compression, checkpoint)
+        else:
+            writer = _ParquetWriter(self.path, self.compression, self.row_group_size, checkpoint)
+
+        if checkpoint is None:
+            checkpoint = ExportCheckpoint(self.checkpoint_path, source, page)
+            writer.commit(checkpoint)
+            checkpoint.save()
+
+        rows = checkpoint.rows
+        pages = 0
+        remaining = None if max_items is None else max_items - rows
+        try:
+            if remaining is None or remaining > 0:
+                responses = self.client._iter_pages(partial(method, *args, **kwargs), checkpoint.next_page, per_page, remaining, prefetch)
+                for number, response in enumerate(responses, checkpoint.next_page):
+                    items = page_items(response)
+                    if remaining is not None:
+                        items = items[:max_items - rows]
+
+                    durable = writer.write_page(items, result_key(response))
+                    rows += len(items)
+                    pages += 1
+
+                    if durable:
+                        checkpoint.next_page = number + 1
+                        checkpoint.rows = rows
+                        writer.commit(checkpoint)
+                        checkpoint.save()
+
+                    if max_items is not None and rows >= max_items:
+                        break
+            writer.close()
+        except BaseException:
+            # keep the checkpoint; buffered rows are refetched on resume
+            if self.format == "jsonl":
+                writer.close()
+            raise
+
+        checkpoint.remove()
+        return ExportResult(self.path, rows, pages, resumed_from)
+
+
+    def _has_bytes(self, offset: int) -> bool:
+        """Whether the output file still holds the `offset` bytes recorded by a checkpoint"""
+
+        try:
+            return os.path.getsize(self.path) >= offset
+        except OSError:
+            return False
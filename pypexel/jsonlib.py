@@ -0,0 +1,63 @@
+import json
+import importlib
+from typing import Any, Callable, Optional, Tuple
+
+
+# optional decoders, fastest first; the standard library is the fallback
+JSON_BACKENDS = ("orjson", "msgspec", "ujson", "json")
+
+
+def _load_backend(name: str) -> Callable[[bytes], Any]:
+    """Import a backend and return its bytes decoder. Every backend raises a ValueError subclass on bad input."""
+
+    if name == "json":
+        return json.loads
+
+    module = importlib.import_module(name)
+    if name == "msgspec":
+        return module.json.Decoder().decode
+    return module.loads
+
+
+def json_decoder(backend: Optional[str] = None) -> Tuple[str, Callable[[bytes], Any]]:
+    """Return the name and decoding function of a JSON backend.
+
+    Args:
+        backend (str, optional): One of `JSON_BACKENDS` (default: the fastest one installed)
+
+    Returns:
+        Tuple[str, Callable]: Backend name and a function decoding UTF-8 bytes
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the requested backend is not installed
+    """
+
+    if backend is not None:
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend `{backend}`. Available: {list(JSON_BACKENDS)}")
+        return backend, _load_backend(backend)
+
+    for name in JSON_BACKENDS:
+        try:
+            return name, _load_backend(name)
+        except ImportError:
+            continue
+
+    return "json", json.loads  # pragma: no cover - the standard library is always available
+
+
+def decode_response(response: Any, loads: Callable[[bytes], Any]) -> Any:
+    """Decode the JSON body of a response with `loads`.
+
+    Response objects without a bytes `content`, such as those of custom transports,
+    are decoded with their own `json()`.
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+
+    content = getattr(response, "content", None)
+    if not isinstance(content, bytes):
+        return response.json()
+    return loads(content)
@@ -0,0 +1,300 @@
+import os
+import time
+import heapq
+import itertools
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+from typing import Optional, Callable, Dict, List, Tuple, Union
+
+from .download import DEFAULT_CHUNK_SIZE
+from .models import Photo, Video
+from .utils import LazyVideo
+from .pypexel import Pexels, select_video_file
+from .renditions import photo_url, url_extension
+
+
+@dataclass
+class DownloadJob:
+    media: Union[Photo, Video]
+    url: str
+    path: str
+    priority: int = 0
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc
+
+
+@dataclass
+class DownloadResult:
+    job: DownloadJob
+    bytes: int = 0
+    elapsed: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class DownloadProgress:
+    job: DownloadJob
+    downloaded: int
+    done: bool
+    completed_jobs: int
+    total_jobs: int
+    total_bytes: int
+
+
+@dataclass
+class DownloadReport:
+    succeeded: List[DownloadResult] = field(default_factory=list)
+    failed: List[DownloadResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(result.bytes for result in self.succeeded)
+
+
+class BandwidthThrottle:
+    """Token bucket limiting the aggregate byte rate of several threads.
+
+    Args:
+        rate (float): Bytes per second
+        burst (int, optional): Bytes that may be consumed at once (default: one second of `rate`)
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+
+        self.rate = rate
+        self.burst = burst or int(rate)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+
+    def consume(self, n: int) -> None:
+        """Block until `n` bytes may be transferred"""
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= n
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def media_url(media: Union[Photo, Video], rendition: Optional[str] = None) -> Tuple[str, str]:
+    """Return the URL of a rendition and a default file name for it.
+
+    Photos take a `PhotoSRC` field name (default: `original`); videos take a quality
+    (`sd`, `hd`, `uhd`; default: the widest file available).
+
+    Raises:
+        ValueError: If the rendition is not available
+    """
+
+    if isinstance(media, (Video, LazyVideo)):
+        if rendition is None:
+            if not media.video_files:
+                raise ValueError(f"Video {media.id} has no video files")
+            selected = max(media.video_files, key=lambda v: v.width or 0)
+        else:
+            selected = select_video_file(media, rendition)
+        return selected.link, f"{media.id}_{rendition or selected.quality}.mp4"
+
+    rendition = rendition or "original"
+    url = photo_url(media, rendition)
+    return url, f"{media.id}_{rendition}{url_extension(url)}"
+
+
+class DownloadManager:
+    """Download many photos and videos on a bounded worker pool.
+
+    Jobs run highest `priority` first (ties in the order they were added), with at most
+    `per_host_limit` concurrent downloads per host and an optional aggregate bandwidth cap.
+    Downloads share the client's session, retry policy and download store, and resume from
+    `.part` files.
+
+    Args:
+        client (Pexels): Client whose session and retry policy are used
+        directory (str, optional): Directory files are written to (default: current directory)
+        max_workers (int, optional): Concurrent downloads (default: `4`)
+        per_host_limit (int, optional): Concurrent downloads per host (default: no limit)
+        bandwidth_limit (float, optional): Aggregate download rate in bytes per second (default: no limit)
+        progress (Callable[[DownloadProgress], None], optional): Called from worker threads on every chunk and when a job finishes
+        connections (int, optional): Connections per file, see `download_file` (default: `1`)
+        chunk_size (int, optional): Read size in bytes (default: 1 MiB)
+    """
+
+    def __init__(
+        self,
+        client: Pexels,
+        directory: str = ".",
+        max_workers: int = 4,
+        per_host_limit: Optional[int] = None,
+        bandwidth_limit: Optional[float] = None,
+        progress: Optional[Callable[[DownloadProgress], None]] = None,
+        connections: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if per_host_limit is not None and per_host_limit < 1:
+            raise ValueError("per_host_limit must be >= 1")
+
+        self.client = client
+        self.directory = directory
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.throttle = BandwidthThrottle(bandwidth_limit) if bandwidth_limit else None
+        self.progress = progress
+        self.connections = connections
+        self.chunk_size = chunk_size
+
+        # host -> heap of (-priority, sequence, job)
+        self._queues: Dict[str, list] = {}
+        self._active: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+        self._total_jobs = 0
+        self._completed_jobs = 0
+        self._total_bytes = 0
+
+
+    def add(
+        self,
+        media: Union[Photo, Video],
+        rendition: Optional[str] = None,
+        priority: int = 0,
+        filename: Optional[str] = None
+    ) -> DownloadJob:
+        """Queue a photo or video for download.
+
+        Args:
+            media (Photo or Video): Media to download
+            rendition (str, optional): Photo size (e.g. `original`, `large2x`, `medium`) or video quality (`sd`, `hd`, `uhd`)
+            priority (int, optional): Higher priorities are downloaded first (default: `0`)
+            filename (str, optional): File name inside `directory` (default: `{id}_{rendition}.{ext}`)
+
+        Returns:
+            DownloadJob: The queued job
+
+        Raises:
+            ValueError: If the rendition is not available
+        """
+
+        url, default_name = media_url(media, rendition)
+        job = DownloadJob(media, url, os.path.join(self.directory, filename or default_name), priority)
+
+        with self._condition:
+            heapq.heappush(self._queues.setdefault(job.host, []), (-priority, next(self._sequence), job))
+            self._total_jobs += 1
+            self._condition.notify()
+
+        return job
+
+
+    def run(self) -> DownloadReport:
+        """Download every queued job and block until all have finished.
+
+        Returns:
+            DownloadReport: Successful and failed downloads with byte counts and timings
+        """
+
+        report = DownloadReport()
+        started = time.monotonic()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        workers = [threading.Thread(target=self._worker, args=(report,), daemon=True) for _ in range(self.max_workers)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        report.elapsed = time.monotonic() - started
+        return report
+
+
+    def _next_job(self) -> Optional[DownloadJob]:
+        """Pop the highest priority job whose host has capacity, waiting if all hosts are busy"""
+
+        with self._condition:
+            while True:
+                candidates = [
+                    (queue[0], host) for host, queue in self._queues.items()
+                    if queue and (self.per_host_limit is None or self._active.get(host, 0) < self.per_host_limit)
+                ]
+
+                if candidates:
+                    _, host = min(candidates, key=lambda c: c[0][:2])
+                    _, _, job = heapq.heappop(self._queues[host])
+                    self._active[host] = self._active.get(host, 0) + 1
+                    return job
+
+                if not any(self._queues.values()):
+                    return None
+
+                self._condition.wait()
+
+
+    def _worker(self, report: DownloadReport) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            result = self._download(job)
+
+            with self._condition:
+                self._active[job.host] -= 1
+                self._completed_jobs += 1
+                (report.succeeded if result.ok else report.failed).append(result)
+                self._condition.notify_all()
+
+            self._report(job, result.bytes, True)
+
+
+    def _download(self, job: DownloadJob) -> DownloadResult:
+        result = DownloadResult(job)
+        started = time.monotonic()
+
+        def on_chunk(n: int) -> None:
+            if self.throttle is not None:
+                self.throttle.consume(n)
+            result.bytes += n
+            with self._condition:
+                self._total_bytes += n
+            self._report(job, result.bytes, False)
+
+        try:
+            self.client._download_to_path(job.url, job.path, job.media.id, self.connections, self.chunk_size, on_chunk)
+        except Exception as e:
+            result.error = e
+
+        result.elapsed = time.monotonic() - started
+        return result
+
+
+    def _report(self, job: DownloadJob, downloaded: int, done: bool) -> None:
+        if self.progress is None:
+            return
+
+        self.progress(DownloadProgress(
+            job=job,
+            downloaded=downloaded,
+            done=done,
+            completed_jobs=self._completed_jobs,
+            total_jobs=self._total_jobs,
+            total_bytes=self._total_bytes
+        ))
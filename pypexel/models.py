@@ -1,74 +1,122 @@
-from typing import List
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass, field, fields
 
-@dataclass
+
+def _hash_by_id(self) -> int:
+    return hash(self.id)
+
+
+def model(cls):
+    """Declare an API object: a frozen dataclass with `__slots__` instead of a per-instance `__dict__`.
+
+    Objects with an `id` are hashed by it, so they can be deduplicated in sets and used
+    as dict keys; equality still compares every field. Slots are added by rebuilding the
+    class, as `dataclass(slots=True)` needs Python 3.10: field defaults are dropped from
+    the class namespace (`__init__` keeps its own copy) and pickling goes through
+    `__getstate__`/`__setstate__` so frozen instances can be restored.
+    """
+
+    cls = dataclass(frozen=True)(cls)
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names and k not in ("__dict__", "__weakref__")}
+    namespace["__slots__"] = names
+    if "id" in names:
+        namespace["__hash__"] = _hash_by_id
+
+    def __getstate__(self):
+        return [getattr(self, name) for name in names]
+
+    def __setstate__(self, state):
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+
+    namespace["__getstate__"] = __getstate__
+    namespace["__setstate__"] = __setstate__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+# Field defaults match those `pypexel.utils.parse_*` use for keys missing from a response.
+
+
+@model
 class PhotoSRC:
-    original: str
-    large: str
-    large2x: str
-    medium: str
-    small: str
-    portrait: str
-    landscape: str
-    tiny: str
+    original: str = ''
+    large: str = ''
+    large2x: str = ''
+    medium: str = ''
+    small: str = ''
+    portrait: str = ''
+    landscape: str = ''
+    tiny: str = ''
 
 
-@dataclass
+@model
 class Photo:
-    id: int
-    width: int
-    height: int
-    url: str
-    photographer: str
-    photographer_url: str
-    photographer_id: int
-    avg_color: str
-    src: PhotoSRC
-    alt: str
+    id: int = 0
+    width: int = 0
+    height: int = 0
+    url: str = ''
+    photographer: str = ''
+    photographer_url: str = ''
+    photographer_id: int = 0
+    avg_color: str = ''
+    src: PhotoSRC = PhotoSRC()
+    alt: str = ''
 
 
-@dataclass
+@model
 class VideoFile:
-    id: int
-    quality: str
-    file_type: str
-    width: int
-    height: int
-    fps: float
-    link: str
+    id: int = 0
+    quality: str = ''
+    file_type: str = ''
+    # dimensions and fps are null for adaptive (HLS) streams
+    width: Optional[int] = 0
+    height: Optional[int] = 0
+    fps: Optional[float] = 0.0
+    link: str = ''
+    # file size in bytes, when reported by the API
+    size: Optional[int] = None
 
-@dataclass
+
+@model
 class VideoPicture:
-    id: int
-    picture: str
-    nr: int
+    id: int = 0
+    picture: str = ''
+    nr: int = 0
 
-@dataclass
+
+@model
 class User:
-    id: int
-    name: str
-    url: str
+    id: int = 0
+    name: str = ''
+    url: str = ''
 
 
-@dataclass
+@model
 class Video:
-    id: int
-    width: int
-    height: int
-    url: str
-    image: str
-    duration: int
-    user: User
-    video_files: List[VideoFile]
-    video_pictures: List[VideoFile]
+    id: int = 0
+    width: int = 0
+    height: int = 0
+    url: str = ''
+    image: str = ''
+    duration: int = 0
+    user: User = User()
+    video_files: List[VideoFile] = field(default_factory=list)
+    video_pictures: List[VideoPicture] = field(default_factory=list)
 
 
-@dataclass
+@model
 class Collection:
-    id: str
-    title: str
-    description: str
-    private: bool
-    media_count: int
-    photos_count: int
-    videos_count: int
\ No newline at end of file
+    id: str = ''
+    title: str = ''
+    description: str = ''
+    private: bool = True
+    media_count: int = 0
+    photos_count: int = 0
+    videos_count: int = 0
+
+
+@dataclass
+class BatchResult:
+    results: Dict[Union[int, str], Any] = field(default_factory=dict)
+    errors: Dict[Union[int, str], Exception] = field(default_factory=dict)
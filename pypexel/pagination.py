@@ -0,0 +1,84 @@
+import math
+from typing import Dict, Any, List, Optional
+
+from .utils import (
+    parse_photo,
+    parse_video,
+    parse_collection
+)
+
+
+# keys holding the result items of each paginated endpoint
+RESULT_KEYS = ("photos", "videos", "media", "collections")
+
+
+def result_key(response: Dict[str, Any]) -> Optional[str]:
+    """Return the key holding the result items of a paginated API response"""
+
+    for key in RESULT_KEYS:
+        if key in response:
+            return key
+    return None
+
+
+def page_items(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the result items of a paginated API response"""
+
+    key = result_key(response)
+    return (response[key] or []) if key else []
+
+
+def parse_item(item: Dict[str, Any], key: str, lazy: bool = False) -> Any:
+    """Parse a raw result item into its dataclass, based on the response key it came from.
+
+    Photos and videos are wrapped in their lazy variants if `lazy`.
+    """
+
+    if key == "photos":
+        return parse_photo(item, lazy)
+    if key == "videos":
+        return parse_video(item, lazy)
+    if key == "collections":
+        return parse_collection(item)
+    if item.get('type', '') == 'Video':
+        return parse_video(item, lazy)
+    return parse_photo(item, lazy)
+
+
+def has_next_page(response: Dict[str, Any], page: int, per_page: int) -> bool:
+    """Whether another page follows `page`, using `next_page` or `total_results`"""
+
+    if not page_items(response):
+        return False
+    if "next_page" in response:
+        return bool(response["next_page"])
+    if response.get("total_results") is not None:
+        return page * per_page < response["total_results"]
+    return len(page_items(response)) >= per_page
+
+
+def last_page(response: Dict[str, Any], page: int, per_page: int, max_items: Optional[int] = None) -> Optional[int]:
+    """Return the last page worth fetching when starting at `page`, or None if `total_results` is unknown"""
+
+    total_results = response.get("total_results")
+    if total_results is None:
+        return None
+
+    final = math.ceil(total_results / per_page)
+    if max_items is not None:
+        final = min(final, page + math.ceil(max_items / per_page) - 1)
+    return final
+
+
+def validate_max_items(max_items: Optional[int]) -> None:
+    """Validate a pagination item cap"""
+
+    if max_items is not None and max_items < 0:
+        raise ValueError("max_items must be >= 0")
+
+
+def validate_prefetch(prefetch: int) -> None:
+    """Validate a page prefetch window"""
+
+    if prefetch < 0:
+        raise ValueError("prefetch must be >= 0")
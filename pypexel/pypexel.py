@@ -1,22 +1,65 @@
 import os
+import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import partial
 from urllib.parse import urljoin
-from typing import Optional, Dict, Any, Union
-
-from .models import Photo, Video, Collection
+from typing import Optional, Dict, Any, Union, Callable, Iterable, Iterator, Mapping, Tuple, TypeVar, BinaryIO
+
+from .cache import BaseCache, CacheEntry, make_cache_key, response_validators
+from .download import DEFAULT_CHUNK_SIZE, download_file, download_into, iter_chunks, rewinder
+from .exceptions import PexelsAPIError, PexelsConnectionError, http_error
+from .ratelimit import RateLimiter, RateLimitState, parse_rate_limit_headers
+from .retry import RetryPolicy
+from .store import DownloadStore
+from .jsonlib import json_decoder, decode_response
+from .schema import msgspec, decode_to_models, parse_models
+from .table import PhotoTable, VideoTable, media_tables
+from .singleflight import SingleFlight
+from .renditions import photo_url, select_photo_size, select_video_rendition, url_extension
+from .models import Photo, Video, VideoFile, Collection, BatchResult
 from .utils import (
     parse_photo,
     parse_video,
-    parse_collection
+    parse_collection,
+    parse_collection_media,
+    validate_query,
+    validate_pagination,
+    validate_media_type
+)
+from .pagination import (
+    result_key,
+    page_items,
+    parse_item,
+    has_next_page,
+    last_page,
+    validate_max_items,
+    validate_prefetch
 )
 
 load_dotenv()
 
+T = TypeVar("T")
+
+
+def select_video_file(video: Video, quality: str) -> VideoFile:
+    """Pick the widest file of the requested quality from a video.
+
+    Raises:
+        ValueError: If the video has no file of that quality
+    """
+
+    quality_videos = [v for v in video.video_files if v.quality == quality]
 
-class PexelsAPIError(Exception):
-    """Custom exception for Pexels API errors"""
-    pass
+    if not quality_videos:
+        available_qualities = set([v.quality for v in video.video_files])
+        raise ValueError(f"`{quality}` is not an available quality. Available: {available_qualities}")
+
+    return max(quality_videos, key=lambda v: v.width or 0)
 
 
 class Pexels:
@@ -25,7 +68,53 @@ class Pexels:
     BASE_URL = "https://api.pexels.com/v1/"
     VIDEO_BASE_URL = "https://api.pexels.com/videos/"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: float = 30,
+        cache: Optional[BaseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        store: Optional[DownloadStore] = None,
+        coalesce: bool = True,
+        lazy: bool = False,
+        json_backend: Optional[str] = None,
+        decode_models: bool = False
+    ):
+        """Create a Pexels client.
+
+        The client owns a pooled `requests.Session`, so repeated calls reuse warm
+        connections instead of opening a new TCP+TLS connection per request. Call
+        `close()` or use the client as a context manager to release the pool.
+
+        Args:
+            api_key (str, optional): Pexels API key. Defaults to the `PEXELS_API_KEY` environment variable
+            session (requests.Session, optional): Session to use instead of creating one. It is not closed by `close()`
+            pool_connections (int, optional): Number of per-host connection pools to cache (default: `10`)
+            pool_maxsize (int, optional): Maximum connections kept alive per host (default: `10`)
+            pool_block (bool, optional): Block when a host's pool is exhausted instead of opening extra connections (default: `False`)
+            keep_alive (bool, optional): Reuse connections between requests (default: `True`)
+            timeout (float, optional): Request timeout in seconds (default: `30`)
+            cache (BaseCache, optional): Response cache for API calls, e.g. `MemoryCache(ttl=600)` (default: no caching)
+            rate_limiter (RateLimiter, optional): Scheduler pacing API calls to the quota reported by the API (default: no pacing)
+            retry (RetryPolicy, optional): Retry policy for transient failures of API calls and downloads (default: no retries)
+            store (DownloadStore, optional): Content-addressed store reusing previously downloaded files (default: no store)
+            coalesce (bool, optional): Share one in-flight request between concurrent identical API calls (default: `True`).
+                Coalesced callers receive the same response object, so treat responses as read-only
+            lazy (bool, optional): Return `LazyPhoto`/`LazyVideo` objects for `as_objects=True`, parsing nested fields on first access (default: `False`)
+            json_backend (str, optional): JSON decoder for responses: `orjson`, `msgspec`, `ujson` or `json` (default: the fastest one installed)
+            decode_models (bool, optional): Decode `as_objects` results straight from the response bytes into models with msgspec,
+                skipping the intermediate dicts (default: `False`). Applies to calls made without a cache or `lazy`
+
+        Raises:
+            ValueError: If no API key is available or `json_backend` is unknown
+            ImportError: If the requested `json_backend`, or msgspec for `decode_models`, is not installed
+        """
         self.api_key = api_key or os.getenv("PEXELS_API_KEY")
         if not self.api_key:
             raise ValueError("API key is required. Provide it directly or set PEXELS_API_KEY environment variable.")
@@ -34,6 +123,66 @@ class Pexels:
             "Authorization": self.api_key,
             "User-Agent": "pypexel/0.1.1"
         }
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.store = store
+        self.lazy = lazy
+        self.json_backend, self._loads = json_decoder(json_backend)
+        if decode_models and msgspec is None:
+            raise ImportError("decode_models requires msgspec. Install it with `pip install msgspec`.")
+        self.decode_models = decode_models
+        self._flights = SingleFlight() if coalesce else None
+        # background refreshes of stale cache entries, see `BaseCache.stale_while_revalidate`
+        self._refresher: Optional[ThreadPoolExecutor] = None
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        # latest `X-Ratelimit-*` values reported by the API
+        self.rate_limit: Optional[RateLimitState] = None
+
+        self._owns_session = session is None
+        self.session = session or self._create_session(pool_connections, pool_maxsize, pool_block, keep_alive)
+
+
+    @staticmethod
+    def _create_session(pool_connections: int, pool_maxsize: int, pool_block: bool, keep_alive: bool) -> requests.Session:
+        """Create a session with a connection pool mounted for both schemes."""
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+
+    def close(self) -> None:
+        """Close the underlying session, release pooled connections and stop background cache refreshes.
+
+        Sessions passed in by the caller are left open.
+        """
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=False)
+            self._refresher = None
+
+        if self._owns_session:
+            self.session.close()
+
+
+    def __enter__(self) -> "Pexels":
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
 
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None, base_url: Optional[str] = None) -> Dict[str, Any]:
@@ -56,24 +205,199 @@ class Pexels:
         if params:
             params = { k: v for k, v in params.items() if v is not None }
 
+        key = make_cache_key(url, params)
+        entry = None
+        if self.cache is not None:
+            entry = self.cache.get_entry(key)
+            if entry is not None and entry.fresh:
+                return entry.value
+
+            if entry is not None and self.cache.can_serve_stale(entry):
+                self.cache.stats.stale_hits += 1
+                self._refresh_in_background(key, partial(self._fetch, key, url, params, endpoint, entry))
+                return entry.value
+
+        try:
+            return self._fetch(key, url, params, endpoint, entry)
+        except PexelsAPIError:
+            if entry is not None and self.cache.can_serve_on_error(entry):
+                self.cache.stats.stale_hits += 1
+                return entry.value
+            raise
+
+
+    def _fetch(
+        self,
+        key: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        endpoint: str,
+        entry: Optional[CacheEntry]
+    ) -> Dict[str, Any]:
+        """Fetch a response, sharing the call with concurrent identical requests, and cache it"""
+
+        def fetch() -> Dict[str, Any]:
+            # an expired entry with validators is revalidated with a conditional GET
+            conditional = entry.conditional_headers() if entry is not None else None
+            data, headers = self._with_retries(lambda timeout: self._send(url, params, timeout, conditional))
+
+            if self.cache is None:
+                return data
+
+            ttl = self.cache.ttl_for(endpoint)
+            if data is None:
+                self.cache.refresh(key, ttl)
+                return entry.value
+
+            etag, last_modified = response_validators(headers)
+            self.cache.set(key, data, ttl, etag, last_modified)
+            return data
+
+        if self._flights is None:
+            return fetch()
+        return self._flights.do(key, fetch)
+
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Any]) -> None:
+        """Run `fetch` on the refresh worker unless a refresh of `key` is already pending"""
+
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pypexel-refresh")
+
+        def refresh() -> None:
+            try:
+                fetch()
+            except PexelsAPIError:
+                # the stale entry stays in place and is retried on the next request
+                pass
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(refresh)
+
+
+    def _decodes_models(self) -> bool:
+        """Whether `as_objects` calls decode straight into models, see `decode_models`"""
+        return self.decode_models and self.cache is None and not self.lazy
+
+
+    def _request_models(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        base_url: Optional[str] = None,
+        shape: str = "photos"
+    ) -> Any:
+        """Make a request to the Pexels API and decode the response straight into models.
+
+        Args:
+            endpoint (str): The API endpoint
+            params (Optional[Dict[str, Any]], optional): Query parameters
+            base_url (Optional[str], optional): Base URL to use. Defaults to BASE_URL
+            shape (str, optional): Response shape, a key of `pypexel.schema.SCHEMAS` (default: `photos`)
+
+        Returns:
+            A list of models for list endpoints, else a single model
+
+        Raises:
+            PexelsAPIError: If the API request fails
+        """
+        url = urljoin(base_url or self.BASE_URL, endpoint.lstrip('/'))
+
+        if params:
+            params = { k: v for k, v in params.items() if v is not None }
+
+        loads = partial(decode_to_models, shape=shape, loads=self._loads)
+
+        def fetch() -> Any:
+            data, _ = self._with_retries(lambda timeout: self._send(url, params, timeout, loads=loads))
+            # responses without a bytes body come back as dicts, see `decode_response`
+            return parse_models(data, shape) if isinstance(data, dict) else data
+
+        if self._flights is None:
+            return fetch()
+        return self._flights.do(f"{shape}:{make_cache_key(url, params)}", fetch)
+
+
+    def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+        conditional: Optional[Dict[str, str]] = None,
+        loads: Optional[Callable[[bytes], Any]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Mapping[str, str]]:
+        """Send a single API request and decode its JSON body.
+
+        Args:
+            loads (Callable, optional): Decoder for the response bytes (default: the client's JSON backend)
+
+        Returns:
+            Tuple: The decoded body, or None if a conditional request was answered with
+                `304 Not Modified`, and the response headers
+        """
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        headers = {**self.headers, **conditional} if conditional else self.headers
+
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, headers=headers, params=params, timeout=timeout)
+            self._update_rate_limit(response.headers)
             response.raise_for_status()
-            return response.json()
 
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 429:
-                raise PexelsAPIError("API rate limit exceeded. Please wait before making more requests.")
-            elif response.status_code == 403:
-                raise PexelsAPIError("Invalid API key or insufficient permissions.")
-            else:
-                raise PexelsAPIError(f"HTTP error {response.status_code}: {response.text}")
+            raise http_error(response.status_code, response.text, response.headers)
         except requests.exceptions.RequestException as e:
-            raise PexelsAPIError(f"Request failed: {str(e)}")
+            raise PexelsConnectionError(f"Request failed: {str(e)}")
+
+        if conditional and response.status_code == 304:
+            return None, response.headers
+
+        try:
+            return decode_response(response, loads or self._loads), response.headers
         except ValueError as e:
             raise PexelsAPIError(f"Invalid JSON response: {str(e)}")
 
 
+    def _with_retries(self, send: Callable[[float], T]) -> T:
+        """Call `send(timeout)`, retrying transient failures according to the retry policy"""
+
+        if self.retry is None:
+            return send(self.timeout)
+
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return send(self.retry.attempt_timeout(self.timeout, started))
+            except PexelsAPIError as e:
+                delay = self.retry.next_delay(attempt, e, started)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+
+    def _update_rate_limit(self, headers: Dict[str, str]) -> None:
+        """Record the rate limit reported in response headers"""
+
+        state = parse_rate_limit_headers(headers)
+        if state is None:
+            return
+
+        self.rate_limit = state
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(state)
+
+
     def search_photos(
             self,
             query: str,
@@ -83,7 +407,8 @@ class Pexels:
             locale: str = None,
             page: Optional[int] = 1,
             per_page: Optional[int] = 15,
-            as_objects: Optional[bool] = False
+            as_objects: Optional[bool] = False,
+            as_table: bool = False
         ) -> dict:
         """Search for photos on Pexels
 
@@ -96,6 +421,7 @@ class Pexels:
             page (int, optional): Page number (default: `1`)
             per_page (int, optional): Results per page, max `80` (default: `15`)
             as_objects (bool, optional): Return Photo objects instead of raw dict (default: `False`)
+            as_table (bool, optional): Return the photos as a `PhotoTable` instead of raw dict (default: `False`)
 
         Returns:
             dict: API response containing photos and metadata
@@ -105,14 +431,8 @@ class Pexels:
             ValueError: If parameters are invalid
         """
 
-        if not query:
-            raise ValueError("Query parameter is required")
-        
-        if per_page > 80:
-            raise ValueError("per_page cannot exceed 80")
-        
-        if page < 1:
-            raise ValueError("page must be >= 1")
+        validate_query(query)
+        validate_pagination(page, per_page)
 
         params = {
             "query": query,
@@ -124,10 +444,16 @@ class Pexels:
             "per_page": per_page,
         }
         
+        if as_objects and self._decodes_models():
+            return self._request_models("search", params, shape="photos")
+
         response = self._make_request("search", params)
 
+        if as_table:
+            return PhotoTable(response.get('photos', []))
+
         if as_objects:
-            return [parse_photo(photo) for photo in response.get('photos', [])]
+            return [parse_photo(photo, self.lazy) for photo in response.get('photos', [])]
 
         return response
 
@@ -139,7 +465,8 @@ class Pexels:
         locale: Optional[str] = None,
         page: Optional[int] = 1,
         per_page: Optional[int] = 15,
-        as_objects: Optional[bool] = False
+        as_objects: Optional[bool] = False,
+        as_table: bool = False
     ) -> Dict[str, Any]:
         """Search for videos on Pexels
 
@@ -151,6 +478,7 @@ class Pexels:
             page (int, optional): Page number (default: `1`)
             per_page (int, optional): Results per page, max `80` (default: `15`)
             as_objects (bool, optional): Return Video objects instead of raw dict (default: `False`)
+            as_table (bool, optional): Return the videos as a `VideoTable` instead of raw dict (default: `False`)
 
         Returns:
             dict: API response containing videos and metadata
@@ -159,14 +487,8 @@ class Pexels:
             PexelsAPIError: If the API request fails
             ValueError: If parameters are invalid
         """
-        if not query:
-            raise ValueError("Query parameter is required")
-        
-        if per_page > 80:
-            raise ValueError("per_page cannot exceed 80")
-        
-        if page < 1:
-            raise ValueError("page must be >= 1")
+        validate_query(query)
+        validate_pagination(page, per_page)
 
         params = {
             "query": query,
@@ -177,10 +499,16 @@ class Pexels:
             "per_page": per_page,
         }
 
+        if as_objects and self._decodes_models():
+            return self._request_models("search", params, base_url=self.VIDEO_BASE_URL, shape="videos")
+
         response = self._make_request("search", params, self.VIDEO_BASE_URL)
 
+        if as_table:
+            return VideoTable(response.get('videos', []))
+
         if as_objects:
-            return [parse_video(video) for video in response.get('videos', [])]
+            return [parse_video(video, self.lazy) for video in response.get('videos', [])]
         
         return response
 
@@ -200,10 +528,13 @@ class Pexels:
             ValueError: If parameters are invalid
         """
 
+        if as_object and self._decodes_models():
+            return self._request_models(f"photos/{photo_id}", shape="photo")
+
         response = self._make_request(f"photos/{photo_id}")
     
         if as_object:
-            return parse_photo(response)
+            return parse_photo(response, self.lazy)
         
         return response
 
@@ -223,19 +554,110 @@ class Pexels:
             ValueError: If parameters are invalid
         """
 
+        if as_object and self._decodes_models():
+            return self._request_models(f"videos/{video_id}", base_url=self.VIDEO_BASE_URL, shape="video")
+
         response = self._make_request(f"videos/{video_id}", base_url=self.VIDEO_BASE_URL)
     
         if as_object:
-            return parse_video(response)
+            return parse_video(response, self.lazy)
         
         return response
     
 
+    def _get_many(
+        self,
+        get_one: Callable[..., Any],
+        ids: Iterable[Union[int, str]],
+        max_workers: int,
+        as_objects: bool
+    ) -> BatchResult:
+        """Fetch many items by ID on a bounded thread pool, collecting per-ID errors"""
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        batch = BatchResult()
+        pending = {}
+
+        def collect(futures):
+            for future in futures:
+                item_id = pending.pop(future)
+                try:
+                    batch.results[item_id] = future.result()
+                except PexelsAPIError as e:
+                    batch.errors[item_id] = e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for item_id in dict.fromkeys(ids):
+                if len(pending) >= max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending[executor.submit(get_one, item_id, as_object=as_objects)] = item_id
+
+            collect(list(pending))
+
+        return batch
+
+
+    def get_photos(
+        self,
+        photo_ids: Iterable[Union[int, str]],
+        max_workers: int = 8,
+        as_objects: Optional[bool] = False
+    ) -> BatchResult:
+        """Get many photos by ID concurrently.
+
+        Duplicate IDs are fetched once. Calls go through `_make_request`, so the client's
+        cache, rate limiter and retry policy apply to each of them.
+
+        Args:
+            photo_ids (Iterable[int or str]): The photo IDs
+            max_workers (int, optional): Maximum concurrent requests (default: `8`)
+            as_objects (bool, optional): Return Photo objects instead of raw dicts (default: `False`)
+
+        Returns:
+            BatchResult: Photos keyed by ID in `results`, and the PexelsAPIError of each failed ID in `errors`
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+
+        return self._get_many(self.get_photo, photo_ids, max_workers, as_objects)
+
+
+    def get_videos(
+        self,
+        video_ids: Iterable[Union[int, str]],
+        max_workers: int = 8,
+        as_objects: Optional[bool] = False
+    ) -> BatchResult:
+        """Get many videos by ID concurrently.
+
+        Duplicate IDs are fetched once. Calls go through `_make_request`, so the client's
+        cache, rate limiter and retry policy apply to each of them.
+
+        Args:
+            video_ids (Iterable[int or str]): The video IDs
+            max_workers (int, optional): Maximum concurrent requests (default: `8`)
+            as_objects (bool, optional): Return Video objects instead of raw dicts (default: `False`)
+
+        Returns:
+            BatchResult: Videos keyed by ID in `results`, and the PexelsAPIError of each failed ID in `errors`
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+
+        return self._get_many(self.get_video, video_ids, max_workers, as_objects)
+    
+
     def get_curated_photos(
         self,
         page: Optional[int] = 1,
         per_page: Optional[int] = 15,
-        as_objects: Optional[bool] = False
+        as_objects: Optional[bool] = False,
+        as_table: bool = False
     ) -> Dict[str, Any]:
         """Get photos curated by the Pexels team.
         
@@ -243,6 +665,7 @@ class Pexels:
             page (int, optional): Page number (default: `1`)
             per_page (int, optional): Results per page, max `80` (default: `15`)
             as_objects (bool, optional): Return Photo objects instead of raw dict (default: `False`)
+            as_table (bool, optional): Return the photos as a `PhotoTable` instead of raw dict (default: `False`)
 
         Returns:
             dict: API response containing videos and metadata
@@ -252,21 +675,23 @@ class Pexels:
             ValueError: If parameters are invalid
         """
         
-        if per_page > 80:
-            raise ValueError("per_page cannot exceed 80")
-        
-        if page < 1:
-            raise ValueError("page must be >= 1")
+        validate_pagination(page, per_page)
         
         params = {
             "page": page,
             "per_page": per_page,
         }
 
+        if as_objects and self._decodes_models():
+            return self._request_models("curated", params, shape="photos")
+
         response = self._make_request("curated", params)
     
+        if as_table:
+            return PhotoTable(response.get('photos', []))
+
         if as_objects:
-            return [parse_photo(photo) for photo in response.get('photos', [])]
+            return [parse_photo(photo, self.lazy) for photo in response.get('photos', [])]
 
         return response
     
@@ -279,7 +704,8 @@ class Pexels:
         max_duration: Optional[int] = None,
         page: Optional[int] = 1,
         per_page: Optional[int] = 15,
-        as_objects: Optional[bool] = False
+        as_objects: Optional[bool] = False,
+        as_table: bool = False
     ) -> Dict[str, Any]:
         """Get the current popular Pexels videos.
 
@@ -291,6 +717,7 @@ class Pexels:
             page (int, optional): Page number (default: `1`)
             per_page (int, optional): Results per page, max `80` (default: `15`)
             as_objects (bool, optional): Return Video objects instead of raw dict (default: `False`)
+            as_table (bool, optional): Return the videos as a `VideoTable` instead of raw dict (default: `False`)
 
         Returns:
             dict: API response containing videos and metadata
@@ -300,11 +727,7 @@ class Pexels:
             ValueError: If parameters are invalid
         """
         
-        if per_page > 80:
-            raise ValueError("per_page cannot exceed 80")
-        
-        if page < 1:
-            raise ValueError("page must be >= 1")
+        validate_pagination(page, per_page)
         
         params = {
             "min_width": min_width,
@@ -315,10 +738,16 @@ class Pexels:
             "per_page": per_page,
         }
 
+        if as_objects and self._decodes_models():
+            return self._request_models("popular", params, base_url=self.VIDEO_BASE_URL, shape="videos")
+
         response = self._make_request("popular", params, base_url=self.VIDEO_BASE_URL)
     
+        if as_table:
+            return VideoTable(response.get('videos', []))
+
         if as_objects:
-            return [parse_video(video) for video in response.get('videos', [])]
+            return [parse_video(video, self.lazy) for video in response.get('videos', [])]
         
         return response
 
@@ -344,17 +773,16 @@ class Pexels:
             ValueError: If parameters are invalid
         """        
         
-        if per_page > 80:
-            raise ValueError("per_page cannot exceed 80")
-        
-        if page < 1:
-            raise ValueError("page must be >= 1")
+        validate_pagination(page, per_page)
         
         params = {
             "page": page,
             "per_page": per_page,
         }
 
+        if as_objects and self._decodes_models():
+            return self._request_models("collections/featured", params, shape="collections")
+
         response = self._make_request("collections/featured", params)
 
         if as_objects:
@@ -384,17 +812,16 @@ class Pexels:
             ValueError: If parameters are invalid
         """
         
-        if per_page > 80:
-            raise ValueError("per_page cannot exceed 80")
-        
-        if page < 1:
-            raise ValueError("page must be >= 1")
+        validate_pagination(page, per_page)
         
         params = {
             "page": page,
             "per_page": per_page,
         }
 
+        if as_objects and self._decodes_models():
+            return self._request_models("collections", params, shape="collections")
+
         resposne = self._make_request("collections", params)
     
         if as_objects:
@@ -410,7 +837,8 @@ class Pexels:
         sort: Optional[str] = "asc",
         page: Optional[int] = 1,
         per_page: Optional[int] = 15,
-        as_objects: Optional[bool] = False
+        as_objects: Optional[bool] = False,
+        as_table: bool = False
     ) -> Dict[str, Any]:
         """Get all media within a collection
 
@@ -421,6 +849,7 @@ class Pexels:
             page (int, optional): Page number (default: `1`)
             per_page (int, optional): Results per page, max `80` (default: `15`)
             as_objects (bool, optional): Return Photo/Video objects instead of raw dict (default: `False`)
+            as_table (bool, optional): Return the media as a (`PhotoTable`, `VideoTable`) pair instead of raw dict (default: `False`)
 
         Returns:
             dict: API response containing videos and metadata
@@ -430,14 +859,8 @@ class Pexels:
             ValueError: If parameters are invalid
         """        
 
-        if per_page > 80:
-            raise ValueError("per_page cannot exceed 80")
-        
-        if page < 1:
-            raise ValueError("page must be >= 1")
-        
-        if media_type not in ['photos', 'videos', None]:
-            raise ValueError("media_type must be either `photos` or `videos`")
+        validate_pagination(page, per_page)
+        validate_media_type(media_type)
         
         params = {
             "type": media_type,
@@ -448,48 +871,560 @@ class Pexels:
 
         response = self._make_request(f"collections/{collection_id}", params)
 
+        if as_table:
+            return media_tables(response.get('media', []))
+
         if as_objects:
-            videos = [parse_video(video) for video in [m for m in response.get('media', []) if m.get('type', '') == 'Video']]
-            pictures = [parse_photo(photo) for photo in [m for m in response.get('media', []) if m.get('type', '') == 'Photo']]
-            return videos + pictures
+            return parse_collection_media(response, self.lazy)
         
         return response
     
 
-    def download_video(self, video: Video, quality: str) -> str:
-        """Download a video from a given URL.
-        
+    def _iter_pages(
+        self,
+        fetch: Callable[..., Dict[str, Any]],
+        page: int,
+        per_page: int,
+        max_items: Optional[int] = None,
+        prefetch: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield raw responses page by page from a paginated method.
+
+        Once the first response reveals `total_results`, up to `prefetch` of the following
+        pages are fetched concurrently on a thread pool and yielded in order.
+
         Args:
-            video (Video): Video object to download
-            quality (str): Requested quality: `sd`, `hd`, `uhd`
+            fetch (Callable): Page method taking `page` and `per_page` and returning the raw response
+            page (int): First page to fetch
+            per_page (int): Results per page
+            max_items (int, optional): Stop fetching once this many items are covered
+            prefetch (int, optional): Pages to fetch ahead of the consumer (default: `0`, sequential)
+        """
+
+        response = fetch(page=page, per_page=per_page)
+        yield response
+
+        final = last_page(response, page, per_page, max_items)
+        if not prefetch or final is None:
+            while has_next_page(response, page, per_page):
+                page += 1
+                response = fetch(page=page, per_page=per_page)
+                yield response
+            return
+
+        if not page_items(response):
+            return
+
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque()
+            next_page = page + 1
+            try:
+                while pending or next_page <= final:
+                    while next_page <= final and len(pending) < prefetch:
+                        pending.append(executor.submit(fetch, page=next_page, per_page=per_page))
+                        next_page += 1
+
+                    response = pending.popleft().result()
+                    yield response
+
+                    if not page_items(response):
+                        return
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+    def _paginate(
+        self,
+        fetch: Callable[..., Dict[str, Any]],
+        page: int,
+        per_page: int,
+        max_items: Optional[int],
+        prefetch: int,
+        as_objects: bool
+    ) -> Iterator[Any]:
+        """Yield result items page by page from a paginated method.
+
+        Args:
+            fetch (Callable): Page method taking `page` and `per_page` and returning the raw response
+            page (int): First page to fetch
+            per_page (int): Results per page
+            max_items (int, optional): Stop after this many items
+            prefetch (int): Pages to fetch concurrently ahead of the consumer
+            as_objects (bool): Parse items into dataclasses
+        """
+
+        if max_items == 0:
+            return
+        if max_items is not None and page == 1:
+            # later pages are offsets in units of per_page, so only the first may shrink
+            per_page = min(per_page, max_items)
+
+        yielded = 0
+        for response in self._iter_pages(fetch, page, per_page, max_items, prefetch):
+            key = result_key(response)
+
+            for item in page_items(response):
+                yield parse_item(item, key, self.lazy) if as_objects else item
+                yielded += 1
+
+                if max_items is not None and yielded >= max_items:
+                    return
+
+
+    def iter_search_photos(
+        self,
+        query: str,
+        orientation: Optional[str] = None,
+        size: Optional[str] = None,
+        color: Optional[str] = None,
+        locale: Optional[str] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> Iterator[Union[Dict[str, Any], Photo]]:
+        """Iterate over photo search results across pages, fetching each page on demand.
+
+        Args:
+            query (str): The search query (e.g., `Ocean`, `Tigers`, `People`)
+            orientation (str, optional): Desired photo orientation: `landscape`, `portrait`, or `square`
+            size (str, optional): Minimum photo size: `large` (24MP), `medium` (12MP), or `small` (4MP)
+            color (str, optional): Desired photo color
+            locale (str, optional): Search locale (e.g., `en-US`, `pt-BR`)
+            page (int, optional): Page to start from (default: `1`)
+            per_page (int, optional): Results per page, max `80` (default: `80`)
+            max_items (int, optional): Stop after this many photos (default: all results)
+            prefetch (int, optional): Pages to fetch concurrently ahead of the consumer once `total_results` is known (default: `0`, sequential)
+            as_objects (bool, optional): Yield Photo objects instead of raw dicts (default: `False`)
 
         Returns:
-            str: The filepath of the downloaded video, or None if download failed
+            Iterator: Photos in result order
+
+        Raises:
+            PexelsAPIError: If an API request fails
+            ValueError: If parameters are invalid
         """
 
-        try:
-            available_qualities = set([v.quality for v in video.video_files])
+        validate_query(query)
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
 
-            if quality not in available_qualities:
-                raise ValueError(f"`{quality}` is not an available quality. Available: {available_qualities}")
+        fetch = partial(self.search_photos, query, orientation=orientation, size=size, color=color, locale=locale)
+        return self._paginate(fetch, page, per_page, max_items, prefetch, as_objects)
 
-            quality_videos = [v for v in video.video_files if v.quality == quality]
-            quality_videos.sort(key=lambda v: v.width, reverse=True)
-            selected_video = quality_videos[0]
 
-            video_id = video.id
+    def iter_search_videos(
+        self,
+        query: str,
+        orientation: Optional[str] = None,
+        size: Optional[str] = None,
+        locale: Optional[str] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> Iterator[Union[Dict[str, Any], Video]]:
+        """Iterate over video search results across pages, fetching each page on demand.
 
-            response = requests.get(selected_video.link, stream=True, timeout=30)
-            response.raise_for_status()
+        Args:
+            query (str): The search query (e.g., `Ocean`, `Tigers`, `People`)
+            orientation (str, optional): Desired video orientation: `landscape`, `portrait`, or `square`
+            size (str, optional): Minimum video size: `large` (4K), `medium` (Full HD), or `small` (HD)
+            locale (str, optional): Search locale (e.g., `en-US`, `pt-BR`)
+            page (int, optional): Page to start from (default: `1`)
+            per_page (int, optional): Results per page, max `80` (default: `80`)
+            max_items (int, optional): Stop after this many videos (default: all results)
+            prefetch (int, optional): Pages to fetch concurrently ahead of the consumer once `total_results` is known (default: `0`, sequential)
+            as_objects (bool, optional): Yield Video objects instead of raw dicts (default: `False`)
+
+        Returns:
+            Iterator: Videos in result order
+
+        Raises:
+            PexelsAPIError: If an API request fails
+            ValueError: If parameters are invalid
+        """
+
+        validate_query(query)
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        fetch = partial(self.search_videos, query, orientation=orientation, size=size, locale=locale)
+        return self._paginate(fetch, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_curated_photos(
+        self,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> Iterator[Union[Dict[str, Any], Photo]]:
+        """Iterate over curated photos across pages, fetching each page on demand.
+
+        Args:
+            page (int, optional): Page to start from (default: `1`)
+            per_page (int, optional): Results per page, max `80` (default: `80`)
+            max_items (int, optional): Stop after this many photos (default: all results)
+            prefetch (int, optional): Pages to fetch concurrently ahead of the consumer once `total_results` is known (default: `0`, sequential)
+            as_objects (bool, optional): Yield Photo objects instead of raw dicts (default: `False`)
+
+        Returns:
+            Iterator: Photos in result order
+
+        Raises:
+            PexelsAPIError: If an API request fails
+            ValueError: If parameters are invalid
+        """
+
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        return self._paginate(self.get_curated_photos, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_popular_videos(
+        self,
+        min_width: Optional[int] = None,
+        min_height: Optional[int] = None,
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> Iterator[Union[Dict[str, Any], Video]]:
+        """Iterate over popular videos across pages, fetching each page on demand.
+
+        Args:
+            min_width (int, optional): The minimum width in pixels of the returned videos.
+            min_height (int, optional): The minimum height in pixels of the returned videos.
+            min_duration (int, optional): The minimum duration in seconds of the returned videos.
+            max_duration (int, optional): The maximum duration in seconds of the returned videos.
+            page (int, optional): Page to start from (default: `1`)
+            per_page (int, optional): Results per page, max `80` (default: `80`)
+            max_items (int, optional): Stop after this many videos (default: all results)
+            prefetch (int, optional): Pages to fetch concurrently ahead of the consumer once `total_results` is known (default: `0`, sequential)
+            as_objects (bool, optional): Yield Video objects instead of raw dicts (default: `False`)
+
+        Returns:
+            Iterator: Videos in result order
+
+        Raises:
+            PexelsAPIError: If an API request fails
+            ValueError: If parameters are invalid
+        """
+
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        fetch = partial(
+            self.get_popular_videos,
+            min_width=min_width,
+            min_height=min_height,
+            min_duration=min_duration,
+            max_duration=max_duration
+        )
+        return self._paginate(fetch, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_featured_collections(
+        self,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> Iterator[Union[Dict[str, Any], Collection]]:
+        """Iterate over featured collections across pages, fetching each page on demand.
+
+        Args:
+            page (int, optional): Page to start from (default: `1`)
+            per_page (int, optional): Results per page, max `80` (default: `80`)
+            max_items (int, optional): Stop after this many collections (default: all results)
+            prefetch (int, optional): Pages to fetch concurrently ahead of the consumer once `total_results` is known (default: `0`, sequential)
+            as_objects (bool, optional): Yield Collection objects instead of raw dicts (default: `False`)
+
+        Returns:
+            Iterator: Collections in result order
+
+        Raises:
+            PexelsAPIError: If an API request fails
+            ValueError: If parameters are invalid
+        """
+
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        return self._paginate(self.get_featured_collections, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_my_collections(
+        self,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> Iterator[Union[Dict[str, Any], Collection]]:
+        """Iterate over your collections across pages, fetching each page on demand.
+
+        Args:
+            page (int, optional): Page to start from (default: `1`)
+            per_page (int, optional): Results per page, max `80` (default: `80`)
+            max_items (int, optional): Stop after this many collections (default: all results)
+            prefetch (int, optional): Pages to fetch concurrently ahead of the consumer once `total_results` is known (default: `0`, sequential)
+            as_objects (bool, optional): Yield Collection objects instead of raw dicts (default: `False`)
+
+        Returns:
+            Iterator: Collections in result order
+
+        Raises:
+            PexelsAPIError: If an API request fails
+            ValueError: If parameters are invalid
+        """
+
+        validate_pagination(page, per_page)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        return self._paginate(self.get_my_collections, page, per_page, max_items, prefetch, as_objects)
+
+
+    def iter_collection_media(
+        self,
+        collection_id: Union[int, str],
+        media_type: Optional[str] = None,
+        sort: Optional[str] = "asc",
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        as_objects: Optional[bool] = False
+    ) -> Iterator[Union[Dict[str, Any], Photo, Video]]:
+        """Iterate over the media of a collection across pages, fetching each page on demand.
+
+        Unlike `get_collection_media`, items keep their collection order when `as_objects` is set.
+
+        Args:
+            collection_id (int or str): ID of the Collection
+            media_type (str, optional): The type of media you are requesting: `photos` or `videos`. If not given, all media will be returned.
+            sort (str, optional): The order of items in the media collection: `asc` or `desc`
+            page (int, optional): Page to start from (default: `1`)
+            per_page (int, optional): Results per page, max `80` (default: `80`)
+            max_items (int, optional): Stop after this many items (default: all media)
+            prefetch (int, optional): Pages to fetch concurrently ahead of the consumer once `total_results` is known (default: `0`, sequential)
+            as_objects (bool, optional): Yield Photo/Video objects instead of raw dicts (default: `False`)
+
+        Returns:
+            Iterator: Media in collection order
+
+        Raises:
+            PexelsAPIError: If an API request fails
+            ValueError: If parameters are invalid
+        """
+
+        validate_pagination(page, per_page)
+        validate_media_type(media_type)
+        validate_max_items(max_items)
+        validate_prefetch(prefetch)
+
+        fetch = partial(self.get_collection_media, collection_id, media_type=media_type, sort=sort)
+        return self._paginate(fetch, page, per_page, max_items, prefetch, as_objects)
+
+
+    def download_photo(
+        self,
+        photo: Photo,
+        size: str = "original",
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        path: Optional[str] = None,
+        file: Optional[Union[bytearray, memoryview, BinaryIO]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Union[str, int]:
+        """Download a photo rendition to disk or into a writable file object.
+
+        Pass `width` and/or `height` to download the smallest rendition that is at least
+        that large instead of a named `size`. Downloads use the client's session and retry
+        policy. `file` may be a `bytearray` (appended to), a writable buffer such as a
+        `memoryview` (filled from the start) or a binary file object such as `BytesIO`;
+        a retried download restarts from where `file` was when the call was made, so
+        non-seekable streams are only attempted once.
+
+        Args:
+            photo (Photo): Photo object to download
+            size (str, optional): Rendition: `original`, `large2x`, `large`, `medium`, `small`, `portrait`, `landscape`, `tiny` (default: `original`)
+            width (int, optional): Minimum width in pixels, overrides `size`
+            height (int, optional): Minimum height in pixels, overrides `size`
+            path (str, optional): Destination file path (default: `{photo_id}_{size}.{ext}`)
+            file (bytearray, memoryview or BinaryIO, optional): Buffer or file object to download into instead of `path`
+            chunk_size (int, optional): Read size in bytes (default: 1 MiB)
+
+        Returns:
+            str or int: The filepath of the downloaded photo, or the number of bytes written to `file`
+
+        Raises:
+            ValueError: If the rendition is not available or a fixed-size buffer is too small
+            PexelsAPIError: If the download fails
+        """
+
+        if width is not None or height is not None:
+            size = select_photo_size(photo, width, height)
+
+        url = photo_url(photo, size)
+
+        if file is not None:
+            return self._download_into(url, file, chunk_size)
+
+        path = path or f"{photo.id}_{size}{url_extension(url)}"
+        self._download_to_path(url, path, photo.id, chunk_size=chunk_size)
+        return path
+
+
+    def _download_to_path(
+        self,
+        url: str,
+        path: str,
+        media_id: int,
+        connections: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_chunk: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """Download `url` to `path` with retries, going through the download store when one is set.
+
+        Returns:
+            int: Size of the file
+        """
+
+        def download(target: str) -> int:
+            return self._with_retries(
+                lambda timeout: download_file(self.session, url, target, timeout, connections, chunk_size, on_chunk=on_chunk)
+            )
+
+        if self.store is None:
+            return download(path)
+
+        key = self.store.key_for(media_id, url)
+        with self.store.locked(key):
+            stored = self.store.get(media_id, url)
+            if stored is None:
+                staging_path = self.store.staging_path(key)
+                download(staging_path)
+                stored = self.store.add(media_id, url, staging_path)
+            self.store.materialize(stored, path)
+
+        return os.path.getsize(path)
+
+
+    def _download_into(self, url: str, target: Union[bytearray, memoryview, BinaryIO], chunk_size: int) -> int:
+        """Download `url` into a buffer or file object, rewinding `target` before each retry.
+
+        Targets that cannot be rewound (non-seekable streams) are only attempted once.
+        """
+
+        rewind = rewinder(target)
+        if rewind is None:
+            return download_into(self.session, url, target, self.timeout, chunk_size)
+
+        def download(timeout: float) -> int:
+            rewind()
+            return download_into(self.session, url, target, timeout, chunk_size)
+
+        return self._with_retries(download)
+
+
+    def iter_download(self, url: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Stream a media file, yielding its body in chunks without touching the disk.
+
+        Use `photo_url` or `select_video_rendition` to pick the URL of a rendition. The
+        stream is not retried once it has started, since chunks already yielded cannot
+        be taken back.
+
+        Args:
+            url (str): Media file URL, e.g. `photo.src.medium` or a `VideoFile.link`
+            chunk_size (int, optional): Maximum chunk size in bytes (default: 1 MiB)
+
+        Yields:
+            bytes: Consecutive chunks of the file
+
+        Raises:
+            PexelsAPIError: If the download fails
+        """
+
+        return iter_chunks(self.session, url, self.timeout, chunk_size)
+
+
+    def download_video(
+        self,
+        video: Video,
+        quality: Optional[str] = None,
+        connections: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        max_fps: Optional[float] = None,
+        file_type: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        file: Optional[Union[bytearray, memoryview, BinaryIO]] = None
+    ) -> Union[str, int]:
+        """Download a video from a given URL.
+
+        Either pass an exact `quality`, or leave it out to download the cheapest file that
+        is at least `width` x `height` and satisfies `max_fps`, `file_type` and `max_bytes`
+        (see `select_video_rendition`).
+
+        With `connections > 1` the file is split into byte ranges fetched concurrently over
+        the client's connection pool, falling back to a single stream when the CDN does not
+        support ranges. Keep `connections` at or below the client's `pool_maxsize`.
+
+        The file is written to `{filename}.part` and renamed once complete. If a transfer
+        fails, calling `download_video` again resumes it from the last checkpoint.
+
+        Pass `file` to download into memory or a stream instead of the working directory,
+        as with `download_photo`; `connections` is ignored in that case.
+        
+        Args:
+            video (Video): Video object to download
+            quality (str, optional): Requested quality: `sd`, `hd`, `uhd`
+            connections (int, optional): Concurrent connections used for the file (default: `1`)
+            chunk_size (int, optional): Read size in bytes (default: 1 MiB)
+            width (int, optional): Minimum width in pixels when `quality` is not given
+            height (int, optional): Minimum height in pixels when `quality` is not given
+            max_fps (float, optional): Highest acceptable frame rate when `quality` is not given
+            file_type (str, optional): Required MIME type, e.g. `video/mp4`, when `quality` is not given
+            max_bytes (int, optional): Largest acceptable file size when `quality` is not given
+            file (bytearray, memoryview or BinaryIO, optional): Buffer or file object to download into
+
+        Returns:
+            str or int: The filepath of the downloaded video (`{id}_{quality}.mp4`, or `{id}_{width}x{height}.mp4`
+                for a selected file), or the number of bytes written to `file`
+
+        Raises:
+            ValueError: If no video file matches the requested quality or constraints, or a fixed-size buffer is too small
+            PexelsAPIError: If the download fails
+        """
 
-            filename = f"{video_id}_{quality}.mp4"
+        if quality is not None:
+            selected_video = select_video_file(video, quality)
+            filename = f"{video.id}_{quality}.mp4"
+        else:
+            selected_video = select_video_rendition(video, width, height, max_fps, file_type, max_bytes)
+            filename = f"{video.id}_{selected_video.width}x{selected_video.height}.mp4"
 
-            with open(filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        if file is not None:
+            return self._download_into(selected_video.link, file, chunk_size)
 
-            return filename
+        self._download_to_path(selected_video.link, filename, video.id, connections, chunk_size)
 
-        except Exception as e:
-            print(f"Error downloading vide: {str(e)}")
-            return None
\ No newline at end of file
+        return filename
\ No newline at end of file
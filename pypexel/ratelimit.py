@@ -0,0 +1,132 @@
+import time
+import threading
+from dataclasses import dataclass
+from typing import Optional, Mapping
+
+from .exceptions import PexelsRateLimitError
+
+
+@dataclass
+class RateLimitState:
+    limit: int
+    remaining: int
+    reset: float
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> Optional[RateLimitState]:
+    """Parse Pexels' `X-Ratelimit-*` response headers, or return None if they are missing or malformed"""
+
+    try:
+        return RateLimitState(
+            limit=int(headers.get("X-Ratelimit-Limit")),
+            remaining=int(headers.get("X-Ratelimit-Remaining")),
+            reset=float(headers.get("X-Ratelimit-Reset"))
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Token-bucket scheduler that paces API calls to stay within the remaining quota.
+
+    The budget comes from the `X-Ratelimit-*` headers of previous responses. Calls run
+    freely (at most `rate` per second) while budget is left, and wait for the reset once
+    it is spent. Pexels quotas reset monthly, so spreading calls evenly over the time
+    left would space them minutes apart; pass `spread=True` to do so anyway, allowing
+    short bursts of up to `burst` calls. A limiter can be shared by several clients and
+    threads.
+
+    Args:
+        rate (float, optional): Upper bound on calls per second, applied even before any headers are seen (default: none)
+        burst (int, optional): Calls allowed back-to-back before pacing kicks in (default: `10`)
+        spread (bool, optional): Spread the remaining budget evenly until the quota resets (default: `False`)
+        headroom (int, optional): Requests of the quota to leave unused (default: `0`)
+        block (bool, optional): Sleep until a call is allowed instead of raising `PexelsRateLimitError` (default: `True`)
+        max_wait (float, optional): Raise instead of sleeping longer than this many seconds (default: no limit)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 10,
+        headroom: int = 0,
+        block: bool = True,
+        max_wait: Optional[float] = None,
+        spread: bool = False
+    ):
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.headroom = headroom
+        self.block = block
+        self.max_wait = max_wait
+        self.spread = spread
+
+        self.state: Optional[RateLimitState] = None
+        self._budget: Optional[int] = None
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+
+    def update(self, state: Optional[RateLimitState]) -> None:
+        """Sync the budget with the rate limit reported by the API"""
+
+        if state is None:
+            return
+
+        with self._lock:
+            self.state = state
+            self._budget = state.remaining
+
+
+    def reserve(self) -> float:
+        """Reserve one call and return how many seconds to wait before making it.
+
+        Raises:
+            PexelsRateLimitError: If the wait is not allowed by `block`/`max_wait`
+        """
+
+        with self._lock:
+            now = time.time()
+
+            if self.state is not None and now >= self.state.reset:
+                # the quota window rolled over, the next response will report the new budget
+                self.state = None
+                self._budget = None
+
+            start = now
+            interval = 1 / self.rate if self.rate else 0.0
+
+            if self._budget is not None:
+                available = self._budget - self.headroom
+                if available <= 0:
+                    start = self.state.reset
+                elif self.spread:
+                    interval = max(interval, (self.state.reset - now) / available)
+
+            next_slot = max(self._next_slot, start)
+            allowed_at = max(start, next_slot - (self.burst - 1) * interval)
+            wait = allowed_at - now
+
+            if wait > 0 and (not self.block or (self.max_wait is not None and wait > self.max_wait)):
+                raise PexelsRateLimitError(f"API rate limit budget exhausted. Next request allowed in {wait:.1f} seconds.")
+
+            self._next_slot = next_slot + interval
+            if self._budget is not None:
+                self._budget -= 1
+
+            return max(wait, 0.0)
+
+
+    def acquire(self) -> None:
+        """Block until one call is allowed.
+
+        Raises:
+            PexelsRateLimitError: If the wait is not allowed by `block`/`max_wait`
+        """
+
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
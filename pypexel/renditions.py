@@ -0,0 +1,120 @@
+import os
+from urllib.parse import urlparse
+from typing import Optional, Tuple
+
+from .models import Photo, Video, VideoFile
+
+
+# Bounding boxes, as (max width, max height), of the resized renditions in `PhotoSRC`.
+# The CDN scales photos to fit inside the box; `large2x` is `large` at a device pixel ratio of 2.
+# `portrait`, `landscape` and `tiny` are crops and are only picked by name.
+PHOTO_RENDITIONS = [
+    ("small", None, 130),
+    ("medium", None, 350),
+    ("large", 940, 650),
+    ("large2x", 1880, 1300),
+    ("original", None, None),
+]
+
+PHOTO_SIZES = ("original", "large2x", "large", "medium", "small", "portrait", "landscape", "tiny")
+
+
+def photo_rendition_size(photo: Photo, size: str) -> Tuple[int, int]:
+    """Return the expected (width, height) of a resized photo rendition.
+
+    Raises:
+        ValueError: If `size` is not one of the resized renditions, or the photo's dimensions are unknown
+    """
+
+    if not photo.width or not photo.height:
+        raise ValueError(f"Photo {photo.id} has unknown dimensions ({photo.width}x{photo.height})")
+
+    for name, max_width, max_height in PHOTO_RENDITIONS:
+        if name == size:
+            scale = 1.0
+            if max_width is not None:
+                scale = min(scale, max_width / photo.width)
+            if max_height is not None:
+                scale = min(scale, max_height / photo.height)
+            return round(photo.width * scale), round(photo.height * scale)
+
+    raise ValueError(f"`{size}` is not a resized rendition. Available: {[r[0] for r in PHOTO_RENDITIONS]}")
+
+
+def select_photo_size(photo: Photo, width: Optional[int] = None, height: Optional[int] = None) -> str:
+    """Pick the smallest rendition at least `width` x `height` pixels, falling back to `original`.
+
+    Photos without known dimensions always get `original`.
+    """
+
+    if not photo.width or not photo.height:
+        return "original"
+
+    for name, _, _ in PHOTO_RENDITIONS:
+        rendition_width, rendition_height = photo_rendition_size(photo, name)
+        if (width is None or rendition_width >= width) and (height is None or rendition_height >= height):
+            return name
+
+    return "original"
+
+
+def photo_url(photo: Photo, size: str = "original") -> str:
+    """Return the URL of a photo rendition.
+
+    Raises:
+        ValueError: If the rendition is not available
+    """
+
+    url = getattr(photo.src, size, None) if size in PHOTO_SIZES else None
+    if not url:
+        raise ValueError(f"`{size}` is not an available photo size. Available: {list(PHOTO_SIZES)}")
+    return url
+
+
+def select_video_rendition(
+    video: Video,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    max_fps: Optional[float] = None,
+    file_type: Optional[str] = None,
+    max_bytes: Optional[int] = None
+) -> VideoFile:
+    """Pick the cheapest file of a video that is at least `width` x `height` pixels.
+
+    Files above `max_fps`, of another `file_type` (e.g. `video/mp4`) or known to be larger
+    than `max_bytes` are skipped. Cost is the reported file size when every candidate has
+    one, otherwise the pixel rate (`width * height * fps`). When no file reaches the target
+    resolution, the largest remaining file is returned.
+
+    Raises:
+        ValueError: If no file satisfies the fps, file type and size constraints
+    """
+
+    candidates = [
+        f for f in video.video_files
+        if (max_fps is None or (f.fps or 0) <= max_fps)
+        and (file_type is None or f.file_type == file_type)
+        and (max_bytes is None or f.size is None or f.size <= max_bytes)
+    ]
+    if not candidates:
+        raise ValueError(f"Video {video.id} has no file matching max_fps={max_fps}, file_type={file_type}, max_bytes={max_bytes}")
+
+    def pixel_rate(f: VideoFile) -> float:
+        return (f.width or 0) * (f.height or 0) * (f.fps or 1)
+
+    sufficient = [
+        f for f in candidates
+        if (width is None or (f.width or 0) >= width) and (height is None or (f.height or 0) >= height)
+    ]
+    if not sufficient:
+        return max(candidates, key=lambda f: ((f.width or 0) * (f.height or 0), f.fps or 0))
+
+    if all(f.size is not None for f in sufficient):
+        return min(sufficient, key=lambda f: (f.size, pixel_rate(f)))
+    return min(sufficient, key=pixel_rate)
+
+
+def url_extension(url: str, default: str = ".jpg") -> str:
+    """Return the file extension of a URL path, ignoring the query string"""
+
+    return os.path.splitext(urlparse(url).path)[1] or default
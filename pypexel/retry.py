@@ -0,0 +1,132 @@
+import time
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Mapping, Iterable
+
+from .exceptions import PexelsAPIError, PexelsRateLimitError, PexelsConnectionError
+
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """Retry policy for transient API and download failures.
+
+    Failed attempts are retried after an exponential backoff with full jitter. When the
+    response carries a `Retry-After` or `X-Ratelimit-Reset` header, the delay is at least
+    as long as the server asked for, up to `max_retry_after`; a longer wait, such as the
+    monthly quota reset, raises a PexelsRateLimitError instead of sleeping until then.
+    A total `deadline` bounds the time spent on a call, including all attempts and waits.
+
+    Args:
+        max_attempts (int, optional): Maximum number of attempts, including the first (default: `3`)
+        backoff_base (float, optional): Backoff before the first retry, doubling on each retry (default: `0.5`)
+        backoff_cap (float, optional): Maximum backoff in seconds (default: `30`)
+        retry_statuses (Iterable[int], optional): HTTP statuses to retry (default: `429`, `500`, `502`, `503`, `504`)
+        respect_retry_after (bool, optional): Honor `Retry-After`/`X-Ratelimit-Reset` headers (default: `True`)
+        deadline (float, optional): Total time budget in seconds for a call (default: no deadline)
+        max_retry_after (float, optional): Longest server-requested wait to sleep through, in seconds (default: `60`)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        respect_retry_after: bool = True,
+        deadline: Optional[float] = None,
+        max_retry_after: float = 60.0
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+        self.max_retry_after = max_retry_after
+
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether an error is transient under this policy"""
+
+        if isinstance(error, PexelsConnectionError):
+            return True
+        if isinstance(error, PexelsAPIError):
+            return error.status_code in self.retry_statuses
+        return False
+
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter backoff after the given (1-based) failed attempt"""
+
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+
+
+    def server_delay(self, headers: Mapping[str, str]) -> Optional[float]:
+        """Seconds the server asked us to wait, from `Retry-After` or `X-Ratelimit-Reset`"""
+
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except (TypeError, ValueError):
+                pass
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError, IndexError):
+                pass
+
+        reset = headers.get("X-Ratelimit-Reset")
+        if reset is not None and headers.get("X-Ratelimit-Remaining") == "0":
+            try:
+                return max(0.0, float(reset) - time.time())
+            except (TypeError, ValueError):
+                pass
+
+        return None
+
+
+    def next_delay(self, attempt: int, error: Exception, started: float) -> Optional[float]:
+        """Return the delay before the next attempt, or None if the error should be raised.
+
+        Args:
+            attempt (int): Number of attempts made so far
+            error (Exception): Error raised by the last attempt
+            started (float): `time.monotonic()` value when the call started
+
+        Raises:
+            PexelsRateLimitError: If the server asked to wait longer than `max_retry_after`
+        """
+
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and isinstance(error, PexelsAPIError):
+            requested = self.server_delay(error.headers)
+            if requested is not None:
+                if requested > self.max_retry_after:
+                    raise PexelsRateLimitError(
+                        f"Server asked to wait {requested:.0f}s before retrying, longer than max_retry_after ({self.max_retry_after:.0f}s).",
+                        error.status_code, error.headers
+                    ) from error
+                delay = max(delay, requested)
+
+        if self.deadline is not None and time.monotonic() - started + delay >= self.deadline:
+            return None
+
+        return delay
+
+
+    def attempt_timeout(self, timeout: float, started: float) -> float:
+        """Clamp a per-request timeout to the time left before the deadline"""
+
+        if self.deadline is None:
+            return timeout
+        return max(0.001, min(timeout, self.deadline - (time.monotonic() - started)))
@@ -0,0 +1,81 @@
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without msgspec
+    msgspec = None
+
+from .models import Photo, Video, Collection
+from .utils import parse_photo, parse_video, parse_collection
+
+
+# Response envelopes of the list endpoints. Only the result items are declared; other
+# keys (`page`, `next_page`, ...) are skipped by the decoder without being built.
+
+@dataclass
+class PhotoPage:
+    photos: List[Photo] = field(default_factory=list)
+
+
+@dataclass
+class VideoPage:
+    videos: List[Video] = field(default_factory=list)
+
+
+@dataclass
+class CollectionPage:
+    collections: List[Collection] = field(default_factory=list)
+
+
+# schema and dict parser of each response shape, by the key holding its items
+# (or the model name for single-object responses)
+SCHEMAS: Dict[str, Any] = {
+    "photos": (PhotoPage, lambda data: [parse_photo(p) for p in data.get('photos', [])]),
+    "videos": (VideoPage, lambda data: [parse_video(v) for v in data.get('videos', [])]),
+    "collections": (CollectionPage, lambda data: [parse_collection(c) for c in data.get('collections', [])]),
+    "photo": (Photo, parse_photo),
+    "video": (Video, parse_video),
+}
+
+
+@lru_cache(maxsize=None)
+def _decoder(shape: str) -> Callable[[bytes], Any]:
+    schema, _ = SCHEMAS[shape]
+    decode = msgspec.json.Decoder(schema).decode
+    if shape in ("photo", "video"):
+        return decode
+    return lambda content: getattr(decode(content), shape)
+
+
+def parse_models(data: Dict[str, Any], shape: str) -> Any:
+    """Parse a decoded response dict into the models of `shape` with `pypexel.utils`"""
+
+    _, parse = SCHEMAS[shape]
+    return parse(data)
+
+
+def decode_to_models(content: bytes, shape: str, loads: Callable[[bytes], Any]) -> Any:
+    """Decode a response body straight into models in one pass.
+
+    The models' field defaults fill in missing keys, as with `parse_*`. Responses the
+    schema rejects, such as a `null` where a string is declared, are decoded with `loads`
+    and parsed from the dict instead.
+
+    Args:
+        content (bytes): JSON response body
+        shape (str): Response shape, a key of `SCHEMAS`
+        loads (Callable): Fallback JSON decoder
+
+    Returns:
+        A list of models for list endpoints, else a single model
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+
+    try:
+        return _decoder(shape)(content)
+    except msgspec.ValidationError:
+        return parse_models(loads(content), shape)
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one.
+
+    The first caller for a key runs the function; callers arriving while it is in flight
+    wait for it and receive the same result (or exception). Once the call finishes the
+    key is forgotten, so later calls run again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run `fn`, or wait for the in-flight call with the same `key`, and return its result"""
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """asyncio counterpart of `SingleFlight`.
+
+    The call runs in its own task, so cancelling one waiting caller does not cancel the
+    request for the others.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, "asyncio.Future"] = {}
+
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await `fn()`, or the in-flight call with the same `key`, and return its result"""
+
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+        return await asyncio.shield(task)
@@ -0,0 +1,377 @@
+import os
+import time
+import shutil
+import sqlite3
+import weakref
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Optional, Iterator, BinaryIO
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+# ioctl request cloning one file's extents into another (Linux btrfs/XFS reflinks)
+FICLONE = 0x40049409
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: str, algorithm: str = "sha256") -> str:
+    """Return the hex digest of a file's contents"""
+
+    digest = hashlib.new(algorithm)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    with open(path, 'rb') as f, memoryview(buffer) as view:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def link_or_copy(source: str, destination: str) -> str:
+    """Make `destination` share `source`'s data: a hard link, else a reflink, else a copy.
+
+    Returns:
+        str: The method used: `link`, `reflink` or `copy`
+    """
+
+    tmp_path = f"{destination}.tmp"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+
+    try:
+        os.link(source, tmp_path)
+        method = "link"
+    except OSError:
+        method = "copy"
+        if fcntl is not None:
+            try:
+                with open(source, 'rb') as src, open(tmp_path, 'wb') as dst:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                method = "reflink"
+            except OSError:
+                pass
+        if method == "copy":
+            shutil.copyfile(source, tmp_path)
+
+    os.replace(tmp_path, destination)
+    return method
+
+
+class _KeyLock:
+    """A thread lock that can be held in a `WeakValueDictionary`"""
+
+    __slots__ = ("_lock", "__weakref__")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self._lock.__enter__()
+
+    def __exit__(self, *args):
+        return self._lock.__exit__(*args)
+
+
+class DownloadStore:
+    """Content-addressed store deduplicating downloaded media on disk.
+
+    Files are keyed by media ID and rendition URL and stored once per content hash under
+    a sharded layout (`objects/ab/cd/abcd...`). A SQLite index maps keys to objects and
+    tracks access times, so repeated downloads of the same rendition are served from disk
+    by hard-linking (or reflinking, or copying) the object to the requested path with no
+    network I/O. When `max_bytes` is exceeded the least recently used objects are removed;
+    files already linked elsewhere keep their data. Hard-linked files share their data
+    with the store, so replace rather than edit them in place.
+
+    Args:
+        root (str): Directory holding the objects and index
+        max_bytes (int, optional): Maximum total size of stored objects (default: unbounded)
+        algorithm (str, optional): `hashlib` algorithm used to address content (default: `sha256`)
+        verify (bool, optional): Re-hash objects before serving them, dropping corrupt ones (default: `False`, check size only)
+        timeout (float, optional): Seconds to wait for a lock held by another connection (default: `30`)
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_bytes: Optional[int] = None,
+        algorithm: str = "sha256",
+        verify: bool = False,
+        timeout: float = 30
+    ):
+        hashlib.new(algorithm)
+
+        self.root = os.fspath(root)
+        self.max_bytes = max_bytes
+        self.algorithm = algorithm
+        self.verify = verify
+        self.timeout = timeout
+
+        os.makedirs(os.path.join(self.root, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(self.root, "staging"), exist_ok=True)
+
+        self._local = threading.local()
+        self._locks: "weakref.WeakValueDictionary[str, _KeyLock]" = weakref.WeakValueDictionary()
+        self._locks_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS objects ("
+            "digest TEXT PRIMARY KEY, "
+            "size INTEGER NOT NULL, "
+            "accessed_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS keys ("
+            "key TEXT PRIMARY KEY, "
+            "digest TEXT NOT NULL REFERENCES objects (digest) ON DELETE CASCADE)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS objects_accessed_at ON objects (accessed_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS keys_digest ON keys (digest)")
+
+        # running object count and size, kept by triggers so limits are checked without a table scan
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS totals ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), "
+                "objects INTEGER NOT NULL, "
+                "bytes INTEGER NOT NULL)"
+            )
+            conn.execute("INSERT OR IGNORE INTO totals SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM objects")
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS objects_insert AFTER INSERT ON objects BEGIN "
+                "UPDATE totals SET objects = objects + 1, bytes = bytes + new.size; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS objects_delete AFTER DELETE ON objects BEGIN "
+                "UPDATE totals SET objects = objects - 1, bytes = bytes - old.size; END"
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(os.path.join(self.root, "index.sqlite3"), timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+
+    @staticmethod
+    def key_for(media_id: int, url: str) -> str:
+        """Build the index key of a media rendition"""
+        return f"{media_id}:{url}"
+
+
+    def object_path(self, digest: str) -> str:
+        """Return the sharded path of the object with a given digest"""
+        return os.path.join(self.root, "objects", digest[:2], digest[2:4], digest)
+
+
+    def staging_path(self, key: str) -> str:
+        """Return a stable path to download `key` into before it is added, so partial downloads resume"""
+
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, "staging", name)
+
+
+    def lock_file(self, key: str) -> Optional[BinaryIO]:
+        """Take an exclusive `flock` on a lock file next to `key`'s staging path, blocking until other processes release it.
+
+        Returns:
+            BinaryIO: The open lock file; closing it releases the lock. None where `fcntl` is not available
+        """
+
+        if fcntl is None:
+            return None
+
+        f = open(f"{self.staging_path(key)}.lock", 'ab')
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        except BaseException:
+            f.close()
+            raise
+        return f
+
+
+    @contextmanager
+    def locked(self, key: str) -> Iterator[None]:
+        """Serialize downloads of the same key across threads and, where `fcntl` is available, processes"""
+
+        with self._locks_lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = _KeyLock()
+
+        with lock:
+            lock_file = self.lock_file(key)
+            try:
+                yield
+            finally:
+                if lock_file is not None:
+                    lock_file.close()
+
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT objects FROM totals").fetchone()[0]
+
+
+    @property
+    def current_bytes(self) -> int:
+        """Total size of the stored objects"""
+        return self._connection().execute("SELECT bytes FROM totals").fetchone()[0]
+
+
+    def get(self, media_id: int, url: str) -> Optional[str]:
+        """Return the path of the stored object for a rendition, or None if it is not stored.
+
+        Objects that are missing, truncated or (with `verify`) fail their hash check are
+        dropped from the index.
+        """
+
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT objects.digest, objects.size FROM keys JOIN objects ON keys.digest = objects.digest WHERE keys.key = ?",
+            (self.key_for(media_id, url),)
+        ).fetchone()
+        if row is None:
+            return None
+
+        digest, size = row
+        path = self.object_path(digest)
+        try:
+            intact = os.path.getsize(path) == size and (not self.verify or file_digest(path, self.algorithm) == digest)
+        except OSError:
+            intact = False
+
+        if not intact:
+            self._remove(conn, digest)
+            return None
+
+        conn.execute("UPDATE objects SET accessed_at = ? WHERE digest = ?", (time.time(), digest))
+        return path
+
+
+    def add(self, media_id: int, url: str, path: str) -> str:
+        """Move a downloaded file into the store and index it under its rendition.
+
+        If identical content is already stored, `path` is deleted and the existing object
+        is reused.
+
+        Returns:
+            str: Path of the stored object
+        """
+
+        digest = file_digest(path, self.algorithm)
+        object_path = self.object_path(digest)
+
+        if os.path.exists(object_path):
+            os.remove(path)
+        else:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.replace(path, object_path)
+
+        size = os.path.getsize(object_path)
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO objects (digest, size, accessed_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (digest) DO UPDATE SET accessed_at = excluded.accessed_at",
+                (digest, size, time.time())
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO keys (key, digest) VALUES (?, ?)",
+                (self.key_for(media_id, url), digest)
+            )
+            evicted = self._evict(conn, keep=digest)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        for old in evicted:
+            self._unlink(old)
+
+        return object_path
+
+
+    def materialize(self, object_path: str, destination: str) -> str:
+        """Place a stored object at `destination`, see `link_or_copy`"""
+        return link_or_copy(object_path, destination)
+
+
+    def clear(self) -> None:
+        """Remove every stored object"""
+
+        conn = self._connection()
+        digests = [row[0] for row in conn.execute("SELECT digest FROM objects").fetchall()]
+        conn.execute("DELETE FROM objects")
+        for digest in digests:
+            self._unlink(digest)
+
+
+    def close(self) -> None:
+        """Close this thread's database connection"""
+
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+    def _remove(self, conn: sqlite3.Connection, digest: str) -> None:
+        conn.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+        self._unlink(digest)
+
+
+    def _unlink(self, digest: str) -> None:
+        try:
+            os.remove(self.object_path(digest))
+        except FileNotFoundError:
+            pass
+
+
+    def _evict(self, conn: sqlite3.Connection, keep: str) -> list:
+        """Drop least recently used objects other than `keep` until `max_bytes` is met, returning their digests.
+
+        Walks the `accessed_at` index and stops at the first object that is not needed, so
+        an eviction reads only the rows it removes.
+        """
+
+        if self.max_bytes is None:
+            return []
+
+        total = conn.execute("SELECT bytes FROM totals").fetchone()[0]
+        evicted = []
+        if total <= self.max_bytes:
+            return evicted
+
+        cursor = conn.execute("SELECT digest, size FROM objects WHERE digest != ? ORDER BY accessed_at", (keep,))
+        try:
+            for digest, size in cursor:
+                if total <= self.max_bytes:
+                    break
+                total -= size
+                evicted.append(digest)
+        finally:
+            cursor.close()
+
+        conn.executemany("DELETE FROM objects WHERE digest = ?", ((digest,) for digest in evicted))
+        return evicted
@@ -0,0 +1,272 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - exercised only without numpy
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pyarrow = None
+
+from .models import Photo, PhotoSRC, Video, User
+from .renditions import PHOTO_SIZES
+
+
+# packed `avg_color` of photos without a valid `#RRGGBB` color
+MISSING_COLOR = 0xFFFFFFFF
+
+# Arrow types of the `array.array` typecodes used by the tables
+ARROW_TYPES: Dict[str, Any] = {}
+if pyarrow is not None:
+    ARROW_TYPES = {"q": pyarrow.int64(), "i": pyarrow.int32(), "I": pyarrow.uint32()}
+
+
+def pack_color(color: Optional[str]) -> int:
+    """Pack a `#RRGGBB` color into an integer `0xRRGGBB`, or `MISSING_COLOR` if it is not one"""
+
+    if not color or len(color) != 7 or color[0] != "#":
+        return MISSING_COLOR
+    try:
+        return int(color[1:], 16)
+    except ValueError:
+        return MISSING_COLOR
+
+
+def unpack_color(value: int) -> str:
+    """Inverse of `pack_color`, returning `''` for `MISSING_COLOR`"""
+
+    if value == MISSING_COLOR:
+        return ''
+    return f"#{value:06X}"
+
+
+class _Table:
+    """Columns of numbers in `array.array`s and of strings in lists, filled one item at a time.
+
+    Subclasses declare `NUMERIC` as (column, typecode) pairs and `TEXT` as column names.
+    """
+
+    NUMERIC: Tuple[Tuple[str, str], ...] = ()
+    TEXT: Tuple[str, ...] = ()
+
+    def __init__(self, items: Iterable[Any] = ()):
+        self._columns: Dict[str, Union[array, List[str]]] = {name: array(code) for name, code in self.NUMERIC}
+        self._columns.update((name, []) for name in self.TEXT)
+        self.extend(items)
+
+
+    def __len__(self) -> int:
+        return len(self._columns[self.NUMERIC[0][0]])
+
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)})"
+
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names, numeric columns first"""
+        return list(self._columns)
+
+
+    def column(self, name: str) -> Union[array, List[str]]:
+        """Return a column: an `array.array` for numbers, a list for strings"""
+        return self._columns[name]
+
+
+    def append(self, item: Any) -> None:
+        raise NotImplementedError
+
+
+    def _append_row(self, numbers: Tuple[int, ...], texts: Tuple[str, ...]) -> None:
+        """Append one value per column, leaving the table unchanged if a number does not fit its column"""
+
+        appended = []
+        try:
+            for (name, _), value in zip(self.NUMERIC, numbers):
+                self._columns[name].append(value)
+                appended.append(name)
+        except (TypeError, OverflowError):
+            for name in appended:
+                self._columns[name].pop()
+            raise
+
+        for name, value in zip(self.TEXT, texts):
+            self._columns[name].append(value)
+
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Append every item, e.g. those yielded by an `iter_*` method"""
+
+        for item in items:
+            self.append(item)
+
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the numeric columns, in bytes"""
+        return sum(self._columns[name].itemsize * len(self) for name, _ in self.NUMERIC)
+
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray"]:
+        """Copy the columns into NumPy arrays, strings as object arrays.
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+
+        if numpy is None:
+            raise ImportError("to_numpy() requires numpy. Install it with `pip install numpy`.")
+
+        arrays = {name: numpy.array(self._columns[name]) for name, _ in self.NUMERIC}
+        arrays.update((name, numpy.array(self._columns[name], dtype=object)) for name in self.TEXT)
+        return arrays
+
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Copy the columns into a `pyarrow.Table`.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+
+        if pyarrow is None:
+            raise ImportError("to_arrow() requires pyarrow. Install it with `pip install pyarrow`.")
+
+        arrays = {}
+        for name, code in self.NUMERIC:
+            column = self._columns[name]
+            arrays[name] = pyarrow.Array.from_buffers(ARROW_TYPES[code], len(column), [None, pyarrow.py_buffer(column.tobytes())])
+        for name in self.TEXT:
+            arrays[name] = pyarrow.array(self._columns[name], type=pyarrow.string())
+        return pyarrow.table(arrays)
+
+
+class PhotoTable(_Table):
+    """Photos stored column by column instead of as `Photo` objects.
+
+    Rows are appended from raw API dicts (as yielded by `iter_search_photos` and the
+    other page methods) or from `Photo`/`LazyPhoto` objects. `avg_color` is packed into
+    an integer `0xRRGGBB` (`MISSING_COLOR` when absent); each `src` rendition gets its own
+    `src_<size>` column. Indexing returns a `Photo`.
+
+    Args:
+        items (Iterable, optional): Photos to append
+    """
+
+    NUMERIC = (
+        ("id", "q"),
+        ("width", "i"),
+        ("height", "i"),
+        ("photographer_id", "q"),
+        ("avg_color", "I"),
+    )
+    TEXT = ("url", "photographer", "photographer_url", "alt") + tuple(f"src_{size}" for size in PHOTO_SIZES)
+
+    def append(self, photo: Union[Dict[str, Any], Photo]) -> None:
+        """Append a photo from its raw dict or a Photo object.
+
+        Raises:
+            TypeError: If a numeric field is not an integer
+            OverflowError: If a numeric field does not fit its column
+        """
+
+        if isinstance(photo, dict):
+            src = photo.get('src') or {}
+            self._append_row(
+                (photo.get('id') or 0, photo.get('width') or 0, photo.get('height') or 0,
+                 photo.get('photographer_id') or 0, pack_color(photo.get('avg_color'))),
+                (photo.get('url') or '', photo.get('photographer') or '', photo.get('photographer_url') or '',
+                 photo.get('alt') or '') + tuple(src.get(size) or '' for size in PHOTO_SIZES)
+            )
+        else:
+            self._append_row(
+                (photo.id or 0, photo.width or 0, photo.height or 0, photo.photographer_id or 0, pack_color(photo.avg_color)),
+                (photo.url or '', photo.photographer or '', photo.photographer_url or '', photo.alt or '')
+                + tuple(getattr(photo.src, size) or '' for size in PHOTO_SIZES)
+            )
+
+
+    def __getitem__(self, index: int) -> Photo:
+        c = self._columns
+        return Photo(
+            id=c["id"][index],
+            width=c["width"][index],
+            height=c["height"][index],
+            url=c["url"][index],
+            photographer=c["photographer"][index],
+            photographer_url=c["photographer_url"][index],
+            photographer_id=c["photographer_id"][index],
+            avg_color=unpack_color(c["avg_color"][index]),
+            src=PhotoSRC(**{size: c[f"src_{size}"][index] for size in PHOTO_SIZES}),
+            alt=c["alt"][index]
+        )
+
+
+class VideoTable(_Table):
+    """Videos stored column by column instead of as `Video` objects.
+
+    Like `PhotoTable`, for videos. Video files and preview pictures are not stored;
+    indexing returns a `Video` without them.
+
+    Args:
+        items (Iterable, optional): Videos to append
+    """
+
+    NUMERIC = (
+        ("id", "q"),
+        ("width", "i"),
+        ("height", "i"),
+        ("duration", "i"),
+        ("user_id", "q"),
+    )
+    TEXT = ("url", "image", "user_name", "user_url")
+
+    def append(self, video: Union[Dict[str, Any], Video]) -> None:
+        """Append a video from its raw dict or a Video object.
+
+        Raises:
+            TypeError: If a numeric field is not an integer
+            OverflowError: If a numeric field does not fit its column
+        """
+
+        if isinstance(video, dict):
+            user = video.get('user') or {}
+            self._append_row(
+                (video.get('id') or 0, video.get('width') or 0, video.get('height') or 0,
+                 video.get('duration') or 0, user.get('id') or 0),
+                (video.get('url') or '', video.get('image') or '', user.get('name') or '', user.get('url') or '')
+            )
+        else:
+            self._append_row(
+                (video.id or 0, video.width or 0, video.height or 0, video.duration or 0, video.user.id or 0),
+                (video.url or '', video.image or '', video.user.name or '', video.user.url or '')
+            )
+
+
+    def __getitem__(self, index: int) -> Video:
+        c = self._columns
+        return Video(
+            id=c["id"][index],
+            width=c["width"][index],
+            height=c["height"][index],
+            url=c["url"][index],
+            image=c["image"][index],
+            duration=c["duration"][index],
+            user=User(id=c["user_id"][index], name=c["user_name"][index], url=c["user_url"][index])
+        )
+
+
+def media_tables(items: Iterable[Dict[str, Any]]) -> Tuple[PhotoTable, VideoTable]:
+    """Split raw collection media into a PhotoTable and a VideoTable, by their `type`"""
+
+    photos, videos = PhotoTable(), VideoTable()
+    for item in items:
+        if item.get('type', '') == 'Video':
+            videos.append(item)
+        else:
+            photos.append(item)
+    return photos, videos
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Union
 
 from .models import (
     Photo,
@@ -11,11 +11,10 @@ from .models import (
 )
 
 
-def parse_photo(photo_data: Dict[str, Any]) -> Photo:
-    """Parse raw photo data into Photo dataclass"""
+def parse_photo_src(src_data: Dict[str, Any]) -> PhotoSRC:
+    """Parse the `src` URLs of a photo into a PhotoSRC dataclass"""
 
-    src_data = photo_data.get('src', {})
-    photo_src = PhotoSRC(
+    return PhotoSRC(
         original=src_data.get('original', ''),
         large=src_data.get('large', ''),
         large2x=src_data.get('large2x', ''),
@@ -26,6 +25,13 @@ def parse_photo(photo_data: Dict[str, Any]) -> Photo:
         tiny=src_data.get('tiny', '')
     )
 
+
+def parse_photo(photo_data: Dict[str, Any], lazy: bool = False) -> Union[Photo, "LazyPhoto"]:
+    """Parse raw photo data into Photo dataclass, or a LazyPhoto wrapping it if `lazy`"""
+
+    if lazy:
+        return LazyPhoto(photo_data)
+
     return Photo(
         id=photo_data.get('id', 0),
         width=photo_data.get('width', 0),
@@ -35,42 +41,57 @@ def parse_photo(photo_data: Dict[str, Any]) -> Photo:
         photographer_url=photo_data.get('photographer_url', ''),
         photographer_id=photo_data.get('photographer_id', 0),
         avg_color=photo_data.get('avg_color', ''),
-        src=photo_src,
+        src=parse_photo_src(photo_data.get('src', {})),
         alt=photo_data.get('alt', '')
     )
 
 
-def parse_video(video_data: Dict[str, Any]) -> Video:
-    """Parse raw video data into Video dataclass"""
+def parse_user(user_data: Dict[str, Any]) -> User:
+    """Parse raw user data into User dataclass"""
 
-    user_data = video_data.get('user', {})
-    user = User(
+    return User(
         id=user_data.get('id', 0),
         name=user_data.get('name', ''),
         url=user_data.get('url', '')
     )
 
-    video_files = []
-    for file_data in video_data.get('video_files', []):
-        video_file = VideoFile(
+
+def parse_video_files(video_data: Dict[str, Any]) -> List[VideoFile]:
+    """Parse the files of raw video data into VideoFile dataclasses"""
+
+    return [
+        VideoFile(
             id=file_data.get('id', 0),
             quality=file_data.get('quality', ''),
             file_type=file_data.get('file_type', ''),
             width=file_data.get('width', 0),
             height=file_data.get('height', 0),
             fps=file_data.get('fps', 0.0),
-            link=file_data.get('link', '')
+            link=file_data.get('link', ''),
+            size=file_data.get('size')
         )
-        video_files.append(video_file)
+        for file_data in video_data.get('video_files', [])
+    ]
 
-    video_pictures = []
-    for pic_data in video_data.get('video_pictures', []):
-        video_picture = VideoPicture(
+
+def parse_video_pictures(video_data: Dict[str, Any]) -> List[VideoPicture]:
+    """Parse the preview pictures of raw video data into VideoPicture dataclasses"""
+
+    return [
+        VideoPicture(
             id=pic_data.get('id', 0),
             picture=pic_data.get('picture', ''),
             nr=pic_data.get('nr', 0)
         )
-        video_pictures.append(video_picture)
+        for pic_data in video_data.get('video_pictures', [])
+    ]
+
+
+def parse_video(video_data: Dict[str, Any], lazy: bool = False) -> Union[Video, "LazyVideo"]:
+    """Parse raw video data into Video dataclass, or a LazyVideo wrapping it if `lazy`"""
+
+    if lazy:
+        return LazyVideo(video_data)
 
     return Video(
         id=video_data.get('id', 0),
@@ -79,11 +100,149 @@ def parse_video(video_data: Dict[str, Any]) -> Video:
         url=video_data.get('url', ''),
         image=video_data.get('image', ''),
         duration=video_data.get('duration', 0),
-        user=user,
-        video_files=video_files,
-        video_pictures=video_pictures
+        user=parse_user(video_data.get('user', {})),
+        video_files=parse_video_files(video_data),
+        video_pictures=parse_video_pictures(video_data)
     )
 
+
+def _raw_field(key: str, default: Any) -> property:
+    """Property reading `key` from the wrapped response dict"""
+
+    return property(lambda self: self._data.get(key, default), doc=f"`{key}` of the raw response")
+
+
+class LazyPhoto:
+    """Photo read from its raw response dict on access.
+
+    Scalar fields are looked up in the dict each time and `src` is parsed into a
+    PhotoSRC on first access, so wrapping a result costs one small object. Attributes
+    match Photo; use `materialize()` for a real Photo. Like Photo, instances hash by ID.
+    """
+
+    __slots__ = ("_data", "_src")
+
+    id = _raw_field('id', 0)
+    width = _raw_field('width', 0)
+    height = _raw_field('height', 0)
+    url = _raw_field('url', '')
+    photographer = _raw_field('photographer', '')
+    photographer_url = _raw_field('photographer_url', '')
+    photographer_id = _raw_field('photographer_id', 0)
+    avg_color = _raw_field('avg_color', '')
+    alt = _raw_field('alt', '')
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        self._src: Optional[PhotoSRC] = None
+
+
+    @property
+    def src(self) -> PhotoSRC:
+        if self._src is None:
+            self._src = parse_photo_src(self._data.get('src', {}))
+        return self._src
+
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The wrapped response dict"""
+        return self._data
+
+
+    def materialize(self) -> Photo:
+        """Parse the wrapped dict into a Photo"""
+        return parse_photo(self._data)
+
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyPhoto):
+            return self._data == other._data
+        if isinstance(other, Photo):
+            return self.materialize() == other
+        return NotImplemented
+
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+    def __repr__(self) -> str:
+        return f"LazyPhoto(id={self.id!r})"
+
+
+class LazyVideo:
+    """Video read from its raw response dict on access.
+
+    Scalar fields are looked up in the dict each time; `user`, `video_files` and
+    `video_pictures` are parsed on first access. Attributes match Video; use
+    `materialize()` for a real Video. Like Video, instances hash by ID.
+    """
+
+    __slots__ = ("_data", "_user", "_video_files", "_video_pictures")
+
+    id = _raw_field('id', 0)
+    width = _raw_field('width', 0)
+    height = _raw_field('height', 0)
+    url = _raw_field('url', '')
+    image = _raw_field('image', '')
+    duration = _raw_field('duration', 0)
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        self._user: Optional[User] = None
+        self._video_files: Optional[List[VideoFile]] = None
+        self._video_pictures: Optional[List[VideoPicture]] = None
+
+
+    @property
+    def user(self) -> User:
+        if self._user is None:
+            self._user = parse_user(self._data.get('user', {}))
+        return self._user
+
+
+    @property
+    def video_files(self) -> List[VideoFile]:
+        if self._video_files is None:
+            self._video_files = parse_video_files(self._data)
+        return self._video_files
+
+
+    @property
+    def video_pictures(self) -> List[VideoPicture]:
+        if self._video_pictures is None:
+            self._video_pictures = parse_video_pictures(self._data)
+        return self._video_pictures
+
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The wrapped response dict"""
+        return self._data
+
+
+    def materialize(self) -> Video:
+        """Parse the wrapped dict into a Video"""
+        return parse_video(self._data)
+
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyVideo):
+            return self._data == other._data
+        if isinstance(other, Video):
+            return self.materialize() == other
+        return NotImplemented
+
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+    def __repr__(self) -> str:
+        return f"LazyVideo(id={self.id!r})"
+
+
 def parse_collection(collection_data: Dict[str, Any]) -> Collection:
     """Parse raw collection data into Colleciton dataclass"""
 
@@ -95,4 +254,37 @@ def parse_collection(collection_data: Dict[str, Any]) -> Collection:
         media_count=collection_data.get('media_count', 0),
         photos_count=collection_data.get('photos_count', 0),
         videos_count=collection_data.get('videos_count', 0)
-    )
\ No newline at end of file
+    )
+
+
+def parse_collection_media(response: Dict[str, Any], lazy: bool = False) -> List[Union[Video, Photo]]:
+    """Parse the media of a collection response into Video and Photo dataclasses, or their lazy variants if `lazy`"""
+
+    media = response.get('media', [])
+    videos = [parse_video(video, lazy) for video in [m for m in media if m.get('type', '') == 'Video']]
+    pictures = [parse_photo(photo, lazy) for photo in [m for m in media if m.get('type', '') == 'Photo']]
+    return videos + pictures
+
+
+def validate_query(query: str) -> None:
+    """Validate a search query"""
+
+    if not query:
+        raise ValueError("Query parameter is required")
+
+
+def validate_pagination(page: int, per_page: int) -> None:
+    """Validate page and per_page parameters"""
+
+    if per_page > 80:
+        raise ValueError("per_page cannot exceed 80")
+    
+    if page < 1:
+        raise ValueError("page must be >= 1")
+
+
+def validate_media_type(media_type: Optional[str]) -> None:
+    """Validate a collection media type filter"""
+
+    if media_type not in ['photos', 'videos', None]:
+        raise ValueError("media_type must be either `photos` or `videos`")
@@ -12,7 +12,7 @@ setup(
     # long_description=desc,
     long_description_content_type="text/markdown",
     url="https://github.com/JRichm/pypexel",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -35,6 +35,17 @@ setup(
         "python-dotenv>=1.0.1",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.24",
+        ],
+        "fast": [
+            "orjson>=3.6",
+            "msgspec>=0.18",
+        ],
+        "export": [
+            "pyarrow>=10",
+            "zstandard>=0.19",
+        ],
         "dev": [
             "pytest>=6.0",
             "black>=21.0",
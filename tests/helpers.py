@@ -0,0 +1,141 @@
+import io
+import time
+import threading
+import requests
+import urllib3
+
+from pypexel.models import Photo, PhotoSRC
+
+
+class FakeRaw(io.BytesIO):
+    decode_content = False
+
+
+class BrokenRaw(FakeRaw):
+    """Raises like urllib3 once `fail_after` bytes have been read"""
+
+    def __init__(self, body, fail_after):
+        super().__init__(body)
+        self.fail_after = fail_after
+
+    def readinto(self, buffer):
+        if self.tell() >= self.fail_after:
+            raise urllib3.exceptions.ProtocolError("Connection broken")
+        with memoryview(buffer) as view:
+            return super().readinto(view[:self.fail_after - self.tell()])
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers if headers is not None else {"Content-Length": str(len(body))}
+        self.reason = "Reason"
+        self.raw = FakeRaw(body)
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class BrokenResponse(FakeResponse):
+    """Drops the connection after `fail_after` bytes"""
+
+    def __init__(self, status_code, body, headers, fail_after):
+        super().__init__(status_code, body, headers)
+        self.fail_after = fail_after
+        self.raw = BrokenRaw(body, fail_after)
+
+    def iter_content(self, chunk_size=1):
+        sent = 0
+        for chunk in super().iter_content(chunk_size):
+            if sent + len(chunk) > self.fail_after:
+                raise requests.exceptions.ChunkedEncodingError("Connection broken")
+            sent += len(chunk)
+            yield chunk
+
+
+class FakeSession:
+    """Serves one file, optionally honoring Range requests"""
+
+    def __init__(self, content, ranges=True, head_ranges=None, etag='"v1"', fail_after=None):
+        self.content = content
+        self.ranges = ranges
+        self.head_ranges = ranges if head_ranges is None else head_ranges
+        self.etag = etag
+        self.fail_after = fail_after
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def head(self, url, **kwargs):
+        headers = {"Content-Length": str(len(self.content)), "ETag": self.etag}
+        if self.head_ranges:
+            headers["Accept-Ranges"] = "bytes"
+        return FakeResponse(200, headers=headers)
+
+    def get(self, url, headers=None, **kwargs):
+        headers = headers or {}
+        with self.lock:
+            self.requests.append(headers)
+
+        status_code, body = 200, self.content
+        range_header = headers.get("Range")
+        if range_header and self.ranges and headers.get("If-Range", self.etag) == self.etag:
+            start, end = range_header[len("bytes="):].split("-")
+            end = int(end) if end else len(self.content) - 1
+            status_code, body = 206, self.content[int(start):end + 1]
+
+        response_headers = {"Content-Length": str(len(body)), "ETag": self.etag}
+        if self.fail_after is not None:
+            return BrokenResponse(status_code, body, response_headers, self.fail_after)
+        return FakeResponse(status_code, body, response_headers)
+
+
+class FileSession:
+    """Serves `files` keyed by URL and records request order and concurrency per host"""
+
+    def __init__(self, files, delay=0, missing_status=404):
+        self.files = files
+        self.delay = delay
+        self.missing_status = missing_status
+        self.urls = []
+        self.active = {}
+        self.peak = {}
+        self.lock = threading.Lock()
+
+    def get(self, url, headers=None, **kwargs):
+        host = url.split("/")[2]
+        with self.lock:
+            self.urls.append(url)
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+
+        time.sleep(self.delay)
+
+        with self.lock:
+            self.active[host] -= 1
+
+        if url not in self.files:
+            return FakeResponse(self.missing_status)
+        return FakeResponse(200, self.files[url])
+
+
+def make_photo(photo_id=3, width=4000, height=3000, host="images.pexels.com"):
+    base = f"https://{host}/photos/{photo_id}/pexels-photo-{photo_id}.jpeg"
+    src = PhotoSRC(
+        original=base,
+        large2x=f"{base}?dpr=2&h=650&w=940",
+        large=f"{base}?h=650&w=940",
+        medium=f"{base}?h=350",
+        small=f"{base}?h=130",
+        portrait=f"{base}?fit=crop&h=1200&w=800",
+        landscape=f"{base}?fit=crop&h=627&w=1200",
+        tiny=f"{base}?fit=crop&h=200&w=280"
+    )
+    return Photo(photo_id, width, height, "", "", "", 1, "#000000", src, "")
@@ -0,0 +1,439 @@
+import io
+import json
+import inspect
+import asyncio
+import threading
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+httpx = pytest.importorskip("httpx")
+
+from pypexel.async_pypexel import AsyncPexels
+from pypexel.cache import MemoryCache, SQLiteCache
+from pypexel.store import DownloadStore
+from pypexel.pypexel import Pexels, PexelsAPIError
+from pypexel.models import Photo, PhotoSRC, Video, VideoFile, User, Collection
+
+
+def make_client(handler):
+    return AsyncPexels(api_key="test-api-key", client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def json_handler(payload, status_code=200, requests_seen=None):
+    def handler(request):
+        if requests_seen is not None:
+            requests_seen.append(request)
+        return httpx.Response(status_code, json=payload)
+    return handler
+
+
+class TestAsyncRequests:
+    def test_successful_request(self):
+        seen = []
+        pexels = make_client(json_handler({"test": "data"}, requests_seen=seen))
+
+        result = asyncio.run(pexels._make_request("test_endpoint", {"query": "test", "none_value": None}))
+
+        assert result == {"test": "data"}
+        assert len(seen) == 1
+        assert seen[0].headers["Authorization"] == "test-api-key"
+        assert seen[0].url.params["query"] == "test"
+        assert "none_value" not in seen[0].url.params
+
+    @pytest.mark.parametrize("status_code,message", [
+        (429, "API rate limit exceeded"),
+        (403, "Invalid API key"),
+        (500, "HTTP error 500"),
+    ])
+    def test_http_errors(self, status_code, message):
+        pexels = make_client(json_handler({}, status_code=status_code))
+
+        with pytest.raises(PexelsAPIError, match=message):
+            asyncio.run(pexels._make_request("test-endpoint"))
+
+    def test_connection_error(self):
+        def handler(request):
+            raise httpx.ConnectError("Connection failed")
+
+        pexels = make_client(handler)
+
+        with pytest.raises(PexelsAPIError, match="Request failed"):
+            asyncio.run(pexels._make_request("test-endpoint"))
+
+    def test_context_manager_closes_owned_client(self):
+        async def run():
+            async with AsyncPexels(api_key="test-api-key") as pexels:
+                client = pexels.client
+            return client
+
+        assert asyncio.run(run()).is_closed
+
+
+class TestAsyncCoalescing:
+    def test_concurrent_identical_requests_share_one_call(self):
+        seen = []
+
+        async def handler(request):
+            seen.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"photos": []})
+
+        pexels = make_client(handler)
+
+        async def run():
+            return await asyncio.gather(*(pexels.search_photos("trending") for _ in range(10)))
+
+        results = asyncio.run(run())
+
+        assert len(seen) == 1
+        assert len(results) == 10
+
+
+class TestAsyncRevalidation:
+    def test_conditional_get(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json={"photos": [1]}, headers={"ETag": '"v1"'})
+
+        cache = MemoryCache(ttl=10)
+        pexels = AsyncPexels(api_key="test-api-key", client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), cache=cache)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            first = asyncio.run(pexels.get_curated_photos())
+        with patch("pypexel.cache.time.monotonic", return_value=20.0):
+            second = asyncio.run(pexels.get_curated_photos())
+
+        assert first == second == {"photos": [1]}
+        assert len(seen) == 2
+        assert cache.stats.revalidations == 1
+
+    def test_stale_while_revalidate(self):
+        pages = iter([1, 2])
+
+        def handler(request):
+            return httpx.Response(200, json={"page": next(pages)})
+
+        cache = MemoryCache(ttl=10, stale_while_revalidate=60)
+        pexels = AsyncPexels(api_key="test-api-key", client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), cache=cache)
+
+        async def run():
+            with patch("pypexel.cache.time.monotonic", return_value=0.0):
+                await pexels.get_curated_photos()
+            with patch("pypexel.cache.time.monotonic", return_value=20.0):
+                stale = await pexels.get_curated_photos()
+                await asyncio.gather(*pexels._refreshing.values())
+                return stale, await pexels.get_curated_photos()
+
+        assert asyncio.run(run()) == ({"page": 1}, {"page": 2})
+        assert cache.stats.stale_hits == 1
+
+    def test_stale_if_error(self):
+        responses = iter([httpx.Response(200, json={"page": 1}), httpx.Response(503)])
+        cache = MemoryCache(ttl=10, stale_if_error=60)
+        pexels = AsyncPexels(api_key="test-api-key", client=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: next(responses))), cache=cache)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            asyncio.run(pexels.get_curated_photos())
+        with patch("pypexel.cache.time.monotonic", return_value=20.0):
+            assert asyncio.run(pexels.get_curated_photos()) == {"page": 1}
+
+    def test_sqlite_cache_runs_off_the_event_loop(self, tmp_path):
+        seen = []
+        threads = []
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), ttl=10)
+        pexels = AsyncPexels(api_key="test-api-key", client=httpx.AsyncClient(transport=httpx.MockTransport(json_handler({"page": 1}, requests_seen=seen))), cache=cache)
+
+        def record(func):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.get_ident())
+                return func(*args, **kwargs)
+            return wrapper
+
+        cache.get_entry = record(cache.get_entry)
+        cache.set = record(cache.set)
+
+        async def run():
+            return await pexels.get_curated_photos(), await pexels.get_curated_photos()
+
+        assert asyncio.run(run()) == ({"page": 1}, {"page": 1})
+        assert len(seen) == 1
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+
+
+class TestAsyncDecodeModels:
+    def test_get_photo(self):
+        pytest.importorskip("msgspec")
+        pexels = make_client(json_handler({"id": 1, "src": {"large": "l.jpg"}}))
+        pexels.decode_models = True
+
+        photo = asyncio.run(pexels.get_photo(1, as_object=True))
+
+        assert photo == Photo(id=1, src=PhotoSRC(large="l.jpg"))
+
+
+class TestAsyncMethods:
+    def test_search_photos_validation(self):
+        pexels = make_client(json_handler({}))
+
+        with pytest.raises(ValueError, match="Query parameter is required"):
+            asyncio.run(pexels.search_photos(""))
+
+        with pytest.raises(ValueError, match="per_page cannot exceed 80"):
+            asyncio.run(pexels.search_photos("test", per_page=100))
+
+    def test_search_photos_as_objects(self):
+        seen = []
+        pexels = make_client(json_handler({"photos": [{"id": 1, "src": {"large": "large.jpg"}}]}, requests_seen=seen))
+
+        result = asyncio.run(pexels.search_photos("nature", per_page=80, as_objects=True))
+
+        assert isinstance(result[0], Photo)
+        assert result[0].src.large == "large.jpg"
+        assert seen[0].url.path == "/v1/search"
+        assert seen[0].url.params["per_page"] == "80"
+
+    def test_get_video_uses_video_base_url(self):
+        seen = []
+        pexels = make_client(json_handler({"id": 2, "user": {"name": "Jane"}}, requests_seen=seen))
+
+        result = asyncio.run(pexels.get_video(2, as_object=True))
+
+        assert isinstance(result, Video)
+        assert str(seen[0].url) == "https://api.pexels.com/videos/videos/2"
+
+    def test_get_featured_collections_as_objects(self):
+        pexels = make_client(json_handler({"collections": [{"id": "abc", "title": "Nature"}]}))
+
+        result = asyncio.run(pexels.get_featured_collections(as_objects=True))
+
+        assert isinstance(result[0], Collection)
+        assert result[0].title == "Nature"
+
+    def test_concurrent_requests(self):
+        pexels = make_client(json_handler({"id": 1}))
+
+        async def run():
+            return await asyncio.gather(*(pexels.get_photo(i) for i in range(50)))
+
+        assert len(asyncio.run(run())) == 50
+
+    def test_get_photos_batch(self):
+        def handler(request):
+            photo_id = int(request.url.path.rsplit("/", 1)[1])
+            if photo_id == 3:
+                return httpx.Response(404, text="Not Found")
+            return httpx.Response(200, json={"id": photo_id})
+
+        pexels = make_client(handler)
+
+        batch = asyncio.run(pexels.get_photos([1, 2, 3, 2], max_workers=2, as_objects=True))
+
+        assert sorted(batch.results) == [1, 2]
+        assert isinstance(batch.results[1], Photo)
+        assert batch.errors[3].status_code == 404
+
+    def test_download_video(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        def handler(request):
+            return httpx.Response(200, content=b"video-bytes")
+
+        pexels = make_client(handler)
+        video = Video(
+            id=7, width=1920, height=1080, url="", image="", duration=1,
+            user=User(id=1, name="", url=""),
+            video_files=[VideoFile(id=1, quality="hd", file_type="video/mp4", width=1920, height=1080, fps=30.0, link="https://cdn.example.com/7.mp4")],
+            video_pictures=[]
+        )
+
+        filename = asyncio.run(pexels.download_video(video, "hd"))
+
+        assert filename == "7_hd.mp4"
+        assert (tmp_path / filename).read_bytes() == b"video-bytes"
+
+    @pytest.mark.parametrize("name", ["download_photo", "download_video"])
+    def test_download_signatures_match_sync(self, name):
+        sync = inspect.signature(getattr(Pexels, name))
+        async_ = inspect.signature(getattr(AsyncPexels, name))
+
+        assert list(async_.parameters.values()) == list(sync.parameters.values())
+
+    def test_download_video_errors_propagate(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pexels = make_client(lambda request: httpx.Response(404, text="Not Found"))
+        video = Video(
+            id=7, width=1920, height=1080, url="", image="", duration=1,
+            user=User(id=1, name="", url=""),
+            video_files=[VideoFile(id=1, quality="hd", file_type="video/mp4", width=1920, height=1080, fps=60.0, link="https://cdn.example.com/7.mp4")],
+            video_pictures=[]
+        )
+
+        with pytest.raises(ValueError, match="no file matching max_fps=30"):
+            asyncio.run(pexels.download_video(video, height=720, max_fps=30))
+
+        with pytest.raises(PexelsAPIError, match="HTTP error 404"):
+            asyncio.run(pexels.download_video(video, "hd"))
+
+    def test_download_video_resumes_part_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            assert request.headers["Range"] == "bytes=6-"
+            assert request.headers["If-Range"] == '"v1"'
+            return httpx.Response(206, content=b"bytes", headers={"ETag": '"v1"'})
+
+        (tmp_path / "7_hd.mp4.part").write_bytes(b"video-")
+        (tmp_path / "7_hd.mp4.part.json").write_text(json.dumps({
+            "url": "https://cdn.example.com/7.mp4", "size": 11, "etag": '"v1"', "last_modified": None, "ranges": [[0, 10, 6]]
+        }))
+
+        pexels = make_client(handler)
+        video = Video(
+            id=7, width=1920, height=1080, url="", image="", duration=1,
+            user=User(id=1, name="", url=""),
+            video_files=[VideoFile(id=1, quality="hd", file_type="video/mp4", width=1920, height=1080, fps=30.0, link="https://cdn.example.com/7.mp4")],
+            video_pictures=[]
+        )
+
+        assert asyncio.run(pexels.download_video(video, "hd", chunk_size=2)) == "7_hd.mp4"
+        assert (tmp_path / "7_hd.mp4").read_bytes() == b"video-bytes"
+        assert not (tmp_path / "7_hd.mp4.part").exists()
+        assert not (tmp_path / "7_hd.mp4.part.json").exists()
+        assert len(seen) == 1
+
+    def test_download_photo(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        seen = []
+
+        def handler(request):
+            seen.append(str(request.url))
+            return httpx.Response(200, content=b"photo-bytes")
+
+        pexels = make_client(handler)
+        url = "https://images.pexels.com/photos/3/photo.jpeg"
+        src = PhotoSRC(url, url, url, f"{url}?h=350", url, url, url, url)
+        photo = Photo(3, 4000, 3000, "", "", "", 1, "#000000", src, "")
+
+        filename = asyncio.run(pexels.download_photo(photo, width=400))
+        buffer = io.BytesIO()
+        written = asyncio.run(pexels.download_photo(photo, "medium", file=buffer))
+
+        assert filename == "3_medium.jpeg"
+        assert (tmp_path / filename).read_bytes() == b"photo-bytes"
+        assert written == len(b"photo-bytes") and buffer.getvalue() == b"photo-bytes"
+        assert seen == [f"{url}?h=350"] * 2
+
+    def test_concurrent_downloads_through_store(self, tmp_path):
+        seen = []
+
+        async def handler(request):
+            seen.append(str(request.url))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, content=b"photo-bytes")
+
+        pexels = AsyncPexels(
+            api_key="test-api-key",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            store=DownloadStore(str(tmp_path / "store"))
+        )
+        url = "https://images.pexels.com/photos/3/photo.jpeg"
+        photo = Photo(3, 4000, 3000, "", "", "", 1, "#000000", PhotoSRC(*[url] * 8), "")
+
+        async def run():
+            return await asyncio.gather(*(
+                pexels.download_photo(photo, path=str(tmp_path / f"copy{i}.jpeg")) for i in range(3)
+            ))
+
+        paths = asyncio.run(run())
+
+        assert len(seen) == 1
+        assert all(Path(path).read_bytes() == b"photo-bytes" for path in paths)
+
+    def test_download_into_memory(self):
+        def handler(request):
+            return httpx.Response(200, content=b"media-bytes")
+
+        pexels = make_client(handler)
+
+        async def run():
+            target = bytearray(b">")
+            fixed = bytearray(20)
+            chunks = [chunk async for chunk in pexels.iter_download("https://cdn.example.com/file", chunk_size=4)]
+            await pexels._download_into("https://cdn.example.com/file", target, 4)
+            await pexels._download_into("https://cdn.example.com/file", memoryview(fixed), 4)
+            with pytest.raises(ValueError):
+                await pexels._download_into("https://cdn.example.com/file", memoryview(bytearray(4)), 4)
+            return chunks, target, fixed
+
+        chunks, target, fixed = asyncio.run(run())
+
+        assert b"".join(chunks) == b"media-bytes"
+        assert target == b">media-bytes"
+        assert fixed[:11] == b"media-bytes"
+
+
+class TestAsyncPagination:
+    def test_iter_search_photos(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            page = int(request.url.params["page"])
+            response = {"page": page, "total_results": 100, "photos": [{"id": page * 100 + i} for i in range(50)]}
+            return httpx.Response(200, json=response)
+
+        pexels = make_client(handler)
+
+        async def run():
+            return [photo async for photo in pexels.iter_search_photos("nature", per_page=50, as_objects=True)]
+
+        photos = asyncio.run(run())
+
+        assert len(photos) == 100
+        assert isinstance(photos[0], Photo)
+        assert [r.url.params["page"] for r in seen] == ["1", "2"]
+
+    def test_iter_max_items_keeps_page_offset(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            page = int(request.url.params["page"])
+            response = {"page": page, "total_results": 400, "photos": [{"id": page * 100 + i} for i in range(80)]}
+            return httpx.Response(200, json=response)
+
+        pexels = make_client(handler)
+
+        async def run():
+            return [photo["id"] async for photo in pexels.iter_curated_photos(page=2, max_items=5)]
+
+        assert asyncio.run(run()) == [200, 201, 202, 203, 204]
+        assert [(r.url.params["page"], r.url.params["per_page"]) for r in seen] == [("2", "80")]
+
+    def test_iter_prefetch(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            page = int(request.url.params["page"])
+            response = {"page": page, "total_results": 400, "photos": [{"id": page * 100 + i} for i in range(80)]}
+            return httpx.Response(200, json=response)
+
+        pexels = make_client(handler)
+
+        async def run():
+            return [photo["id"] async for photo in pexels.iter_curated_photos(prefetch=3)]
+
+        ids = asyncio.run(run())
+
+        assert len(ids) == 400
+        assert ids[0] == 100 and ids[-1] == 579
+        assert sorted(int(r.url.params["page"]) for r in seen) == [1, 2, 3, 4, 5]
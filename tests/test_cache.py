@@ -0,0 +1,419 @@
+import os
+import time
+import sqlite3
+import pytest
+import requests
+from unittest.mock import patch, Mock
+
+from pypexel.pypexel import Pexels
+from pypexel.cache import MemoryCache, SQLiteCache, make_cache_key
+from pypexel.exceptions import PexelsAPIError
+
+
+class TestCacheKey:
+    def test_params_are_normalized(self):
+        a = make_cache_key("https://api.pexels.com/v1/search", {"query": "nature", "per_page": 80, "color": None})
+        b = make_cache_key("https://api.pexels.com/v1/search", {"per_page": "80", "query": "nature"})
+
+        assert a == b
+
+    def test_base_url_is_part_of_key(self):
+        photos = make_cache_key("https://api.pexels.com/v1/search", {"query": "ocean"})
+        videos = make_cache_key("https://api.pexels.com/videos/search", {"query": "ocean"})
+
+        assert photos != videos
+
+
+class TestMemoryCache:
+    def test_hit_and_miss_counters(self):
+        cache = MemoryCache()
+
+        assert cache.get("a") is None
+        cache.set("a", {"x": 1})
+        assert cache.get("a") == {"x": 1}
+
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_ttl_expiry(self):
+        cache = MemoryCache(ttl=10)
+
+        with patch("pypexel.cache.time.monotonic", return_value=100.0):
+            cache.set("a", {"x": 1})
+        with patch("pypexel.cache.time.monotonic", return_value=109.0):
+            assert cache.get("a") == {"x": 1}
+        with patch("pypexel.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+
+    def test_endpoint_ttls_longest_prefix(self):
+        cache = MemoryCache(ttl=60, endpoint_ttls={"photos/": 3600, "collections": 120, "collections/featured": 0})
+
+        assert cache.ttl_for("photos/123") == 3600
+        assert cache.ttl_for("collections/abc") == 120
+        assert cache.ttl_for("collections/featured") == 0
+        assert cache.ttl_for("search") == 60
+
+    def test_zero_ttl_is_not_stored(self):
+        cache = MemoryCache()
+        cache.set("a", {"x": 1}, ttl=0)
+
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entries(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_lru_eviction_by_bytes(self):
+        cache = MemoryCache(max_entries=None, max_bytes=20)
+        cache.set("a", "x" * 10)
+        cache.set("b", "y" * 10)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == "y" * 10
+        assert cache.current_bytes == 12
+
+    def test_values_are_not_sized_without_max_bytes(self, monkeypatch):
+        cache = MemoryCache()
+        monkeypatch.setattr("pypexel.cache.json.dumps", lambda *args, **kwargs: pytest.fail("value was re-encoded"))
+        cache.set("a", {"x": 1})
+
+        assert cache.get("a") == {"x": 1}
+        assert cache.current_bytes == 0
+
+    def test_oversized_value_is_skipped(self):
+        cache = MemoryCache(max_bytes=5)
+        cache.set("a", "x" * 10)
+
+        assert len(cache) == 0
+        assert cache.stats.evictions == 0
+
+
+class TestClientCaching:
+    @pytest.fixture
+    def mock_response(self):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"photos": [{"id": 1}], "total_results": 1}
+        return response
+
+    @patch('requests.Session.get')
+    def test_repeated_calls_hit_cache(self, mock_get, mock_response):
+        mock_get.return_value = mock_response
+        cache = MemoryCache()
+        pexels = Pexels(api_key="test-key", cache=cache)
+
+        first = pexels.search_photos("nature", per_page=80)
+        second = pexels.search_photos("nature", per_page=80)
+
+        assert first == second
+        mock_get.assert_called_once()
+        assert cache.stats.hits == 1
+
+    @patch('requests.Session.get')
+    def test_different_params_miss(self, mock_get, mock_response):
+        mock_get.return_value = mock_response
+        pexels = Pexels(api_key="test-key", cache=MemoryCache())
+
+        pexels.search_photos("nature")
+        pexels.search_photos("ocean")
+
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_disabled_endpoint_is_not_cached(self, mock_get, mock_response):
+        mock_get.return_value = mock_response
+        pexels = Pexels(api_key="test-key", cache=MemoryCache(endpoint_ttls={"curated": 0}))
+
+        pexels.get_curated_photos()
+        pexels.get_curated_photos()
+
+        assert mock_get.call_count == 2
+
+
+class TestSQLiteCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), ttl=60)
+        yield cache
+        cache.close()
+
+    def test_roundtrip(self, cache):
+        cache.set("a", {"photos": [{"id": 1}]})
+
+        assert cache.get("a") == {"photos": [{"id": 1}]}
+        assert cache.stats.hits == 1
+
+    def test_wal_mode(self, cache):
+        mode = cache._connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        first = SQLiteCache(path)
+        first.set("a", {"x": 1})
+        first.close()
+
+        second = SQLiteCache(path)
+        assert second.get("a") == {"x": 1}
+        second.close()
+
+    def test_expired_entries_miss_and_prune(self, cache):
+        with patch("pypexel.cache.time.time", return_value=1000.0):
+            cache.set("a", {"x": 1}, ttl=10)
+            cache.set("b", {"x": 2}, ttl=100)
+
+        with patch("pypexel.cache.time.time", return_value=1050.0):
+            assert cache.get("a") is None
+            assert cache.prune() == 1
+
+        assert len(cache) == 1
+
+    def test_size_bounded_lru_eviction(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=2)
+
+        now = time.time()
+        with patch("pypexel.cache.time.time", side_effect=[now + i for i in range(6)]):
+            cache.set("a", {"x": 1})
+            cache.set("b", {"x": 2})
+            cache.get("a")
+            cache.set("c", {"x": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"x": 1}
+        assert cache.stats.evictions == 1
+        cache.close()
+
+    def test_expired_entries_are_evicted_first(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=2)
+
+        with patch("pypexel.cache.time.time", return_value=1000.0):
+            cache.set("a", {"x": 1}, ttl=100)
+            cache.set("b", {"x": 2}, ttl=10)
+        with patch("pypexel.cache.time.time", return_value=1020.0):
+            cache.set("c", {"x": 3}, ttl=100)
+
+        assert sorted(row[0] for row in cache._connection().execute("SELECT key FROM responses")) == ["a", "c"]
+        cache.close()
+
+    def test_totals_follow_existing_rows_and_replacements(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        # a cache created before the totals table existed
+        old = SQLiteCache(path)
+        old.set("a", {"x": 1})
+        old._connection().execute("DROP TABLE totals")
+        old.close()
+
+        cache = SQLiteCache(path)
+        cache.set("b", {"x": 2})
+        cache.set("b", {"x": "much longer than before"})
+
+        actual = cache._connection().execute("SELECT COUNT(*), SUM(size) FROM responses").fetchone()
+        assert (len(cache), cache.current_bytes) == actual
+        assert len(cache) == 2
+        cache.close()
+
+    def test_max_bytes(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), max_bytes=10_000)
+        for i in range(50):
+            cache.set(str(i), {"payload": os.urandom(200).hex()})
+
+        assert cache.current_bytes <= 10_000
+        assert cache.stats.evictions > 0
+        cache.close()
+
+    def test_vacuum(self, cache):
+        cache.set("a", {"x": 1}, ttl=60)
+        cache.vacuum()
+
+        assert cache.get("a") == {"x": 1}
+
+    @patch('requests.Session.get')
+    def test_client_uses_disk_cache(self, mock_get, cache):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"media": [], "id": "abc"}
+        mock_get.return_value = response
+
+        pexels = Pexels(api_key="test-key", cache=cache)
+        pexels.get_collection_media("abc")
+        pexels.get_collection_media("abc")
+
+        mock_get.assert_called_once()
+
+
+class TestRevalidation:
+    def test_memory_cache_keeps_expired_entries_with_validators(self):
+        cache = MemoryCache(ttl=10, stale_ttl=100)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            cache.set("tagged", {"x": 1}, etag='"v1"')
+            cache.set("plain", {"x": 2})
+        with patch("pypexel.cache.time.monotonic", return_value=50.0):
+            entry = cache.get_entry("tagged")
+            assert cache.get("tagged") is None
+            assert cache.get_entry("plain") is None
+        with patch("pypexel.cache.time.monotonic", return_value=200.0):
+            assert cache.get_entry("tagged") is None
+
+        assert not entry.fresh
+        assert entry.value == {"x": 1}
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+
+    def test_memory_cache_refresh(self):
+        cache = MemoryCache(ttl=10)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            cache.set("a", {"x": 1}, last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+        with patch("pypexel.cache.time.monotonic", return_value=20.0):
+            cache.refresh("a")
+            assert cache.get("a") == {"x": 1}
+
+        assert cache.stats.revalidations == 1
+
+    def test_sqlite_cache_validators(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), ttl=10)
+
+        with patch("pypexel.cache.time.time", return_value=1000.0):
+            cache.set("a", {"x": 1}, etag='"v1"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+            cache.set("b", {"x": 2})
+        with patch("pypexel.cache.time.time", return_value=1050.0):
+            entry = cache.get_entry("a")
+            assert cache.get_entry("b") is None
+            assert cache.prune() == 1
+            cache.refresh("a")
+            assert cache.get("a") == {"x": 1}
+
+        assert entry.etag == '"v1"' and not entry.fresh
+        assert cache.stats.revalidations == 1
+
+    def test_sqlite_cache_migrates_old_schema(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE responses (key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.close()
+
+        cache = SQLiteCache(path)
+        cache.set("a", {"x": 1}, etag='"v1"')
+
+        assert cache.get_entry("a").etag == '"v1"'
+
+    @patch('requests.Session.get')
+    def test_client_revalidates_with_conditional_get(self, mock_get):
+        fresh = Mock(status_code=200, headers={"ETag": '"v1"'})
+        fresh.json.return_value = {"photos": [{"id": 1}]}
+        not_modified = Mock(status_code=304, headers={"ETag": '"v1"'})
+        mock_get.side_effect = [fresh, not_modified]
+        cache = MemoryCache(ttl=10)
+        pexels = Pexels(api_key="test-key", cache=cache)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            first = pexels.get_curated_photos()
+        with patch("pypexel.cache.time.monotonic", return_value=20.0):
+            second = pexels.get_curated_photos()
+            third = pexels.get_curated_photos()
+
+        assert first == second == third == {"photos": [{"id": 1}]}
+        assert mock_get.call_count == 2
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert cache.stats.revalidations == 1
+
+    @patch('requests.Session.get')
+    def test_changed_response_replaces_entry(self, mock_get):
+        old = Mock(status_code=200, headers={"ETag": '"v1"'})
+        old.json.return_value = {"page": 1}
+        new = Mock(status_code=200, headers={"ETag": '"v2"'})
+        new.json.return_value = {"page": 2}
+        mock_get.side_effect = [old, new]
+        cache = MemoryCache(ttl=10)
+        pexels = Pexels(api_key="test-key", cache=cache)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            pexels.get_curated_photos()
+        with patch("pypexel.cache.time.monotonic", return_value=20.0):
+            assert pexels.get_curated_photos() == {"page": 2}
+            assert cache.get_entry(make_cache_key(Pexels.BASE_URL + "curated", {"page": 1, "per_page": 15})).etag == '"v2"'
+
+
+def error_response(status_code):
+    response = Mock(status_code=status_code, headers={}, text="error")
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+    return response
+
+
+class TestStaleServing:
+    def test_retention_covers_stale_windows(self):
+        cache = MemoryCache(ttl=10, stale_while_revalidate=30)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            cache.set("a", {"x": 1})
+        with patch("pypexel.cache.time.monotonic", return_value=35.0):
+            entry = cache.get_entry("a")
+            assert not entry.fresh
+            assert cache.can_serve_stale(entry)
+        with patch("pypexel.cache.time.monotonic", return_value=45.0):
+            assert cache.get_entry("a") is None
+
+    @patch('requests.Session.get')
+    def test_stale_while_revalidate(self, mock_get):
+        old = Mock(status_code=200, headers={})
+        old.json.return_value = {"page": 1}
+        new = Mock(status_code=200, headers={})
+        new.json.return_value = {"page": 2}
+        mock_get.side_effect = [old, new]
+        cache = MemoryCache(ttl=10, stale_while_revalidate=60)
+        pexels = Pexels(api_key="test-key", cache=cache)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            pexels.get_curated_photos()
+        with patch("pypexel.cache.time.monotonic", return_value=20.0):
+            assert pexels.get_curated_photos() == {"page": 1}
+            pexels._refresher.shutdown(wait=True)
+            assert pexels.get_curated_photos() == {"page": 2}
+
+        assert mock_get.call_count == 2
+        assert cache.stats.stale_hits == 1
+        pexels.close()
+
+    @patch('requests.Session.get')
+    def test_stale_if_error(self, mock_get):
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"page": 1}
+        mock_get.side_effect = [ok, error_response(503), error_response(429)]
+        cache = MemoryCache(ttl=10, stale_if_error=60)
+        pexels = Pexels(api_key="test-key", cache=cache)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            pexels.get_curated_photos()
+        with patch("pypexel.cache.time.monotonic", return_value=20.0):
+            assert pexels.get_curated_photos() == {"page": 1}
+            assert pexels.get_curated_photos() == {"page": 1}
+
+        assert cache.stats.stale_hits == 2
+
+    @patch('requests.Session.get')
+    def test_error_propagates_beyond_max_staleness(self, mock_get):
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"page": 1}
+        mock_get.side_effect = [ok, error_response(503)]
+        cache = MemoryCache(ttl=10, stale_if_error=60)
+        pexels = Pexels(api_key="test-key", cache=cache)
+
+        with patch("pypexel.cache.time.monotonic", return_value=0.0):
+            pexels.get_curated_photos()
+        with patch("pypexel.cache.time.monotonic", return_value=75.0):
+            with pytest.raises(PexelsAPIError):
+                pexels.get_curated_photos()
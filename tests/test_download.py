@@ -0,0 +1,406 @@
+import io
+import os
+import pytest
+
+from pypexel.pypexel import Pexels
+from pypexel.models import Video, VideoFile, User
+from pypexel.exceptions import PexelsAPIError
+from pypexel.retry import RetryPolicy
+from pypexel.download import download_file, download_into, split_ranges, Checkpoint
+
+from tests.helpers import FakeResponse, FakeSession, make_photo
+
+
+@pytest.fixture
+def content():
+    return os.urandom(1000)
+
+
+class TestSplitRanges:
+    def test_covers_file(self):
+        ranges = split_ranges(1000, 4, min_part_size=100)
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == 999
+        assert sum(end - start + 1 for start, end in ranges) == 1000
+        assert len(ranges) == 4
+
+    def test_min_part_size_limits_parts(self):
+        assert len(split_ranges(1000, 8, min_part_size=400)) == 2
+        assert split_ranges(100, 8, min_part_size=400) == [(0, 99)]
+
+
+class TestDownloadFile:
+    def test_ranged_download(self, tmp_path, content):
+        session = FakeSession(content)
+        path = str(tmp_path / "file.mp4")
+
+        written = download_file(session, "https://cdn/file.mp4", path, 30, connections=4, chunk_size=64, min_part_size=100)
+
+        assert written == 1000
+        with open(path, 'rb') as f:
+            assert f.read() == content
+        assert len(session.requests) == 4
+        assert all("Range" in headers for headers in session.requests)
+
+    def test_falls_back_without_accept_ranges(self, tmp_path, content):
+        session = FakeSession(content, ranges=False)
+        path = str(tmp_path / "file.mp4")
+
+        download_file(session, "https://cdn/file.mp4", path, 30, connections=4, min_part_size=100)
+
+        with open(path, 'rb') as f:
+            assert f.read() == content
+        assert session.requests == [{}]
+
+    def test_falls_back_when_range_ignored(self, tmp_path, content):
+        session = FakeSession(content, ranges=False, head_ranges=True)
+        path = str(tmp_path / "file.mp4")
+
+        download_file(session, "https://cdn/file.mp4", path, 30, connections=4, min_part_size=100)
+
+        with open(path, 'rb') as f:
+            assert f.read() == content
+
+    def test_http_error(self, tmp_path):
+        class MissingSession(FakeSession):
+            def get(self, url, **kwargs):
+                return FakeResponse(404)
+
+        with pytest.raises(PexelsAPIError, match="HTTP error 404"):
+            download_file(MissingSession(b""), "https://cdn/file.mp4", str(tmp_path / "f"), 30, connections=1)
+
+
+class TestResumableDownload:
+    def test_no_part_files_left_after_success(self, tmp_path, content):
+        path = str(tmp_path / "file.mp4")
+
+        download_file(FakeSession(content), "https://cdn/file.mp4", path, 30, connections=1)
+
+        assert sorted(os.listdir(tmp_path)) == ["file.mp4"]
+
+    def test_interrupted_download_keeps_part_file(self, tmp_path, content):
+        path = str(tmp_path / "file.mp4")
+
+        with pytest.raises(PexelsAPIError, match="Download failed"):
+            download_file(FakeSession(content, fail_after=600), "https://cdn/file.mp4", path, 30, connections=1, chunk_size=100)
+
+        assert not os.path.exists(path)
+        assert os.path.getsize(path + ".part") == 600
+        checkpoint = Checkpoint.load(path + ".part.json", "https://cdn/file.mp4")
+        assert checkpoint.prefix() == 600
+        assert checkpoint.etag == '"v1"'
+
+    def test_resume_single_stream(self, tmp_path, content):
+        path = str(tmp_path / "file.mp4")
+
+        with pytest.raises(PexelsAPIError):
+            download_file(FakeSession(content, fail_after=600), "https://cdn/file.mp4", path, 30, connections=1, chunk_size=100)
+
+        session = FakeSession(content)
+        written = download_file(session, "https://cdn/file.mp4", path, 30, connections=1, chunk_size=100)
+
+        assert written == 1000
+        assert session.requests == [{"Range": "bytes=600-", "If-Range": '"v1"'}]
+        with open(path, 'rb') as f:
+            assert f.read() == content
+        assert sorted(os.listdir(tmp_path)) == ["file.mp4"]
+
+    def test_checkpoint_records_only_synced_bytes(self, tmp_path, monkeypatch, content):
+        path = str(tmp_path / "file.mp4")
+        synced = []
+        fsync, advance = os.fsync, Checkpoint.advance
+
+        def record_fsync(fd):
+            fsync(fd)
+            synced.append(os.fstat(fd).st_size)
+
+        def check_advance(self, start, n):
+            assert self.prefix() + n <= synced[-1]
+            advance(self, start, n)
+
+        monkeypatch.setattr(os, "fsync", record_fsync)
+        monkeypatch.setattr(Checkpoint, "advance", check_advance)
+
+        download_file(FakeSession(content), "https://cdn/file.mp4", path, 30, connections=1, chunk_size=100)
+
+        assert synced == list(range(100, 1001, 100))
+
+    def test_changed_file_restarts(self, tmp_path, content):
+        path = str(tmp_path / "file.mp4")
+
+        with pytest.raises(PexelsAPIError):
+            download_file(FakeSession(b"x" * 1000, fail_after=600), "https://cdn/file.mp4", path, 30, connections=1, chunk_size=100)
+
+        download_file(FakeSession(content, etag='"v2"'), "https://cdn/file.mp4", path, 30, connections=1, chunk_size=100)
+
+        with open(path, 'rb') as f:
+            assert f.read() == content
+
+    def test_resume_ranged(self, tmp_path, content):
+        path = str(tmp_path / "file.mp4")
+
+        with pytest.raises(PexelsAPIError):
+            download_file(FakeSession(content, fail_after=150), "https://cdn/file.mp4", path, 30, connections=4, chunk_size=50, min_part_size=100)
+
+        checkpoint = Checkpoint.load(path + ".part.json", "https://cdn/file.mp4")
+        assert [done for _, _, done in checkpoint.ranges] == [150, 150, 150, 150]
+
+        session = FakeSession(content)
+        download_file(session, "https://cdn/file.mp4", path, 30, connections=4, chunk_size=50, min_part_size=100)
+
+        with open(path, 'rb') as f:
+            assert f.read() == content
+        assert sorted(r["Range"] for r in session.requests) == ["bytes=150-249", "bytes=400-499", "bytes=650-749", "bytes=900-999"]
+
+    def test_resume_disabled(self, tmp_path, content):
+        path = str(tmp_path / "file.mp4")
+
+        with pytest.raises(PexelsAPIError):
+            download_file(FakeSession(content, fail_after=600), "https://cdn/file.mp4", path, 30, connections=1, chunk_size=100, resume=False)
+
+        assert not os.path.exists(path + ".part.json")
+
+
+class TestDownloadVideo:
+    def test_download_video_small_file_uses_single_stream(self, tmp_path, monkeypatch, content):
+        monkeypatch.chdir(tmp_path)
+        session = FakeSession(content)
+        pexels = Pexels(api_key="test-key", session=session)
+        video = Video(
+            id=7, width=3840, height=2160, url="", image="", duration=1,
+            user=User(id=1, name="", url=""),
+            video_files=[VideoFile(id=1, quality="uhd", file_type="video/mp4", width=3840, height=2160, fps=30.0, link="https://cdn/7.mp4")],
+            video_pictures=[]
+        )
+
+        filename = pexels.download_video(video, "uhd", connections=4)
+
+        assert filename == "7_uhd.mp4"
+        assert (tmp_path / filename).read_bytes() == content
+        assert session.requests == [{}]
+
+    def test_download_video_by_target_resolution(self, tmp_path, monkeypatch, content):
+        monkeypatch.chdir(tmp_path)
+        session = UrlSession(content)
+        pexels = Pexels(api_key="test-key", session=session)
+        video = Video(
+            id=7, width=3840, height=2160, url="", image="", duration=1,
+            user=User(id=1, name="", url=""),
+            video_files=[
+                VideoFile(id=1, quality="uhd", file_type="video/mp4", width=3840, height=2160, fps=30.0, link="https://cdn/7-uhd.mp4"),
+                VideoFile(id=2, quality="hd", file_type="video/mp4", width=1280, height=720, fps=30.0, link="https://cdn/7-720.mp4"),
+                VideoFile(id=3, quality="sd", file_type="video/mp4", width=640, height=360, fps=30.0, link="https://cdn/7-360.mp4")
+            ],
+            video_pictures=[]
+        )
+
+        filename = pexels.download_video(video, height=720)
+
+        assert filename == "7_1280x720.mp4"
+        assert session.urls == ["https://cdn/7-720.mp4"]
+
+    def test_download_video_without_matching_file_raises(self, tmp_path, monkeypatch, content):
+        monkeypatch.chdir(tmp_path)
+        session = UrlSession(content)
+        pexels = Pexels(api_key="test-key", session=session)
+        video = Video(
+            id=7, width=1280, height=720, url="", image="", duration=1,
+            user=User(id=1, name="", url=""),
+            video_files=[VideoFile(id=1, quality="hd", file_type="video/mp4", width=1280, height=720, fps=60.0, link="https://cdn/7-720.mp4")],
+            video_pictures=[]
+        )
+
+        with pytest.raises(ValueError, match="no file matching max_fps=30"):
+            pexels.download_video(video, height=720, max_fps=30)
+
+        with pytest.raises(ValueError, match="not an available quality"):
+            pexels.download_video(video, "uhd")
+
+        assert session.urls == []
+
+
+class UrlSession(FakeSession):
+    """Records the URL of every GET"""
+
+    def __init__(self, content, **kwargs):
+        super().__init__(content, **kwargs)
+        self.urls = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.urls.append(url)
+        return super().get(url, headers=headers, **kwargs)
+
+
+class TestDownloadPhoto:
+    def test_named_size_to_disk(self, tmp_path, monkeypatch, content):
+        monkeypatch.chdir(tmp_path)
+        session = UrlSession(content)
+        pexels = Pexels(api_key="test-key", session=session)
+
+        filename = pexels.download_photo(make_photo(), "medium")
+
+        assert filename == "3_medium.jpeg"
+        assert (tmp_path / filename).read_bytes() == content
+        assert session.urls == [make_photo().src.medium]
+
+    def test_target_width_picks_smallest_sufficient(self, tmp_path, content):
+        session = UrlSession(content)
+        pexels = Pexels(api_key="test-key", session=session)
+        path = str(tmp_path / "photo.jpeg")
+
+        assert pexels.download_photo(make_photo(), width=800, path=path) == path
+        assert session.urls == [make_photo().src.large]
+
+    def test_into_buffer(self, content):
+        pexels = Pexels(api_key="test-key", session=FakeSession(content))
+        buffer = io.BytesIO(b"header")
+        buffer.seek(0, io.SEEK_END)
+
+        written = pexels.download_photo(make_photo(), "small", file=buffer, chunk_size=64)
+
+        assert written == len(content)
+        assert buffer.getvalue() == b"header" + content
+
+    def test_retry_rewinds_buffer(self, content):
+        session = FakeSession(content, fail_after=500)
+        pexels = Pexels(api_key="test-key", session=session, retry=RetryPolicy(max_attempts=2, backoff_base=0))
+        buffer = io.BytesIO()
+
+        with pytest.raises(PexelsAPIError):
+            pexels.download_photo(make_photo(), file=buffer, chunk_size=100)
+
+        assert len(session.requests) == 2
+        assert len(buffer.getvalue()) == 500
+
+    def test_unknown_size(self, content):
+        pexels = Pexels(api_key="test-key", session=FakeSession(content))
+
+        with pytest.raises(ValueError):
+            pexels.download_photo(make_photo(), "huge")
+
+
+class NoLengthSession(FakeSession):
+    """Omits Content-Length, as with chunked transfer encoding"""
+
+    def get(self, url, headers=None, **kwargs):
+        response = super().get(url, headers=headers, **kwargs)
+        del response.headers["Content-Length"]
+        return response
+
+
+class Unseekable(io.RawIOBase):
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+class TestDownloadInto:
+    def test_bytearray_is_filled_in_place(self, content):
+        target = bytearray(b"prefix")
+
+        written = download_into(FakeSession(content), "https://cdn/file", target, 30, chunk_size=64)
+
+        assert written == len(content)
+        assert target == b"prefix" + content
+
+    def test_bytearray_without_length(self, content):
+        target = bytearray()
+
+        download_into(NoLengthSession(content), "https://cdn/file", target, 30, chunk_size=64)
+
+        assert target == content
+
+    def test_bytearray_body_longer_than_length(self, content):
+        class ShortLengthSession(FakeSession):
+            # as with a gzip body decoded past its Content-Length
+            def get(self, url, headers=None, **kwargs):
+                response = super().get(url, headers=headers, **kwargs)
+                response.headers["Content-Length"] = "600"
+                return response
+
+        target = bytearray(b"prefix")
+        chunks = []
+
+        written = download_into(ShortLengthSession(content), "https://cdn/file", target, 30, chunk_size=256, on_chunk=chunks.append)
+
+        assert written == len(content) == sum(chunks)
+        assert target == b"prefix" + content
+
+    def test_memoryview(self, content):
+        backing = bytearray(2000)
+
+        written = download_into(FakeSession(content), "https://cdn/file", memoryview(backing), 30, chunk_size=64)
+
+        assert written == 1000
+        assert backing[:1000] == content
+
+    def test_memoryview_too_small(self, content):
+        with pytest.raises(ValueError):
+            download_into(FakeSession(content), "https://cdn/file", memoryview(bytearray(10)), 30)
+        with pytest.raises(ValueError):
+            download_into(NoLengthSession(content), "https://cdn/file", memoryview(bytearray(10)), 30)
+
+    def test_file_object(self, content):
+        target = io.BytesIO()
+        chunks = []
+
+        download_into(FakeSession(content), "https://cdn/file", target, 30, chunk_size=300, on_chunk=chunks.append)
+
+        assert target.getvalue() == content
+        assert chunks == [300, 300, 300, 100]
+
+    def test_broken_connection(self, content):
+        with pytest.raises(PexelsAPIError):
+            download_into(FakeSession(content, fail_after=500), "https://cdn/file", bytearray(), 30)
+
+
+class TestClientDownloadTargets:
+    def test_retry_rewinds_bytearray(self, content):
+        session = FakeSession(content, fail_after=500)
+        pexels = Pexels(api_key="test-key", session=session, retry=RetryPolicy(max_attempts=3, backoff_base=0))
+        target = bytearray(b"keep")
+
+        with pytest.raises(PexelsAPIError):
+            pexels.download_photo(make_photo(), file=target)
+
+        assert len(session.requests) == 3
+        assert target == b"keep"
+
+    def test_unseekable_stream_is_not_retried(self, content):
+        session = FakeSession(content, fail_after=500)
+        pexels = Pexels(api_key="test-key", session=session, retry=RetryPolicy(max_attempts=3, backoff_base=0))
+
+        with pytest.raises(PexelsAPIError):
+            pexels.download_photo(make_photo(), file=Unseekable())
+
+        assert len(session.requests) == 1
+
+    def test_download_video_into_memory(self, tmp_path, monkeypatch, content):
+        monkeypatch.chdir(tmp_path)
+        pexels = Pexels(api_key="test-key", session=FakeSession(content))
+        video = Video(
+            id=7, width=1280, height=720, url="", image="", duration=1,
+            user=User(id=1, name="", url=""),
+            video_files=[VideoFile(id=1, quality="hd", file_type="video/mp4", width=1280, height=720, fps=30.0, link="https://cdn/7.mp4")],
+            video_pictures=[]
+        )
+        target = bytearray()
+
+        assert pexels.download_video(video, "hd", file=target) == len(content)
+        assert target == content
+        assert list(tmp_path.iterdir()) == []
+
+    def test_iter_download(self, content):
+        pexels = Pexels(api_key="test-key", session=FakeSession(content))
+
+        chunks = list(pexels.iter_download("https://cdn/file", chunk_size=400))
+
+        assert [len(c) for c in chunks] == [400, 400, 200]
+        assert b"".join(chunks) == content
@@ -0,0 +1,165 @@
+import os
+import gzip
+import json
+import pytest
+from unittest.mock import patch
+
+from pypexel.pypexel import Pexels
+from pypexel.export import MetadataExporter, ExportCheckpoint, CHECKPOINT_SUFFIX
+
+
+class Boom(Exception):
+    pass
+
+
+def photo_pages(total, fail_at=None, key="photos", calls=None):
+    def fetch(endpoint, params, *args, **kwargs):
+        page = params["page"]
+        if calls is not None:
+            calls.append(page)
+        if page == fail_at:
+            raise Boom()
+        start = (page - 1) * params["per_page"]
+        ids = range(start, min(start + params["per_page"], total))
+        response = {
+            "page": page,
+            "per_page": params["per_page"],
+            "total_results": total,
+            key: [{"id": i, "avg_color": "#010203", "type": "Video" if i % 2 else "Photo"} for i in ids],
+        }
+        if start + params["per_page"] < total:
+            response["next_page"] = "next"
+        return response
+    return fetch
+
+
+def read_jsonl(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, 'rb') as f:
+        return [json.loads(line) for line in f.read().splitlines()]
+
+
+@pytest.fixture
+def pexels():
+    return Pexels(api_key="test-api-key")
+
+
+class TestJsonlExport:
+    @patch.object(Pexels, '_make_request')
+    def test_export_streams_all_pages(self, mock_request, pexels, tmp_path):
+        mock_request.side_effect = photo_pages(25)
+        path = str(tmp_path / "photos.jsonl")
+
+        result = MetadataExporter(pexels, path).export(pexels.search_photos, "nature", per_page=10)
+
+        assert [row["id"] for row in read_jsonl(path)] == list(range(25))
+        assert (result.rows, result.pages, result.resumed_from) == (25, 3, None)
+        assert not os.path.exists(path + CHECKPOINT_SUFFIX)
+
+    @pytest.mark.parametrize("name", ["photos.jsonl", "photos.jsonl.gz"])
+    @patch.object(Pexels, '_make_request')
+    def test_resume_after_crash(self, mock_request, pexels, tmp_path, name):
+        path = str(tmp_path / name)
+        exporter = MetadataExporter(pexels, path)
+
+        mock_request.side_effect = photo_pages(50, fail_at=3)
+        with pytest.raises(Boom):
+            exporter.export(pexels.search_photos, "nature", per_page=10)
+
+        # simulate a partial write after the last checkpoint
+        with open(path, 'ab') as f:
+            f.write(b"garbage")
+
+        calls = []
+        mock_request.side_effect = photo_pages(50, calls=calls)
+        result = exporter.export(pexels.search_photos, "nature", per_page=10)
+
+        assert calls == [3, 4, 5]
+        assert result.resumed_from == 3
+        assert result.rows == 50
+        assert [row["id"] for row in read_jsonl(path)] == list(range(50))
+
+    @patch.object(Pexels, '_make_request')
+    def test_different_export_starts_over(self, mock_request, pexels, tmp_path):
+        path = str(tmp_path / "photos.jsonl")
+        mock_request.side_effect = photo_pages(50, fail_at=3)
+        with pytest.raises(Boom):
+            MetadataExporter(pexels, path).export(pexels.search_photos, "nature", per_page=10)
+
+        mock_request.side_effect = photo_pages(15)
+        result = MetadataExporter(pexels, path).export(pexels.search_photos, "ocean", per_page=10)
+
+        assert result.resumed_from is None
+        assert len(read_jsonl(path)) == 15
+
+    @patch.object(Pexels, '_make_request')
+    def test_max_items_across_resume(self, mock_request, pexels, tmp_path):
+        path = str(tmp_path / "photos.jsonl")
+        exporter = MetadataExporter(pexels, path)
+
+        mock_request.side_effect = photo_pages(100, fail_at=2)
+        with pytest.raises(Boom):
+            exporter.export(pexels.search_photos, "nature", per_page=10, max_items=25)
+
+        mock_request.side_effect = photo_pages(100)
+        result = exporter.export(pexels.search_photos, "nature", per_page=10, max_items=25)
+
+        assert result.rows == 25
+        assert len(read_jsonl(path)) == 25
+
+    def test_checkpoint_roundtrip(self, tmp_path):
+        path = str(tmp_path / "x.checkpoint.json")
+        ExportCheckpoint(path, "source", 4, rows=30, offset=120).save()
+
+        assert ExportCheckpoint.load(path, "source").offset == 120
+        assert ExportCheckpoint.load(path, "other") is None
+
+    def test_invalid_options(self, pexels, tmp_path):
+        with pytest.raises(ValueError, match="format"):
+            MetadataExporter(pexels, str(tmp_path / "x"), format="csv")
+        with pytest.raises(ValueError, match="compression"):
+            MetadataExporter(pexels, str(tmp_path / "x.jsonl"), compression="lz4")
+
+
+class TestParquetExport:
+    @pytest.fixture(autouse=True)
+    def parquet(self):
+        return pytest.importorskip("pyarrow.parquet")
+
+    @patch.object(Pexels, '_make_request')
+    def test_row_groups_and_resume(self, mock_request, pexels, tmp_path, parquet):
+        path = str(tmp_path / "photos.parquet")
+        exporter = MetadataExporter(pexels, path, row_group_size=20)
+
+        mock_request.side_effect = photo_pages(50, fail_at=4)
+        with pytest.raises(Boom):
+            exporter.export(pexels.search_photos, "nature", per_page=10)
+
+        calls = []
+        mock_request.side_effect = photo_pages(50, calls=calls)
+        result = exporter.export(pexels.search_photos, "nature", per_page=10)
+
+        # page 3 was buffered but not written before the crash
+        assert calls == [3, 4, 5]
+        assert result.rows == 50
+        table = parquet.read_table(os.path.join(path, "photos"))
+        assert table.column("id").to_pylist() == list(range(50))
+        assert table.column("avg_color").to_pylist()[0] == 0x010203
+        assert sorted(os.listdir(os.path.join(path, "photos"))) == ["part-00000.parquet", "part-00001.parquet", "part-00002.parquet"]
+
+    @patch.object(Pexels, '_make_request')
+    def test_collection_media_split_by_type(self, mock_request, pexels, tmp_path, parquet):
+        mock_request.side_effect = photo_pages(10, key="media")
+        path = str(tmp_path / "media.parquet")
+
+        MetadataExporter(pexels, path).export(pexels.get_collection_media, "abc", per_page=10)
+
+        assert parquet.read_table(os.path.join(path, "photos")).column("id").to_pylist() == [0, 2, 4, 6, 8]
+        assert parquet.read_table(os.path.join(path, "videos")).column("id").to_pylist() == [1, 3, 5, 7, 9]
+
+    @patch.object(Pexels, '_make_request')
+    def test_collections_are_not_supported(self, mock_request, pexels, tmp_path):
+        mock_request.side_effect = photo_pages(5, key="collections")
+
+        with pytest.raises(ValueError, match="Parquet export"):
+            MetadataExporter(pexels, str(tmp_path / "c.parquet")).export(pexels.get_featured_collections)
@@ -0,0 +1,63 @@
+import json
+import pytest
+from unittest.mock import patch, Mock
+
+from pypexel.pypexel import Pexels, PexelsAPIError
+from pypexel.jsonlib import JSON_BACKENDS, json_decoder, decode_response
+
+
+def installed(name):
+    try:
+        json_decoder(name)
+    except ImportError:
+        return False
+    return True
+
+
+class TestJsonDecoder:
+    @pytest.mark.parametrize("name", [b for b in JSON_BACKENDS if installed(b)])
+    def test_backends_decode_bytes(self, name):
+        backend, loads = json_decoder(name)
+
+        assert backend == name
+        assert loads('{"photos": [{"id": 1, "alt": "caf\\u00e9"}]}'.encode()) == {"photos": [{"id": 1, "alt": "café"}]}
+        with pytest.raises(ValueError):
+            loads(b"{not json")
+
+    def test_default_prefers_installed_fast_backend(self):
+        backend, _ = json_decoder()
+
+        assert backend == next(b for b in JSON_BACKENDS if installed(b))
+
+    def test_stdlib_fallback(self):
+        with patch("pypexel.jsonlib.importlib.import_module", side_effect=ImportError):
+            assert json_decoder()[0] == "json"
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            json_decoder("simplejson")
+
+    def test_response_without_bytes_uses_json(self):
+        response = Mock()
+        response.json.return_value = {"a": 1}
+
+        assert decode_response(response, json.loads) == {"a": 1}
+
+
+class TestClientDecoding:
+    @patch('requests.Session.get')
+    def test_client_decodes_content(self, mock_get):
+        response = Mock(status_code=200, headers={}, content=b'{"photos": [{"id": 7}]}')
+        mock_get.return_value = response
+        pexels = Pexels(api_key="test-key", json_backend="json")
+
+        assert pexels.get_curated_photos() == {"photos": [{"id": 7}]}
+        response.json.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_invalid_json(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"<html>")
+        pexels = Pexels(api_key="test-key")
+
+        with pytest.raises(PexelsAPIError, match="Invalid JSON response"):
+            pexels.get_curated_photos()
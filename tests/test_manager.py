@@ -0,0 +1,144 @@
+import os
+import pytest
+
+from pypexel.pypexel import Pexels
+from pypexel.models import Video, VideoFile, User
+from pypexel.retry import RetryPolicy
+from pypexel.exceptions import PexelsAPIError
+from pypexel.manager import DownloadManager, BandwidthThrottle, media_url
+
+from tests.helpers import FileSession, make_photo
+
+
+def make_video(video_id):
+    files = [
+        VideoFile(1, "sd", "video/mp4", 640, 360, 25.0, f"https://videos.pexels.com/{video_id}/sd.mp4"),
+        VideoFile(2, "hd", "video/mp4", 1920, 1080, 25.0, f"https://videos.pexels.com/{video_id}/hd.mp4"),
+    ]
+    return Video(video_id, 1920, 1080, "", "", 10, User(1, "", ""), files, [])
+
+
+def make_client(session):
+    return Pexels(api_key="test_api_key", session=session)
+
+
+class TestMediaUrl:
+    def test_photo_rendition(self):
+        photo = make_photo(1)
+        url, filename = media_url(photo, "medium")
+
+        assert url == photo.src.medium
+        assert filename == "1_medium.jpeg"
+
+    def test_video_defaults_to_widest_file(self):
+        url, filename = media_url(make_video(7))
+
+        assert url == "https://videos.pexels.com/7/hd.mp4"
+        assert filename == "7_hd.mp4"
+
+    def test_video_files_without_width(self):
+        video = make_video(7)
+        hls = VideoFile(3, "hls", "application/x-mpegURL", None, None, None, "https://videos.pexels.com/7/hls.m3u8")
+        video = Video(7, 1920, 1080, "", "", 10, User(1, "", ""), [hls] + video.video_files, [])
+
+        assert media_url(video)[0] == "https://videos.pexels.com/7/hd.mp4"
+
+    def test_unknown_rendition(self):
+        with pytest.raises(ValueError):
+            media_url(make_photo(1), "huge")
+
+
+class TestDownloadManager:
+    def test_downloads_all_jobs(self, tmp_path):
+        photos = [make_photo(i) for i in range(5)]
+        session = FileSession({p.src.original: os.urandom(100 + p.id) for p in photos})
+        manager = DownloadManager(make_client(session), directory=str(tmp_path), max_workers=3)
+
+        for photo in photos:
+            manager.add(photo)
+        report = manager.run()
+
+        assert len(report.succeeded) == 5
+        assert report.failed == []
+        assert report.total_bytes == sum(100 + p.id for p in photos)
+        for photo in photos:
+            with open(tmp_path / f"{photo.id}_original.jpeg", 'rb') as f:
+                assert f.read() == session.files[photo.src.original]
+
+    def test_priority_order(self, tmp_path):
+        photos = [make_photo(i) for i in range(4)]
+        session = FileSession({p.src.original: b"x" for p in photos})
+        manager = DownloadManager(make_client(session), directory=str(tmp_path), max_workers=1)
+
+        manager.add(photos[0], priority=0)
+        manager.add(photos[1], priority=5)
+        manager.add(photos[2], priority=1)
+        manager.add(photos[3], priority=5)
+        manager.run()
+
+        assert session.urls == [photos[i].src.original for i in (1, 3, 2, 0)]
+
+    def test_per_host_limit(self, tmp_path):
+        photos = [make_photo(i) for i in range(4)] + [make_photo(i, host="other.example") for i in range(4, 8)]
+        session = FileSession({p.src.original: b"x" for p in photos}, delay=0.02)
+        manager = DownloadManager(make_client(session), directory=str(tmp_path), max_workers=6, per_host_limit=2)
+
+        for photo in photos:
+            manager.add(photo)
+        report = manager.run()
+
+        assert len(report.succeeded) == 8
+        assert session.peak == {"images.pexels.com": 2, "other.example": 2}
+
+    def test_failures_are_reported(self, tmp_path):
+        good, bad = make_photo(1), make_photo(2)
+        session = FileSession({good.src.original: b"data"})
+        manager = DownloadManager(make_client(session), directory=str(tmp_path))
+
+        manager.add(good)
+        manager.add(bad)
+        report = manager.run()
+
+        assert [r.job.media for r in report.succeeded] == [good]
+        assert [r.job.media for r in report.failed] == [bad]
+        assert isinstance(report.failed[0].error, PexelsAPIError)
+        assert report.failed[0].error.status_code == 404
+
+    def test_retries_with_client_policy(self, tmp_path):
+        photo = make_photo(1)
+        session = FileSession({}, missing_status=503)
+        client = Pexels(api_key="test_api_key", session=session, retry=RetryPolicy(max_attempts=3, backoff_base=0))
+        manager = DownloadManager(client, directory=str(tmp_path))
+
+        manager.add(photo)
+        report = manager.run()
+
+        assert len(report.failed) == 1
+        assert len(session.urls) == 3
+
+    def test_progress(self, tmp_path):
+        photo = make_photo(1)
+        session = FileSession({photo.src.original: os.urandom(300)})
+        events = []
+        manager = DownloadManager(make_client(session), directory=str(tmp_path), progress=events.append, chunk_size=100)
+
+        manager.add(photo)
+        manager.run()
+
+        assert [e.downloaded for e in events if not e.done] == [100, 200, 300]
+        assert events[-1].done
+        assert events[-1].completed_jobs == events[-1].total_jobs == 1
+        assert events[-1].total_bytes == 300
+
+
+class TestBandwidthThrottle:
+    def test_limits_rate(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("pypexel.manager.time.sleep", sleeps.append)
+        throttle = BandwidthThrottle(rate=1000, burst=1000)
+
+        throttle.consume(1000)
+        throttle.consume(500)
+
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(0.5, abs=0.05)
@@ -0,0 +1,85 @@
+import copy
+import pickle
+import dataclasses
+import pytest
+
+from pypexel.models import VideoFile, Collection
+from pypexel.utils import parse_photo, parse_video, LazyPhoto, LazyVideo
+
+
+@pytest.fixture
+def video():
+    return parse_video({
+        "id": 7,
+        "user": {"id": 3, "name": "Someone"},
+        "video_files": [{"id": 1, "quality": "hd", "width": 1920, "height": 1080, "link": "hd.mp4"}],
+        "video_pictures": [{"id": 2, "picture": "p.jpg", "nr": 0}],
+    })
+
+
+class TestModels:
+    def test_no_instance_dict(self, video):
+        photo = parse_photo({"id": 1})
+
+        for obj in (photo, photo.src, video, video.user, video.video_files[0], video.video_pictures[0]):
+            assert not hasattr(obj, "__dict__")
+
+    def test_frozen(self, video):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            video.id = 8
+
+    def test_hashable_by_id(self, video):
+        photos = {parse_photo({"id": 1}), parse_photo({"id": 1}), parse_photo({"id": 2})}
+
+        assert len(photos) == 2
+        assert hash(video) == hash(7)
+        assert {video: "v"}[video] == "v"
+
+    def test_equality_compares_fields(self):
+        assert parse_photo({"id": 1, "alt": "a"}) != parse_photo({"id": 1, "alt": "b"})
+
+    def test_defaults_and_replace(self):
+        file = VideoFile(id=1, quality="sd", file_type="video/mp4", width=640, height=360, fps=25, link="sd.mp4")
+
+        assert file.size is None
+        assert dataclasses.replace(file, size=10).size == 10
+
+    def test_pickle_and_copy(self, video):
+        assert pickle.loads(pickle.dumps(video)) == video
+        assert copy.deepcopy(video) == video
+        assert dataclasses.asdict(video)["user"]["name"] == "Someone"
+
+    def test_collection(self):
+        collection = Collection(id="abc", title="t", description="", private=False, media_count=1, photos_count=1, videos_count=0)
+
+        assert hash(collection) == hash("abc")
+
+
+class TestLazyModels:
+    def test_lazy_photo_matches_photo(self):
+        data = {"id": 1, "width": 10, "src": {"large": "large.jpg"}}
+        lazy = parse_photo(data, lazy=True)
+
+        assert isinstance(lazy, LazyPhoto)
+        assert lazy.id == 1 and lazy.width == 10 and lazy.alt == ""
+        assert lazy.src.large == "large.jpg"
+        assert lazy.src is lazy.src
+        assert lazy == parse_photo(data)
+        assert lazy.materialize() == parse_photo(data)
+        assert lazy.raw is data
+
+    def test_lazy_video_parses_nested_on_access(self):
+        data = {"id": 7, "video_files": [{"id": 1, "width": 640, "link": "sd.mp4"}]}
+        lazy = parse_video(data, lazy=True)
+
+        assert isinstance(lazy, LazyVideo)
+        assert lazy._video_files is None and lazy._user is None
+        assert lazy.video_files[0].link == "sd.mp4"
+        assert lazy.video_files is lazy.video_files
+        assert lazy.user.id == 0
+        assert lazy.video_pictures == []
+        assert lazy == parse_video(data)
+
+    def test_lazy_hash_by_id(self):
+        assert len({parse_photo({"id": 1}, lazy=True), parse_photo({"id": 1}, lazy=True)}) == 1
+        assert hash(parse_video({"id": 7}, lazy=True)) == hash(parse_video({"id": 7}))
@@ -1,22 +1,25 @@
 import os
+import time
 import pytest
+import threading
 import requests
 from unittest.mock import patch, Mock
 
-from pypexel.pypexel import Pexels, PexelsAPIError
+from pypexel.pypexel import Pexels, PexelsAPIError, select_video_file
+from pypexel.singleflight import _Call
 from pypexel.models import (
     Photo,
     PhotoSRC,
     Video,
     VideoFile,
-    VideoPicture,
     User,
     Collection
 )
 from pypexel.utils import (
     parse_photo,
     parse_video,
-    parse_collection
+    LazyPhoto,
+    LazyVideo
 )
 
 
@@ -38,12 +41,56 @@ class TestPexelsInitialization:
             Pexels()
 
 
+class TestPexelsSession:
+    def test_session_pool_configuration(self):
+        pexels = Pexels(api_key="test-key", pool_connections=4, pool_maxsize=32)
+        adapter = pexels.session.get_adapter("https://api.pexels.com/v1/")
+
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+
+    def test_keep_alive_disabled(self):
+        pexels = Pexels(api_key="test-key", keep_alive=False)
+        assert pexels.session.headers["Connection"] == "close"
+
+    @patch('requests.Session.get')
+    def test_session_reused_across_requests(self, mock_get):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"photos": []}
+        mock_get.return_value = mock_response
+
+        pexels = Pexels(api_key="test-key")
+        session = pexels.session
+        pexels._make_request("curated")
+        pexels._make_request("curated")
+
+        assert pexels.session is session
+        assert mock_get.call_count == 2
+
+    def test_context_manager_closes_owned_session(self):
+        pexels = Pexels(api_key="test-key")
+
+        with patch.object(pexels.session, 'close') as mock_close:
+            with pexels:
+                mock_close.assert_not_called()
+            mock_close.assert_called_once()
+
+    def test_close_leaves_external_session_open(self):
+        session = Mock(spec=requests.Session)
+
+        with Pexels(api_key="test-key", session=session) as pexels:
+            assert pexels.session is session
+
+        session.close.assert_not_called()
+
+
 class TestPexelsAPIRequests:
     @pytest.fixture
     def pexels(self):
         return Pexels(api_key="test-api-key")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_successful_request(self, mock_get, pexels):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -56,7 +103,7 @@ class TestPexelsAPIRequests:
         mock_get.assert_called_once()
 
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_request_with_params(self, mock_get, pexels):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -72,7 +119,7 @@ class TestPexelsAPIRequests:
         assert call_args[1]["params"]["per_page"] == 10
 
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_rate_limit_error(self, mock_get, pexels):
         mock_response = Mock()
         mock_response.status_code = 429
@@ -83,7 +130,7 @@ class TestPexelsAPIRequests:
             pexels._make_request("test-endpoint")
     
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_invalid_api_key_error(self, mock_get, pexels):
         mock_response = Mock()
         mock_response.status_code = 403
@@ -94,7 +141,7 @@ class TestPexelsAPIRequests:
             pexels._make_request("test-endpoint")
     
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_generic_http_error(self, mock_get, pexels):
         mock_response = Mock()
         mock_response.status_code = 500
@@ -106,7 +153,7 @@ class TestPexelsAPIRequests:
             pexels._make_request("test-endpoint")
     
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_connection_error(self, mock_get, pexels):
         mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
         
@@ -219,6 +266,17 @@ class TestVideoParsing:
         assert video.video_files[0].quality == "hd"
 
 
+    def test_select_video_file_without_width(self, sample_video_data):
+        sample_video_data["video_files"] += [
+            {"id": 2, "quality": "hls", "file_type": "application/x-mpegURL", "width": None, "height": None, "fps": None, "link": "https://example.com/a.m3u8"},
+            {"id": 3, "quality": "hls", "file_type": "application/x-mpegURL", "width": 1280, "height": 720, "fps": None, "link": "https://example.com/b.m3u8"}
+        ]
+        video = parse_video(sample_video_data)
+
+        assert select_video_file(video, "hls").id == 3
+        assert select_video_file(video, "hd").id == 1
+
+
 class TestSearchPhotos:
     @pytest.fixture
     def pexels(self):
@@ -284,6 +342,18 @@ class TestSearchPhotos:
         assert result[0].id == 12345
 
 
+    @patch.object(Pexels, '_make_request')
+    def test_search_photos_lazy(self, mock_request, sample_search_response):
+        mock_request.return_value = sample_search_response
+        pexels = Pexels(api_key="test-api-key", lazy=True)
+
+        result = pexels.search_photos("nature", as_objects=True)
+
+        assert isinstance(result[0], LazyPhoto)
+        assert result[0].id == 12345
+        assert result[0].materialize() == parse_photo(sample_search_response["photos"][0])
+
+
 class TestSearchVideos:    
     @pytest.fixture
     def pexels(self):
@@ -326,6 +396,17 @@ class TestSearchVideos:
         assert isinstance(result[0], Video)
 
 
+    @patch.object(Pexels, '_make_request')
+    def test_iter_search_videos_lazy(self, mock_request, sample_video_response):
+        mock_request.return_value = sample_video_response
+        pexels = Pexels(api_key="test-api-key", lazy=True)
+
+        videos = list(pexels.iter_search_videos("ocean", max_items=1, as_objects=True))
+
+        assert isinstance(videos[0], LazyVideo)
+        assert videos[0].user.name == "Jane Smith"
+
+
 class TestGetPhotoVideo:    
     @pytest.fixture
     def pexels(self):
@@ -374,6 +455,55 @@ class TestGetPhotoVideo:
         assert isinstance(result, Video)
 
 
+class TestBatchGet:
+    @pytest.fixture
+    def pexels(self):
+        return Pexels(api_key="test-api-key")
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_get_photos_dedupes_and_keys_by_id(self, mock_request, pexels):
+        mock_request.side_effect = lambda endpoint, *args, **kwargs: {"id": int(endpoint.split("/")[1])}
+
+        batch = pexels.get_photos([1, 2, 2, 3, 1], max_workers=4)
+
+        assert batch.results == {1: {"id": 1}, 2: {"id": 2}, 3: {"id": 3}}
+        assert batch.errors == {}
+        assert mock_request.call_count == 3
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_get_photos_collects_errors(self, mock_request, pexels):
+        def fetch(endpoint, *args, **kwargs):
+            if endpoint == "photos/2":
+                raise PexelsAPIError("HTTP error 404: Not Found", status_code=404)
+            return {"id": int(endpoint.split("/")[1]), "src": {}}
+
+        mock_request.side_effect = fetch
+
+        batch = pexels.get_photos(range(50), as_objects=True)
+
+        assert len(batch.results) == 49
+        assert isinstance(batch.results[0], Photo)
+        assert list(batch.errors) == [2]
+        assert batch.errors[2].status_code == 404
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_get_videos(self, mock_request, pexels):
+        mock_request.return_value = {"id": 5, "user": {"name": "Jane"}}
+
+        batch = pexels.get_videos([5], as_objects=True)
+
+        assert isinstance(batch.results[5], Video)
+        mock_request.assert_called_once_with("videos/5", base_url=pexels.VIDEO_BASE_URL)
+
+
+    def test_get_photos_validation(self, pexels):
+        with pytest.raises(ValueError, match="max_workers must be >= 1"):
+            pexels.get_photos([1], max_workers=0)
+
+
 class TestCollectionMethods:    
     @pytest.fixture
     def pexels(self):
@@ -438,13 +568,160 @@ class TestCollectionMethods:
             pexels.get_collection_media("123", media_type="invalid")
 
 
+class TestPaginationIterators:
+    @pytest.fixture
+    def pexels(self):
+        return Pexels(api_key="test-api-key")
+
+
+    @staticmethod
+    def photo_pages(total, per_page):
+        def fetch(endpoint, params, *args, **kwargs):
+            page = params["page"]
+            start = (page - 1) * per_page
+            ids = list(range(start, min(start + params["per_page"], total)))
+            response = {
+                "page": page,
+                "per_page": params["per_page"],
+                "total_results": total,
+                "photos": [{"id": i} for i in ids]
+            }
+            if start + params["per_page"] < total:
+                response["next_page"] = f"https://api.pexels.com/v1/search?page={page + 1}"
+            return response
+        return fetch
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_iter_search_photos_streams_all_pages(self, mock_request, pexels):
+        mock_request.side_effect = self.photo_pages(total=200, per_page=80)
+
+        ids = [photo["id"] for photo in pexels.iter_search_photos("nature")]
+
+        assert ids == list(range(200))
+        assert mock_request.call_count == 3
+        assert [c[0][1]["page"] for c in mock_request.call_args_list] == [1, 2, 3]
+        assert all(c[0][1]["per_page"] == 80 for c in mock_request.call_args_list)
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_iter_is_lazy(self, mock_request, pexels):
+        mock_request.side_effect = self.photo_pages(total=200, per_page=80)
+
+        iterator = pexels.iter_curated_photos()
+        assert mock_request.call_count == 0
+
+        next(iterator)
+        assert mock_request.call_count == 1
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_iter_max_items(self, mock_request, pexels):
+        mock_request.side_effect = self.photo_pages(total=200, per_page=80)
+
+        photos = list(pexels.iter_search_photos("nature", max_items=100, as_objects=True))
+
+        assert len(photos) == 100
+        assert isinstance(photos[0], Photo)
+        assert mock_request.call_count == 2
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_iter_small_max_items_shrinks_page(self, mock_request, pexels):
+        mock_request.side_effect = self.photo_pages(total=200, per_page=5)
+
+        assert len(list(pexels.iter_curated_photos(max_items=5))) == 5
+        mock_request.assert_called_once_with("curated", {"page": 1, "per_page": 5})
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_iter_max_items_keeps_page_offset(self, mock_request, pexels):
+        mock_request.side_effect = self.photo_pages(total=200, per_page=80)
+
+        ids = [photo["id"] for photo in pexels.iter_curated_photos(page=2, max_items=5)]
+
+        assert ids == list(range(80, 85))
+        mock_request.assert_called_once_with("curated", {"page": 2, "per_page": 80})
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_iter_stops_on_empty_page(self, mock_request, pexels):
+        mock_request.return_value = {"page": 1, "per_page": 80, "collections": []}
+
+        assert list(pexels.iter_featured_collections()) == []
+        mock_request.assert_called_once()
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_iter_collection_media_keeps_order(self, mock_request, pexels):
+        mock_request.return_value = {
+            "page": 1,
+            "per_page": 80,
+            "total_results": 2,
+            "media": [
+                {"type": "Photo", "id": 1},
+                {"type": "Video", "id": 2}
+            ]
+        }
+
+        result = list(pexels.iter_collection_media("abc", as_objects=True))
+
+        assert isinstance(result[0], Photo)
+        assert isinstance(result[1], Video)
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_iter_prefetch_yields_in_order(self, mock_request, pexels):
+        fetch = self.photo_pages(total=1000, per_page=80)
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def slow_fetch(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return fetch(*args, **kwargs)
+
+        mock_request.side_effect = slow_fetch
+
+        ids = [photo["id"] for photo in pexels.iter_search_photos("nature", prefetch=4)]
+
+        assert ids == list(range(1000))
+        assert mock_request.call_count == 13
+        assert 1 < in_flight[1] <= 4
+
+
+    @patch.object(Pexels, '_make_request')
+    def test_iter_prefetch_respects_max_items(self, mock_request, pexels):
+        mock_request.side_effect = self.photo_pages(total=1000, per_page=80)
+
+        photos = list(pexels.iter_curated_photos(max_items=200, prefetch=8))
+
+        assert len(photos) == 200
+        assert sorted(c[0][1]["page"] for c in mock_request.call_args_list) == [1, 2, 3]
+
+
+    def test_iter_validation_is_eager(self, pexels):
+        with pytest.raises(ValueError, match="Query parameter is required"):
+            pexels.iter_search_photos("")
+
+        with pytest.raises(ValueError, match="max_items must be >= 0"):
+            pexels.iter_my_collections(max_items=-1)
+
+        with pytest.raises(ValueError, match="prefetch must be >= 0"):
+            pexels.iter_curated_photos(prefetch=-1)
+
+
 class TestIntegration:
     @pytest.fixture
     def pexels(self):
         return Pexels(api_key="test-api-key")
     
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_full_photo_search_workflow(self, mock_get, pexels):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -506,5 +783,66 @@ def test_pagination_methods(method_name, endpoint):
         assert params['per_page'] == 20
 
 
+class TestRequestCoalescing:
+    def test_concurrent_identical_requests_share_one_call(self):
+        pexels = Pexels(api_key="test-api-key")
+        calls = []
+        waiting = threading.Semaphore(0)
+
+        class WatchedCall(_Call):
+            # counts callers waiting on the in-flight request
+            def __init__(self):
+                super().__init__()
+                wait = self.done.wait
+
+                def counted_wait(timeout=None):
+                    waiting.release()
+                    return wait(timeout)
+
+                self.done.wait = counted_wait
+
+        def get(*args, **kwargs):
+            calls.append(kwargs.get("params"))
+            # hold the request open until every other caller is waiting on it
+            followers = sum(waiting.acquire(timeout=5) for _ in range(7))
+            response = Mock()
+            response.json.return_value = {"photos": [], "followers": followers}
+            return response
+
+        results = []
+        with patch.object(pexels.session, "get", side_effect=get), patch("pypexel.singleflight._Call", WatchedCall):
+            threads = [threading.Thread(target=lambda: results.append(pexels.search_photos("trending"))) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"photos": [], "followers": 7}] * 8
+
+    def test_coalescing_can_be_disabled(self):
+        pexels = Pexels(api_key="test-api-key", coalesce=False)
+        calls = []
+        in_flight = threading.Barrier(4, timeout=5)
+
+        def get(*args, **kwargs):
+            calls.append(1)
+            # only returns once all four requests are in flight together
+            in_flight.wait()
+            response = Mock()
+            response.json.return_value = {"photos": []}
+            return response
+
+        with patch.object(pexels.session, "get", side_effect=get):
+            threads = [threading.Thread(target=pexels.search_photos, args=("trending",)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(calls) == 4
+        assert not in_flight.broken
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,124 @@
+import pytest
+from unittest.mock import patch, Mock
+
+from pypexel.pypexel import Pexels
+from pypexel.exceptions import PexelsAPIError, PexelsRateLimitError
+from pypexel.ratelimit import RateLimiter, RateLimitState, parse_rate_limit_headers
+
+
+NOW = 1_700_000_000.0
+
+
+def headers(limit=200, remaining=100, reset=NOW + 100):
+    return {
+        "X-Ratelimit-Limit": str(limit),
+        "X-Ratelimit-Remaining": str(remaining),
+        "X-Ratelimit-Reset": str(int(reset))
+    }
+
+
+class TestParseHeaders:
+    def test_parse(self):
+        state = parse_rate_limit_headers(headers())
+
+        assert state == RateLimitState(limit=200, remaining=100, reset=NOW + 100)
+
+    def test_missing_headers(self):
+        assert parse_rate_limit_headers({}) is None
+        assert parse_rate_limit_headers({"X-Ratelimit-Limit": "abc"}) is None
+
+
+@patch("pypexel.ratelimit.time.time", return_value=NOW)
+class TestRateLimiter:
+    def test_no_state_does_not_wait(self, mock_time):
+        limiter = RateLimiter()
+
+        assert all(limiter.reserve() == 0 for _ in range(100))
+
+    def test_fixed_rate(self, mock_time):
+        limiter = RateLimiter(rate=10, burst=1)
+
+        waits = [limiter.reserve() for _ in range(3)]
+
+        assert waits == pytest.approx([0.0, 0.1, 0.2])
+
+    def test_monthly_quota_is_not_spread(self, mock_time):
+        limiter = RateLimiter()
+        limiter.update(parse_rate_limit_headers(headers(limit=20000, remaining=19950, reset=NOW + 20 * 86400)))
+
+        assert all(limiter.reserve() == 0 for _ in range(100))
+
+    def test_spread_bursts_then_paces_by_remaining_budget(self, mock_time):
+        limiter = RateLimiter(burst=2, spread=True)
+        limiter.update(RateLimitState(limit=200, remaining=10, reset=NOW + 100))
+
+        waits = [limiter.reserve() for _ in range(4)]
+
+        assert waits[0] == 0
+        assert waits[1] == 0
+        assert waits[2] > 0
+        assert waits[3] > waits[2]
+
+    def test_exhausted_budget_waits_for_reset(self, mock_time):
+        limiter = RateLimiter()
+        limiter.update(RateLimitState(limit=200, remaining=0, reset=NOW + 30))
+
+        assert limiter.reserve() == pytest.approx(30)
+
+    def test_headroom(self, mock_time):
+        limiter = RateLimiter(headroom=5)
+        limiter.update(RateLimitState(limit=200, remaining=5, reset=NOW + 30))
+
+        assert limiter.reserve() == pytest.approx(30)
+
+    def test_non_blocking_raises_early(self, mock_time):
+        limiter = RateLimiter(block=False)
+        limiter.update(RateLimitState(limit=200, remaining=0, reset=NOW + 30))
+
+        with pytest.raises(PexelsRateLimitError, match="budget exhausted"):
+            limiter.reserve()
+
+    def test_max_wait_raises(self, mock_time):
+        limiter = RateLimiter(max_wait=10)
+        limiter.update(RateLimitState(limit=200, remaining=0, reset=NOW + 30))
+
+        with pytest.raises(PexelsRateLimitError):
+            limiter.reserve()
+
+    def test_window_rollover_clears_budget(self, mock_time):
+        limiter = RateLimiter()
+        limiter.update(RateLimitState(limit=200, remaining=0, reset=NOW - 1))
+
+        assert limiter.reserve() == 0
+        assert limiter.state is None
+
+
+class TestClientRateLimit:
+    @patch('requests.Session.get')
+    def test_client_records_rate_limit(self, mock_get):
+        response = Mock()
+        response.status_code = 200
+        response.headers = headers(remaining=42)
+        response.json.return_value = {}
+        mock_get.return_value = response
+
+        limiter = RateLimiter()
+        pexels = Pexels(api_key="test-key", rate_limiter=limiter)
+        pexels.get_photo(1)
+
+        assert pexels.rate_limit.remaining == 42
+        assert limiter.state.remaining == 42
+
+    @patch('requests.Session.get')
+    def test_client_raises_before_request_when_exhausted(self, mock_get):
+        limiter = RateLimiter(block=False)
+        limiter.update(RateLimitState(limit=200, remaining=0, reset=9_999_999_999))
+        pexels = Pexels(api_key="test-key", rate_limiter=limiter)
+
+        with pytest.raises(PexelsRateLimitError):
+            pexels.get_photo(1)
+
+        mock_get.assert_not_called()
+
+    def test_rate_limit_error_is_api_error(self):
+        assert issubclass(PexelsRateLimitError, PexelsAPIError)
@@ -0,0 +1,96 @@
+import pytest
+
+from pypexel.models import Photo, Video, VideoFile, User
+from pypexel.renditions import (
+    photo_rendition_size,
+    select_photo_size,
+    select_video_rendition,
+    photo_url,
+    url_extension
+)
+
+from tests.helpers import make_photo
+
+
+def make_video(sizes=True):
+    files = [
+        VideoFile(1, "uhd", "video/mp4", 3840, 2160, 29.97, "https://cdn/uhd.mp4", 90_000_000 if sizes else None),
+        VideoFile(2, "hd", "video/mp4", 1920, 1080, 59.94, "https://cdn/hd60.mp4", 40_000_000 if sizes else None),
+        VideoFile(3, "hd", "video/mp4", 1920, 1080, 29.97, "https://cdn/hd30.mp4", 20_000_000 if sizes else None),
+        VideoFile(4, "hd", "video/mp4", 1280, 720, 29.97, "https://cdn/hd720.mp4", 10_000_000 if sizes else None),
+        VideoFile(5, "sd", "video/webm", 640, 360, 29.97, "https://cdn/sd.webm", 3_000_000 if sizes else None),
+    ]
+    return Video(9, 3840, 2160, "", "", 10, User(1, "", ""), files, [])
+
+
+class TestPhotoRenditions:
+    def test_rendition_sizes(self):
+        photo = make_photo(width=6000, height=4000)
+
+        assert photo_rendition_size(photo, "small") == (195, 130)
+        assert photo_rendition_size(photo, "medium") == (525, 350)
+        assert photo_rendition_size(photo, "large") == (940, 627)
+        assert photo_rendition_size(photo, "large2x") == (1880, 1253)
+        assert photo_rendition_size(photo, "original") == (6000, 4000)
+
+    def test_does_not_upscale(self):
+        assert photo_rendition_size(make_photo(width=800, height=600), "large2x") == (800, 600)
+
+    def test_select_smallest_sufficient(self):
+        photo = make_photo(width=6000, height=4000)
+
+        assert select_photo_size(photo, width=150) == "small"
+        assert select_photo_size(photo, width=500) == "medium"
+        assert select_photo_size(photo, height=600) == "large"
+        assert select_photo_size(photo, width=1000) == "large2x"
+        assert select_photo_size(photo, width=1920, height=1080) == "original"
+        assert select_photo_size(photo, width=10000) == "original"
+
+    def test_unknown_dimensions(self):
+        with pytest.raises(ValueError, match="unknown dimensions"):
+            photo_rendition_size(Photo(id=1), "medium")
+
+        assert select_photo_size(Photo(id=1), width=100) == "original"
+
+    def test_photo_url(self):
+        photo = make_photo()
+
+        assert photo_url(photo, "medium") == photo.src.medium
+        with pytest.raises(ValueError):
+            photo_url(photo, "huge")
+        with pytest.raises(ValueError):
+            photo_url(photo, "__class__")
+
+    def test_url_extension_ignores_query(self):
+        assert url_extension(make_photo().src.large) == ".jpeg"
+        assert url_extension("https://cdn/file") == ".jpg"
+
+
+class TestVideoRenditions:
+    def test_smallest_sufficient(self):
+        video = make_video()
+
+        assert select_video_rendition(video, width=1280, height=720).id == 4
+        assert select_video_rendition(video, height=1000).id == 3
+        assert select_video_rendition(video, width=2000).id == 1
+        assert select_video_rendition(video).id == 5
+
+    def test_pixel_rate_without_sizes(self):
+        video = make_video(sizes=False)
+
+        assert select_video_rendition(video, height=1080).id == 3
+        assert select_video_rendition(video, width=600).id == 5
+
+    def test_constraints(self):
+        video = make_video()
+
+        assert select_video_rendition(video, file_type="video/mp4").id == 4
+        assert select_video_rendition(video, width=3840, max_bytes=50_000_000).id == 2
+        assert select_video_rendition(video, width=1920, max_fps=30).id == 3
+
+    def test_falls_back_to_largest(self):
+        assert select_video_rendition(make_video(), width=8000).id == 1
+
+    def test_no_candidates(self):
+        with pytest.raises(ValueError):
+            select_video_rendition(make_video(), max_bytes=1000)
@@ -0,0 +1,187 @@
+import time
+import pytest
+import requests
+from unittest.mock import patch, Mock
+
+from pypexel.pypexel import Pexels
+from pypexel.models import Video, VideoFile, User
+from pypexel.exceptions import PexelsAPIError, PexelsRateLimitError, PexelsConnectionError
+from pypexel.retry import RetryPolicy
+
+
+def make_response(status_code, json_data=None, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = "error"
+    response.json.return_value = json_data
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+    return response
+
+
+class TestRetryPolicy:
+    def test_retryable_errors(self):
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(PexelsConnectionError("Request failed"))
+        assert policy.is_retryable(PexelsAPIError("HTTP error 503", status_code=503))
+        assert not policy.is_retryable(PexelsAPIError("Invalid API key", status_code=403))
+        assert not policy.is_retryable(PexelsAPIError("Invalid JSON response"))
+
+    def test_full_jitter_backoff_is_capped(self):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=4)
+
+        with patch("pypexel.retry.random.uniform", side_effect=lambda low, high: high):
+            assert [policy.backoff(n) for n in range(1, 6)] == [1, 2, 4, 4, 4]
+
+    def test_retry_after_header(self):
+        policy = RetryPolicy(backoff_base=0)
+        error = PexelsRateLimitError("rate limited", status_code=429, headers={"Retry-After": "7"})
+
+        with patch("pypexel.retry.time.monotonic", return_value=0):
+            assert policy.next_delay(1, error, started=0) == pytest.approx(7)
+
+    def test_retry_after_http_date(self):
+        policy = RetryPolicy()
+        assert policy.server_delay({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+
+    def test_rate_limit_reset_header(self):
+        policy = RetryPolicy()
+
+        with patch("pypexel.retry.time.time", return_value=1000.0):
+            delay = policy.server_delay({"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": "1012"})
+
+        assert delay == pytest.approx(12)
+
+    def test_monthly_reset_raises_instead_of_sleeping(self):
+        policy = RetryPolicy()
+        error = PexelsRateLimitError("rate limited", status_code=429, headers={
+            "X-Ratelimit-Limit": "20000", "X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": str(1000 + 20 * 86400)
+        })
+
+        with patch("pypexel.retry.time.time", return_value=1000.0), patch("pypexel.retry.time.monotonic", return_value=0):
+            with pytest.raises(PexelsRateLimitError, match="longer than max_retry_after") as excinfo:
+                policy.next_delay(1, error, started=0)
+
+        assert excinfo.value.status_code == 429
+
+    def test_max_retry_after(self):
+        policy = RetryPolicy(max_retry_after=3600)
+        error = PexelsRateLimitError("rate limited", status_code=429, headers={"Retry-After": "120"})
+
+        with patch("pypexel.retry.time.monotonic", return_value=0):
+            assert policy.next_delay(1, error, started=0) == pytest.approx(120)
+
+    def test_stops_after_max_attempts(self):
+        policy = RetryPolicy(max_attempts=2)
+        error = PexelsConnectionError("Request failed")
+
+        with patch("pypexel.retry.time.monotonic", return_value=0):
+            assert policy.next_delay(1, error, started=0) is not None
+            assert policy.next_delay(2, error, started=0) is None
+
+    def test_deadline(self):
+        policy = RetryPolicy(deadline=5, backoff_base=10, backoff_cap=10)
+        error = PexelsConnectionError("Request failed")
+
+        with patch("pypexel.retry.random.uniform", return_value=10), patch("pypexel.retry.time.monotonic", return_value=1):
+            assert policy.next_delay(1, error, started=0) is None
+            assert policy.attempt_timeout(30, started=0) == 4
+
+
+@patch("pypexel.pypexel.time.sleep")
+class TestClientRetries:
+    @patch('requests.Session.get')
+    def test_retries_transient_status(self, mock_get, mock_sleep):
+        mock_get.side_effect = [make_response(503), make_response(502), make_response(200, {"id": 1})]
+        pexels = Pexels(api_key="test-key", retry=RetryPolicy(max_attempts=3))
+
+        assert pexels.get_photo(1) == {"id": 1}
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_retries_connection_errors(self, mock_get, mock_sleep):
+        mock_get.side_effect = [requests.exceptions.ConnectionError("reset"), make_response(200, {"id": 1})]
+        pexels = Pexels(api_key="test-key", retry=RetryPolicy())
+
+        assert pexels.get_photo(1) == {"id": 1}
+
+    @patch('requests.Session.get')
+    def test_gives_up_after_max_attempts(self, mock_get, mock_sleep):
+        mock_get.return_value = make_response(500)
+        pexels = Pexels(api_key="test-key", retry=RetryPolicy(max_attempts=3))
+
+        with pytest.raises(PexelsAPIError, match="HTTP error 500"):
+            pexels.get_photo(1)
+
+        assert mock_get.call_count == 3
+
+    @patch('requests.Session.get')
+    def test_does_not_retry_client_errors(self, mock_get, mock_sleep):
+        mock_get.return_value = make_response(403)
+        pexels = Pexels(api_key="test-key", retry=RetryPolicy())
+
+        with pytest.raises(PexelsAPIError, match="Invalid API key"):
+            pexels.get_photo(1)
+
+        mock_get.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_honors_retry_after(self, mock_get, mock_sleep):
+        mock_get.side_effect = [make_response(429, headers={"Retry-After": "3"}), make_response(200, {"id": 1})]
+        pexels = Pexels(api_key="test-key", retry=RetryPolicy(backoff_base=0.1))
+
+        pexels.get_photo(1)
+
+        assert mock_sleep.call_args[0][0] >= 3
+
+    @patch('requests.Session.get')
+    def test_does_not_sleep_until_monthly_reset(self, mock_get, mock_sleep):
+        reset = int(time.time()) + 20 * 86400
+        mock_get.return_value = make_response(429, headers={"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": str(reset)})
+        pexels = Pexels(api_key="test-key", retry=RetryPolicy())
+
+        with pytest.raises(PexelsRateLimitError):
+            pexels.get_photo(1)
+
+        mock_get.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_no_retry_policy_fails_fast(self, mock_get, mock_sleep):
+        mock_get.return_value = make_response(503)
+        pexels = Pexels(api_key="test-key")
+
+        with pytest.raises(PexelsAPIError):
+            pexels.get_photo(1)
+
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_download_video_retries(self, mock_get, mock_sleep, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        stream = make_response(200)
+        stream.__enter__ = Mock(return_value=stream)
+        stream.__exit__ = Mock(return_value=False)
+        stream.iter_content.return_value = [b"video"]
+
+        failed = make_response(503)
+        failed.__enter__ = Mock(return_value=failed)
+        failed.__exit__ = Mock(return_value=False)
+
+        mock_get.side_effect = [failed, stream]
+        pexels = Pexels(api_key="test-key", retry=RetryPolicy())
+        video = Video(
+            id=7, width=1920, height=1080, url="", image="", duration=1,
+            user=User(id=1, name="", url=""),
+            video_files=[VideoFile(id=1, quality="hd", file_type="video/mp4", width=1920, height=1080, fps=30.0, link="https://cdn/7.mp4")],
+            video_pictures=[]
+        )
+
+        assert pexels.download_video(video, "hd") == "7_hd.mp4"
+        assert (tmp_path / "7_hd.mp4").read_bytes() == b"video"
+        assert mock_get.call_count == 2
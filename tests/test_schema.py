@@ -0,0 +1,102 @@
+import json
+import pytest
+from unittest.mock import patch, Mock
+
+pytest.importorskip("msgspec")
+
+from pypexel.pypexel import Pexels
+from pypexel.models import Photo, Video
+from pypexel.schema import decode_to_models
+from pypexel.utils import parse_photo, parse_video, parse_collection
+
+
+PHOTO = {
+    "id": 1,
+    "width": 4000,
+    "height": 3000,
+    "photographer": "Someone",
+    "src": {"original": "o.jpg", "large": "l.jpg"},
+    "liked": False,
+}
+
+VIDEO = {
+    "id": 7,
+    "duration": 12,
+    "user": {"id": 3, "name": "Someone"},
+    "video_files": [
+        {"id": 1, "quality": "hd", "file_type": "video/mp4", "width": 1920, "height": 1080, "fps": 25, "link": "hd.mp4", "size": 100},
+        {"id": 2, "quality": "hls", "file_type": "video/mp4", "width": None, "height": None, "fps": None, "link": "hls.m3u8"},
+    ],
+    "video_pictures": [{"id": 5, "picture": "p.jpg", "nr": 0}],
+}
+
+
+def body(data):
+    return json.dumps(data).encode()
+
+
+class TestDecodeToModels:
+    def test_photo_page_matches_parse_photo(self):
+        photos = decode_to_models(body({"page": 1, "photos": [PHOTO, {"id": 2}]}), "photos", json.loads)
+
+        assert photos == [parse_photo(PHOTO), parse_photo({"id": 2})]
+        assert isinstance(photos[0], Photo)
+
+    def test_video_matches_parse_video(self):
+        video = decode_to_models(body(VIDEO), "video", json.loads)
+
+        assert isinstance(video, Video)
+        assert video == parse_video(VIDEO)
+        assert video.video_files[1].width is None
+
+    def test_collections(self):
+        data = {"collections": [{"id": "abc", "title": "t", "media_count": 3}]}
+
+        assert decode_to_models(body(data), "collections", json.loads) == [parse_collection(data["collections"][0])]
+
+    def test_rejected_values_fall_back_to_dict_parsing(self):
+        loads = Mock(side_effect=json.loads)
+
+        photos = decode_to_models(body({"photos": [{"id": 1, "alt": None}]}), "photos", loads)
+
+        assert photos == [parse_photo({"id": 1, "alt": None})]
+        loads.assert_called_once()
+
+    def test_invalid_json(self):
+        with pytest.raises(ValueError):
+            decode_to_models(b"<html>", "photos", json.loads)
+
+
+class TestClientDecodeModels:
+    @patch('requests.Session.get')
+    def test_search_photos(self, mock_get):
+        response = Mock(status_code=200, headers={}, content=body({"photos": [PHOTO]}))
+        mock_get.return_value = response
+        pexels = Pexels(api_key="test-key", decode_models=True)
+
+        assert pexels.search_photos("nature", as_objects=True) == [parse_photo(PHOTO)]
+        response.json.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_response_without_bytes_body(self, mock_get):
+        response = Mock(status_code=200, headers={})
+        response.json.return_value = VIDEO
+        mock_get.return_value = response
+        pexels = Pexels(api_key="test-key", decode_models=True)
+
+        assert pexels.get_video(7, as_object=True) == parse_video(VIDEO)
+
+    @patch.object(Pexels, '_request_models')
+    @patch.object(Pexels, '_make_request')
+    def test_cache_and_lazy_use_dict_path(self, mock_request, mock_models):
+        mock_request.return_value = {"photos": [PHOTO]}
+
+        for pexels in (Pexels(api_key="test-key", decode_models=True, lazy=True), Pexels(api_key="test-key", decode_models=True, cache=Mock())):
+            pexels.search_photos("nature", as_objects=True)
+
+        mock_models.assert_not_called()
+
+    def test_requires_msgspec(self):
+        with patch("pypexel.pypexel.msgspec", None):
+            with pytest.raises(ImportError, match="msgspec"):
+                Pexels(api_key="test-key", decode_models=True)
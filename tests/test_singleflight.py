@@ -0,0 +1,84 @@
+import time
+import asyncio
+import threading
+import pytest
+
+from pypexel.singleflight import SingleFlight, AsyncSingleFlight
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_result(self):
+        flights = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def fn():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return {"value": 1}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flights.do("key", fn)))
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=lambda: results.append(flights.do("key", fn))) for _ in range(5)]
+        for thread in followers:
+            thread.start()
+        for thread in [leader] + followers:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len(results) == 6
+        assert all(result is results[0] for result in results)
+        assert len(flights) == 0
+
+    def test_errors_are_shared_and_forgotten(self):
+        flights = SingleFlight()
+
+        with pytest.raises(ValueError):
+            flights.do("key", lambda: (_ for _ in ()).throw(ValueError("boom")))
+
+        assert flights.do("key", lambda: 2) == 2
+
+    def test_different_keys_run_separately(self):
+        flights = SingleFlight()
+
+        assert flights.do("a", lambda: 1) == 1
+        assert flights.do("b", lambda: 2) == 2
+
+
+class TestAsyncSingleFlight:
+    def test_concurrent_calls_share_one_result(self):
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        async def run():
+            return await asyncio.gather(*(flights.do("key", fn) for _ in range(10)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert len(flights) == 0
+
+    def test_cancelled_waiter_does_not_cancel_others(self):
+        flights = AsyncSingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def run():
+            first = asyncio.ensure_future(flights.do("key", fn))
+            second = asyncio.ensure_future(flights.do("key", fn))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == "done"
@@ -0,0 +1,123 @@
+import os
+import threading
+
+import pytest
+
+from pypexel.pypexel import Pexels
+from pypexel.store import DownloadStore, file_digest, link_or_copy, fcntl
+
+from tests.helpers import FileSession, make_photo
+
+
+def write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return str(path)
+
+
+class TestDownloadStore:
+    def test_add_and_get(self, tmp_path):
+        store = DownloadStore(str(tmp_path / "store"))
+        data = os.urandom(100)
+
+        object_path = store.add(1, "https://cdn/1.jpg", write(tmp_path / "download", data))
+
+        assert store.get(1, "https://cdn/1.jpg") == object_path
+        assert store.get(1, "https://cdn/other.jpg") is None
+        digest = file_digest(object_path)
+        assert object_path == str(tmp_path / "store" / "objects" / digest[:2] / digest[2:4] / digest)
+        assert not (tmp_path / "download").exists()
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        store = DownloadStore(str(tmp_path / "store"))
+        data = os.urandom(100)
+
+        first = store.add(1, "https://cdn/a.jpg", write(tmp_path / "a", data))
+        second = store.add(2, "https://cdn/b.jpg", write(tmp_path / "b", data))
+
+        assert first == second
+        assert len(store) == 1
+        assert store.get(1, "https://cdn/a.jpg") == store.get(2, "https://cdn/b.jpg") == first
+
+    def test_lru_eviction(self, tmp_path):
+        store = DownloadStore(str(tmp_path / "store"), max_bytes=250)
+
+        a = store.add(1, "a", write(tmp_path / "a", os.urandom(100)))
+        store.add(2, "b", write(tmp_path / "b", os.urandom(100)))
+        store.get(1, "a")
+        store.add(3, "c", write(tmp_path / "c", os.urandom(100)))
+
+        assert store.get(1, "a") == a
+        assert store.get(2, "b") is None
+        assert store.get(3, "c") is not None
+        assert store.current_bytes == 200
+
+    def test_totals_follow_existing_index(self, tmp_path):
+        # an index created before the totals table existed
+        old = DownloadStore(str(tmp_path / "store"))
+        old.add(1, "a", write(tmp_path / "a", os.urandom(100)))
+        old._connection().execute("DROP TABLE totals")
+        old.close()
+
+        store = DownloadStore(str(tmp_path / "store"), max_bytes=250)
+        store.add(2, "b", write(tmp_path / "b", os.urandom(100)))
+        store.add(3, "c", write(tmp_path / "c", os.urandom(100)))
+
+        assert store.get(1, "a") is None
+        assert (len(store), store.current_bytes) == (2, 200)
+        store.clear()
+        assert (len(store), store.current_bytes) == (0, 0)
+
+    def test_damaged_objects_are_dropped(self, tmp_path):
+        store = DownloadStore(str(tmp_path / "store"), verify=True)
+        truncated = store.add(1, "a", write(tmp_path / "a", b"x" * 100))
+        corrupted = store.add(2, "b", write(tmp_path / "b", b"y" * 100))
+
+        write(truncated, b"x" * 10)
+        write(corrupted, b"z" * 100)
+
+        assert store.get(1, "a") is None
+        assert store.get(2, "b") is None
+        assert len(store) == 0
+
+    @pytest.mark.skipif(fcntl is None, reason="needs fcntl")
+    def test_locked_excludes_other_stores(self, tmp_path):
+        # separate stores on one root stand in for separate processes: each has its own thread locks
+        first = DownloadStore(str(tmp_path / "store"))
+        second = DownloadStore(str(tmp_path / "store"))
+        acquired = threading.Event()
+
+        def lock_second():
+            with second.locked("key"):
+                acquired.set()
+
+        with first.locked("key"):
+            thread = threading.Thread(target=lock_second)
+            thread.start()
+            assert not acquired.wait(0.2)
+        thread.join(5)
+
+        assert acquired.is_set()
+        assert len(first._locks) == len(second._locks) == 0
+
+    def test_link_or_copy(self, tmp_path):
+        source = write(tmp_path / "source", b"data")
+        destination = str(tmp_path / "destination")
+
+        assert link_or_copy(source, destination) == "link"
+        assert os.path.samefile(source, destination)
+
+
+class TestClientStore:
+    def test_repeat_downloads_skip_the_network(self, tmp_path):
+        photo = make_photo(1)
+        url = photo.src.original
+        session = FileSession({url: os.urandom(500)})
+        pexels = Pexels(api_key="test-key", session=session, store=DownloadStore(str(tmp_path / "store")))
+
+        first = pexels.download_photo(photo, path=str(tmp_path / "first.jpeg"))
+        second = pexels.download_photo(photo, path=str(tmp_path / "second.jpeg"))
+
+        assert session.urls == [url]
+        with open(first, 'rb') as f1, open(second, 'rb') as f2:
+            assert f1.read() == f2.read() == session.files[url]
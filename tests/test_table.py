@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import patch
+
+from pypexel.pypexel import Pexels
+from pypexel.table import PhotoTable, VideoTable, MISSING_COLOR, media_tables, pack_color, unpack_color
+from pypexel.utils import parse_photo, parse_video
+
+
+PHOTOS = [
+    {"id": 1, "width": 4000, "height": 3000, "photographer_id": 9, "avg_color": "#A1B2C3", "src": {"large": "l1.jpg"}},
+    {"id": 2, "width": 800, "height": 600, "avg_color": None, "alt": None},
+]
+
+
+class TestColors:
+    def test_pack_roundtrip(self):
+        assert pack_color("#A1B2C3") == 0xA1B2C3
+        assert unpack_color(0xA1B2C3) == "#A1B2C3"
+
+    @pytest.mark.parametrize("color", [None, "", "red", "#12345", "#GGGGGG"])
+    def test_invalid_colors(self, color):
+        assert pack_color(color) == MISSING_COLOR
+        assert unpack_color(MISSING_COLOR) == ""
+
+
+class TestPhotoTable:
+    def test_columns_from_dicts(self):
+        table = PhotoTable(PHOTOS)
+
+        assert len(table) == 2
+        assert list(table.column("id")) == [1, 2]
+        assert list(table.column("avg_color")) == [0xA1B2C3, MISSING_COLOR]
+        assert table.column("src_large") == ["l1.jpg", ""]
+        assert table.column("alt") == ["", ""]
+        assert table.nbytes == 2 * (8 + 4 + 4 + 8 + 4)
+
+    def test_rows_match_parsed_photos(self):
+        table = PhotoTable(PHOTOS)
+
+        assert table[0] == parse_photo(PHOTOS[0])
+        assert table[1].avg_color == ""
+
+    def test_append_models(self):
+        table = PhotoTable([parse_photo(PHOTOS[0]), parse_photo(PHOTOS[0], lazy=True)])
+
+        assert table[0] == table[1] == parse_photo(PHOTOS[0])
+
+    def test_bad_row_leaves_table_unchanged(self):
+        table = PhotoTable(PHOTOS[:1])
+
+        with pytest.raises(TypeError):
+            table.append({"id": 3, "width": "wide"})
+
+        assert {len(table.column(name)) for name in table.columns} == {1}
+
+    def test_to_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        arrays = PhotoTable(PHOTOS).to_numpy()
+
+        assert arrays["id"].dtype == numpy.int64
+        assert arrays["width"].tolist() == [4000, 800]
+        assert (arrays["avg_color"] >> 16 & 0xFF).tolist()[0] == 0xA1
+        assert arrays["src_large"].tolist() == ["l1.jpg", ""]
+
+    def test_to_arrow(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        table = PhotoTable(PHOTOS).to_arrow()
+
+        assert table.num_rows == 2
+        assert table.schema.field("avg_color").type == pyarrow.uint32()
+        assert table.column("id").to_pylist() == [1, 2]
+
+    def test_missing_optional_dependency(self):
+        with patch("pypexel.table.numpy", None):
+            with pytest.raises(ImportError, match="numpy"):
+                PhotoTable().to_numpy()
+
+
+class TestVideoTable:
+    def test_rows(self):
+        video = {"id": 7, "width": 1920, "height": 1080, "duration": 12, "user": {"id": 3, "name": "Someone"}}
+        table = VideoTable([video])
+
+        assert list(table.column("user_id")) == [3]
+        assert table[0] == parse_video(video)
+
+    def test_media_tables(self):
+        photos, videos = media_tables([{"id": 1, "type": "Photo"}, {"id": 2, "type": "Video"}])
+
+        assert list(photos.column("id")) == [1]
+        assert list(videos.column("id")) == [2]
+
+
+class TestClientTables:
+    @patch.object(Pexels, '_make_request')
+    def test_search_photos_as_table(self, mock_request):
+        mock_request.return_value = {"photos": PHOTOS}
+        pexels = Pexels(api_key="test-api-key")
+
+        table = pexels.search_photos("nature", as_table=True)
+
+        assert isinstance(table, PhotoTable)
+        assert len(table) == 2
+
+    @patch.object(Pexels, '_make_request')
+    def test_accumulate_from_iterator(self, mock_request):
+        mock_request.side_effect = [
+            {"photos": PHOTOS, "next_page": "next"},
+            {"photos": [{"id": 3}]},
+        ]
+        pexels = Pexels(api_key="test-api-key")
+
+        table = PhotoTable(pexels.iter_search_photos("nature", per_page=2))
+
+        assert list(table.column("id")) == [1, 2, 3]